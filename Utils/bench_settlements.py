@@ -0,0 +1,355 @@
+# bench_settlements.py - Бенчмарки бази населених пунктів
+#
+# 1. Час імпорту та пам'ять: Python-джерело (_add_settlement) проти скомпільованого
+#    файлу data/settlements.bin. Кожен замір - окремий чистий процес.
+# 2. Пошук за префіксом на синтетичних базах різного розміру: лінійний прохід
+#    проти PrefixIndex.
+# 3. Нечіткий пошук (FuzzyIndex) за назвами з однією помилкою; код виходу 1,
+#    якщо найповільніший запит довший за --max-fuzzy-ms.
+# 4. Найближчі населені пункти (SpatialIndex) для геолокацій поблизу записів бази.
+# 5. Пам'ять бази з індексами (колонкова таблиця SettlementTable) на реальній
+#    та синтетичних базах.
+#
+# Запуск:  python Utils/bench_settlements.py [--runs 7] [--sizes 1000,10000,30000] [--max-fuzzy-ms 1]
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import logging
+import subprocess
+from statistics import median
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+logging.basicConfig(level=logging.WARNING)
+
+# Виконується в дочірньому процесі: RSS до та після імпорту + час імпорту
+CHILD = r"""
+import sys, json, time
+sys.path.insert(0, 'Utils')
+from bench_settlements import rss_kb  # сам кладе корінь репозиторію першим у sys.path
+
+import settlements_store  # формат файлу не входить у замір
+before = rss_kb()
+start = time.perf_counter()
+import settlements_db
+settlements_db.settlements_db.load()  # база завантажується при першому зверненні
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    'import_ms': elapsed * 1000,
+    'rss_delta_kb': rss_kb() - before,
+    'rss_kb': rss_kb(),
+    'entries': len(settlements_db.settlements_db.table)
+}))
+"""
+
+
+# Виконується в дочірньому процесі: пам'ять бази з size записів (0 - реальна база)
+CHILD_MEMORY = r"""
+import gc, sys, json, tracemalloc
+sys.path.insert(0, 'Utils')
+from bench_settlements import synthetic_settlements, make_db, rss_kb
+
+size, traced = int(sys.argv[1]), sys.argv[2] == '1'
+from settlements_db import settlements_db
+settlements = synthetic_settlements(size or len(settlements_db.table))
+gc.collect()
+
+if traced:
+    tracemalloc.start()
+before = rss_kb()
+db, _ = make_db(settlements)
+gc.collect()
+base = (tracemalloc.get_traced_memory()[0] / 1024) if traced else rss_kb() - before
+db.find_settlements_fuzzy('ххх')
+db.find_nearest_settlements(50.45, 30.52)
+gc.collect()
+full = (tracemalloc.get_traced_memory()[0] / 1024) if traced else rss_kb() - before
+print(json.dumps({'entries': len(db.table), 'base_kb': base, 'full_kb': full}))
+"""
+
+
+def rss_kb() -> int:
+    """Поточний RSS процесу, КБ"""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def measure(use_compiled: bool, runs: int, bytecode_cache: bool) -> dict:
+    env = dict(os.environ, SETTLEMENTS_USE_COMPILED='1' if use_compiled else '0')
+    # Без кешу .pyc (PYTHONDONTWRITEBYTECODE, свіжий контейнер) модуль компілюється при кожному запуску
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    if not bytecode_cache:
+        env['PYTHONDONTWRITEBYTECODE'] = '1'
+        env['PYTHONPYCACHEPREFIX'] = os.path.join(ROOT, '.bench-no-pycache')
+    samples = []
+    for _ in range(runs + 1):
+        output = subprocess.run(
+            [sys.executable, '-c', CHILD], cwd=ROOT, env=env,
+            capture_output=True, text=True, check=True
+        ).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+    # Перший запуск прогріває кеш .pyc і не враховується
+    samples = samples[1:]
+    return {
+        'import_ms': median(s['import_ms'] for s in samples),
+        'rss_delta_kb': median(s['rss_delta_kb'] for s in samples),
+        'rss_kb': median(s['rss_kb'] for s in samples),
+        'entries': samples[0]['entries']
+    }
+
+
+def synthetic_settlements(count: int, seed: int = 42) -> dict:
+    """База на count записів: реальні записи + правдоподібні назви зі складених частин реальних"""
+    from settlements_db import settlements_db
+
+    rng = random.Random(seed)
+    real = list(settlements_db.iter_records())
+    names = [record[0] for record in real]
+
+    settlements = {}
+    for index in range(count):
+        if index < len(real):
+            name, lat, lon, region, settlement_type, population = real[index]
+        else:
+            head, tail = rng.choice(names), rng.choice(names)
+            name = head[:rng.randint(2, max(2, len(head) - 1))] + tail[rng.randint(1, max(1, len(tail) - 3)):]
+            _, lat, lon, region, settlement_type, _ = rng.choice(real)
+            lat, lon = lat + rng.uniform(-0.3, 0.3), lon + rng.uniform(-0.3, 0.3)
+            population = int(10 ** rng.uniform(1.5, 4))
+        settlements.setdefault(name, []).append({
+            'lat': lat, 'lon': lon, 'region': region, 'type': settlement_type, 'population': population
+        })
+    return settlements
+
+
+def linear_prefix_search(settlements: dict, prefix: str, limit: int, alternates: dict = None) -> list:
+    """Попередня реалізація find_settlements_by_prefix (повний прохід + сортування)
+
+    alternates {(назва, область): [...]} - еталон для перевірки індексу з альтернативними назвами.
+    """
+    prefix_lower = prefix.lower()
+    results = []
+    for settlement_name, settlements_list in settlements.items():
+        name_matches = settlement_name.lower().startswith(prefix_lower)
+        if not (name_matches or alternates):
+            continue
+        for settlement in settlements_list:
+            if name_matches or any(alternate.lower().startswith(prefix_lower)
+                                   for alternate in alternates[(settlement_name, settlement['region'])]):
+                results.append({
+                    'name': settlement_name,
+                    'full_name': f"{settlement_name} ({settlement['region']})",
+                    'region': settlement['region'],
+                    'lat': settlement['lat'],
+                    'lon': settlement['lon'],
+                    'type': settlement['type'],
+                    'population': settlement.get('population', 0)
+                })
+    results.sort(key=lambda x: (x['population'], x['name']), reverse=True)
+    return results[:limit]
+
+
+def make_db(settlements: dict):
+    """Екземпляр UkraineSettlementsDB з довільними даними (без завантаження файлу)"""
+    from settlements_db import UkraineSettlementsDB
+
+    db = UkraineSettlementsDB.from_records(
+        (name, settlement['lat'], settlement['lon'], settlement['region'], settlement['type'], settlement['population'])
+        for name, settlements_list in settlements.items() for settlement in settlements_list
+    )
+    start = time.perf_counter()
+    db._build_indexes()
+    return db, time.perf_counter() - start
+
+
+def time_queries(search, queries: list) -> float:
+    """Середній час одного запиту, мікросекунди"""
+    start = time.perf_counter()
+    for query in queries:
+        search(query)
+    return (time.perf_counter() - start) / len(queries) * 1e6
+
+
+def bench_prefix_search(sizes: list, limit: int = 15):
+    print(f"\n🔎 find_settlements_by_prefix (limit={limit}): typing 1-5 letters of 300 names")
+    for size in sizes:
+        settlements = synthetic_settlements(size)
+        db, build_seconds = make_db(settlements)
+
+        rng = random.Random(size)
+        names = rng.sample(list(settlements), min(300, len(settlements)))
+        queries = [name[:length] for name in names for length in range(1, 6)]
+
+        from settlements_aliases import alternate_names
+        alternates = {(name, settlement['region']): alternate_names(name, settlement['region'])
+                      for name, settlements_list in settlements.items() for settlement in settlements_list}
+        mismatches = sum(
+            linear_prefix_search(settlements, query, limit, alternates) !=
+            db.find_settlements_by_prefix(query, limit)
+            for query in queries[:200]
+        )
+        linear_us = time_queries(lambda query: linear_prefix_search(settlements, query, limit), queries)
+        indexed_us = time_queries(lambda query: db.find_settlements_by_prefix(query, limit), queries)
+
+        print(f"{size:>6} entries   linear={linear_us:9.1f} µs   index={indexed_us:7.1f} µs   "
+              f"speedup x{linear_us / indexed_us:6.1f}   build={build_seconds * 1000:6.1f} ms   "
+              f"mismatches={mismatches}")
+
+
+def bench_startup(runs: int):
+    if not os.path.exists(os.path.join(ROOT, 'data', 'settlements.bin')):
+        print("⚠️ data/settlements.bin not found - run Utils/build_settlements.py first")
+
+    print(f"🏁 import settlements_db, median of {runs} fresh processes")
+    for bytecode_cache in (False, True):
+        print(f"\n{'with' if bytecode_cache else 'without'} cached .pyc")
+        for title, use_compiled in (("python source", False), ("compiled dataset", True)):
+            result = measure(use_compiled, runs, bytecode_cache)
+            print(f"{title:<18} import={result['import_ms']:7.1f} ms   "
+                  f"rss +{result['rss_delta_kb'] / 1024:5.2f} MB   "
+                  f"total rss={result['rss_kb'] / 1024:6.1f} MB   entries={result['entries']}")
+
+
+def misspell(name: str, rng: random.Random) -> str:
+    """Одна випадкова помилка: заміна, пропуск, вставка літери або перестановка сусідніх"""
+    alphabet = 'абвгґдеєжзиіїйклмнопрстуфхцчшщьюя'
+    position = rng.randrange(len(name))
+    kind = rng.choice(('replace', 'delete', 'insert', 'swap'))
+    if kind == 'replace':
+        return name[:position] + rng.choice(alphabet) + name[position + 1:]
+    if kind == 'delete' and len(name) > 3:
+        return name[:position] + name[position + 1:]
+    if kind == 'swap' and position < len(name) - 1:
+        return name[:position] + name[position + 1] + name[position] + name[position + 2:]
+    return name[:position] + rng.choice(alphabet) + name[position:]
+
+
+def bench_fuzzy_search(sizes: list, limit: int = 10, repeats: int = 3) -> float:
+    """Повертає найбільший час одного запиту, мікросекунди"""
+    print(f"\n🧩 find_settlements_fuzzy (limit={limit}): 500 names with one typo, "
+          f"each query timed as the best of {repeats} runs (without GC and scheduler pauses)")
+    worst_us = 0.0
+    for size in sizes:
+        settlements = synthetic_settlements(size)
+        db, _ = make_db(settlements)
+
+        # Нечіткий індекс будується при першому запиті - вимірюємо окремо
+        start = time.perf_counter()
+        db.find_settlements_fuzzy('ххх')
+        build_seconds = time.perf_counter() - start
+
+        rng = random.Random(size)
+        names = rng.sample([name for name in settlements if len(name) >= 5], 500)
+        queries = [misspell(name, rng) for name in names]
+
+        latencies = []
+        found = 0
+        for name, query in zip(names, queries):
+            best = float('inf')
+            for _ in range(repeats):
+                start = time.perf_counter()
+                results = db.find_settlements_fuzzy(query, limit)
+                best = min(best, (time.perf_counter() - start) * 1e6)
+            latencies.append(best)
+            found += any(result['name'] == name for result in results[:5])
+
+        latencies.sort()
+        worst_us = max(worst_us, latencies[-1])
+        print(f"{size:>6} entries   mean={sum(latencies) / len(latencies):7.1f} µs   "
+              f"p99={latencies[int(len(latencies) * 0.99) - 1]:7.1f} µs   "
+              f"max={latencies[-1]:7.1f} µs   found in top 5={found / len(names):5.1%}   "
+              f"build={build_seconds * 1000:6.1f} ms")
+    return worst_us
+
+
+def bench_spatial_search(sizes: list, k: int = 5, radius_km: float = 10):
+    print(f"\n📍 find_nearest_settlements (k={k}) / find_settlements_within_radius ({radius_km:g} km): "
+          f"1000 points within ~10 km of a settlement")
+    from settlements_index import haversine_km
+
+    for size in sizes:
+        settlements = synthetic_settlements(size)
+        db, _ = make_db(settlements)
+
+        # Просторовий індекс будується при першому запиті - вимірюємо окремо
+        start = time.perf_counter()
+        db.find_nearest_settlements(50.45, 30.52)
+        build_seconds = time.perf_counter() - start
+
+        rng = random.Random(size)
+        records = list(db.iter_records())
+        points = []
+        for _ in range(1000):
+            _, lat, lon, _, _, _ = rng.choice(records)
+            points.append((lat + rng.uniform(-0.1, 0.1), lon + rng.uniform(-0.1, 0.1)))
+
+        # Перевірка проти повного перебору
+        mismatches = 0
+        for lat, lon in points[:50]:
+            expected = sorted(round(haversine_km(lat, lon, record[1], record[2]), 2) for record in records)[:k]
+            mismatches += expected != [result['distance_km'] for result in db.find_nearest_settlements(lat, lon, k)]
+
+        for title, search in (
+            ("nearest", lambda point: db.find_nearest_settlements(point[0], point[1], k)),
+            ("within_radius", lambda point: db.find_settlements_within_radius(point[0], point[1], radius_km))
+        ):
+            latencies = []
+            for point in points:
+                start = time.perf_counter()
+                search(point)
+                latencies.append((time.perf_counter() - start) * 1e6)
+            latencies.sort()
+            print(f"{size:>6} entries   {title:<13} mean={sum(latencies) / len(latencies):7.1f} µs   "
+                  f"p99={latencies[int(len(latencies) * 0.99) - 1]:7.1f} µs")
+        print(f"{'':>6}           build={build_seconds * 1000:6.1f} ms   mismatches={mismatches}")
+
+
+def bench_memory(sizes: list):
+    print("\n🧠 database + indexes memory (prefix/lookup built at load; fuzzy/spatial on first use)")
+    for size in [0] + sizes:
+        result = {}
+        for traced in (False, True):
+            output = subprocess.run(
+                [sys.executable, '-c', CHILD_MEMORY, str(size), '1' if traced else '0'],
+                cwd=ROOT, capture_output=True, text=True, check=True
+            ).stdout
+            result[traced] = json.loads(output.strip().splitlines()[-1])
+        label = "real" if size == 0 else "synthetic"
+        print(f"{result[False]['entries']:>6} entries ({label:<9})   "
+              f"rss +{result[False]['base_kb'] / 1024:6.2f} MB (+{result[False]['full_kb'] / 1024:6.2f} MB all indexes)   "
+              f"python heap {result[True]['base_kb'] / 1024:6.2f} MB ({result[True]['full_kb'] / 1024:6.2f} MB)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Settlements DB benchmarks")
+    parser.add_argument('--runs', type=int, default=7)
+    parser.add_argument('--sizes', default='1000,10000,30000', help="synthetic database sizes")
+    parser.add_argument('--max-fuzzy-ms', type=float, default=1.0, help="fail if a fuzzy lookup takes longer")
+    args = parser.parse_args()
+
+    bench_startup(args.runs)
+    sizes = [int(size) for size in args.sizes.split(',')]
+    bench_prefix_search(sizes)
+    fuzzy_worst_us = bench_fuzzy_search(sizes)
+    bench_spatial_search(sizes)
+    bench_memory(sizes)
+
+    if fuzzy_worst_us > args.max_fuzzy_ms * 1000:
+        print(f"❌ slowest fuzzy lookup {fuzzy_worst_us / 1000:.2f} ms > {args.max_fuzzy_ms:g} ms")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
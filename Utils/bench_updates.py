@@ -0,0 +1,209 @@
+# bench_updates.py - Навантажувальний тест обробки оновлень: N чатів одночасно
+#
+# Справжній Application з обробниками бота; Telegram Bot API імітується в
+# процесі (FakeTelegram, фіксована затримка відповіді), Open-Meteo - локальним
+# stub-сервером з bench_weather. Кожен чат надсилає три оновлення поспіль:
+#   "📅 Прогноз на 3 дні" -> частина назви -> кнопка першого результату
+# Діалог коректний, лише якщо оновлення чату оброблено по черзі: результати
+# пошуку показані з кнопками прогнозу і прогноз надіслано. Три режими:
+#   sequential       - типова послідовна обробка PTB;
+#   unordered        - concurrent_updates(N) без впорядкування в межах чату;
+#   per-chat ordered - ChatOrderedUpdateProcessor(N) (як у bot.py та main.py).
+#
+# Запуск:  python Utils/bench_updates.py [--chats 100] [--concurrency 32]
+#                                        [--telegram-delay 0.05] [--weather-delay 0.2]
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import itertools
+import logging
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('TELEGRAM_TOKEN', '1:bench')
+
+from telegram import Update
+from telegram.ext import Application, CallbackQueryHandler, MessageHandler, TypeHandler, filters
+from telegram.request import BaseRequest
+
+from bench_weather import StubServer, make_api, percentile
+
+import bot
+from update_processor import ChatOrderedUpdateProcessor
+
+logging.basicConfig(level=logging.WARNING)
+logging.getLogger().setLevel(logging.WARNING)
+
+BOT_USER = {'id': 1, 'is_bot': True, 'first_name': 'Bench', 'username': 'bench_bot'}
+
+
+class FakeTelegram(BaseRequest):
+    """Bot API у процесі: відповідає на виклики із затримкою і запам'ятовує надіслане по чатах"""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.sent = {}
+        self._message_ids = itertools.count(1000)
+
+    async def initialize(self):
+        pass
+
+    async def shutdown(self):
+        pass
+
+    async def do_request(self, url, method, request_data=None, read_timeout=None, write_timeout=None,
+                         connect_timeout=None, pool_timeout=None):
+        endpoint = url.rsplit('/', 1)[-1]
+        params = request_data.parameters if request_data else {}
+        if endpoint == 'getMe':
+            return 200, json.dumps({'ok': True, 'result': BOT_USER}).encode()
+        if endpoint in ('getUpdates', 'deleteWebhook', 'setWebhook'):
+            return 200, json.dumps({'ok': True, 'result': [] if endpoint == 'getUpdates' else True}).encode()
+
+        await asyncio.sleep(self.delay)
+        if 'chat_id' in params:
+            chat_id = int(params['chat_id'])
+        else:
+            chat_id = int(str(params.get('callback_query_id', 'cb-0')).split('-')[1])
+        self.sent.setdefault(chat_id, []).append((endpoint, json.dumps(params, ensure_ascii=False)))
+
+        if endpoint in ('sendMessage', 'editMessageText'):
+            result = {
+                'message_id': next(self._message_ids), 'date': int(time.time()),
+                'chat': {'id': chat_id, 'type': 'private'}, 'from': BOT_USER, 'text': params.get('text', '')
+            }
+        else:
+            result = True
+        return 200, json.dumps({'ok': True, 'result': result}).encode()
+
+
+def pick_queries(chats: int) -> list:
+    """Частини назв, за якими знаходиться кілька населених пунктів (щоб показався вибір)"""
+    queries = []
+    for name in bot.settlements_db.settlements:
+        query = name[:4]
+        if len(query) < 4 or query in queries:
+            continue
+        if 2 <= len(bot.settlements_db.find_settlements_by_prefix(query, limit=20)):
+            queries.append(query)
+            if len(queries) == chats:
+                return queries
+    raise SystemExit(f"only {len(queries)} distinct queries in the database")
+
+
+def chat_updates(chat_id: int, query: str, update_ids) -> list:
+    user = {'id': chat_id, 'is_bot': False, 'first_name': f'Chat{chat_id}'}
+    chat = {'id': chat_id, 'type': 'private'}
+
+    def message(text):
+        return {'update_id': next(update_ids),
+                'message': {'message_id': next(update_ids), 'date': int(time.time()), 'chat': chat, 'from': user,
+                            'text': text}}
+
+    callback = {'update_id': next(update_ids),
+                'callback_query': {'id': f'cb-{chat_id}', 'from': user, 'chat_instance': 'bench', 'data': 'forecast_1',
+                                   'message': {'message_id': 1, 'date': int(time.time()), 'chat': chat,
+                                               'from': BOT_USER, 'text': 'results'}}}
+    return [message("📅 Прогноз на 3 дні"), message(query), callback]
+
+
+def flow_completed(sent: list) -> bool:
+    """Пошук виконано в режимі прогнозу і прогноз для обраного результату надіслано"""
+    payloads = [payload for _, payload in sent]
+    return any('forecast_1' in payload for payload in payloads) and any('Оберіть дію' in payload for payload in payloads)
+
+
+async def run_mode(concurrent_updates, queries: list, telegram_delay: float, weather_url: str) -> dict:
+    # Свіжий кеш погоди для кожного режиму - усі режими роблять однакові запити до stub-сервера
+    bot.weather_api = make_api(weather_url)
+    telegram = FakeTelegram(telegram_delay)
+    application = (
+        Application.builder().token(os.environ['TELEGRAM_TOKEN'])
+        .request(telegram).get_updates_request(FakeTelegram(0))
+        .updater(None)
+        .concurrent_updates(concurrent_updates)
+        .build()
+    )
+    application.add_handler(MessageHandler(filters.TEXT & filters.Regex(r'^(🌤|📅|🔍|🏙|⭐️|📊|❓|↩️)'),
+                                           bot.handle_menu_button))
+    application.add_handler(CallbackQueryHandler(bot.button_handler))
+    application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, bot.handle_message))
+    application.add_error_handler(bot.error_handler)
+
+    update_ids = itertools.count(1)
+    flows = [chat_updates(100000 + index, query, update_ids) for index, query in enumerate(queries)]
+    total = sum(len(flow) for flow in flows)
+    finished = {}
+    done = asyncio.Event()
+
+    async def count(update, context):
+        finished[update.effective_chat.id] = time.perf_counter()
+        count.processed += 1
+        if count.processed == total:
+            done.set()
+    count.processed = 0
+    application.add_handler(TypeHandler(Update, count), group=1)
+
+    await application.initialize()
+    await application.start()
+    started = time.perf_counter()
+    # Оновлення кожного чату приходять поспіль (швидкі натискання), чати - один за одним
+    for flow in flows:
+        for data in flow:
+            await application.update_queue.put(Update.de_json(data, application.bot))
+    try:
+        await asyncio.wait_for(done.wait(), timeout=120)
+    except asyncio.TimeoutError:
+        print(f"⚠️ only {count.processed}/{total} updates processed in 120 s")
+    elapsed = time.perf_counter() - started
+    await application.stop()
+    await application.shutdown()
+    await bot.weather_api.close()
+
+    chat_latencies = [finished_at - started for finished_at in finished.values()]
+    return {
+        'updates_per_second': count.processed / elapsed,
+        'elapsed': elapsed,
+        'p50': percentile(chat_latencies, 50),
+        'p99': percentile(chat_latencies, 99),
+        'correct': sum(1 for chat_id in finished if flow_completed(telegram.sent.get(chat_id, [])))
+    }
+
+
+async def bench(args) -> bool:
+    await bot.work_pool.run(bot.settlements_db.load)
+    queries = pick_queries(args.chats)
+    weather_url = StubServer(args.weather_delay).start()
+
+    print(f"💬 {args.chats} chats x 3 updates, Telegram API {args.telegram_delay * 1000:.0f} ms, "
+          f"Open-Meteo {args.weather_delay * 1000:.0f} ms")
+    ordered_ok = True
+    for title, processor in (
+        ("sequential", False),
+        ("unordered", args.concurrency),
+        ("per-chat ordered", ChatOrderedUpdateProcessor(args.concurrency)),
+    ):
+        result = await run_mode(processor, queries, args.telegram_delay, weather_url)
+        print(f"  {title:<17} {result['updates_per_second']:7.1f} updates/s   "
+              f"total={result['elapsed']:6.2f} s   chat done p50={result['p50']:6.2f} s "
+              f"p99={result['p99']:6.2f} s   correct flows={result['correct']}/{args.chats}")
+        if isinstance(processor, ChatOrderedUpdateProcessor):
+            ordered_ok = result['correct'] == args.chats
+    return ordered_ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Concurrent update processing load test")
+    parser.add_argument('--chats', type=int, default=100)
+    parser.add_argument('--concurrency', type=int, default=int(os.getenv('UPDATE_CONCURRENCY', 32)))
+    parser.add_argument('--telegram-delay', type=float, default=0.05, help="Bot API latency, seconds")
+    parser.add_argument('--weather-delay', type=float, default=0.2, help="upstream latency, seconds")
+    args = parser.parse_args()
+    # Код виходу 1, якщо хоч один діалог зламався при впорядкованій паралельній обробці
+    return 0 if asyncio.run(bench(args)) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,182 @@
+# bench_weather.py - Бенчмарк шару погоди проти локального stub-сервера
+#
+# Запуск:  python Utils/bench_weather.py [--users 50] [--delay 0.2]
+import os
+import sys
+import time
+import asyncio
+import argparse
+import threading
+import logging
+
+from aiohttp import web
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from weather_api import WeatherAPI
+
+logging.basicConfig(level=logging.WARNING)
+
+
+def make_open_meteo_payload(days: int) -> dict:
+    """Мінімальна відповідь Open-Meteo, достатня для форматування"""
+    hours = days * 24
+    return {
+        'current': {
+            'temperature_2m': 12.3, 'relative_humidity_2m': 70, 'apparent_temperature': 11.0,
+            'precipitation': 0.0, 'weather_code': 2, 'pressure_msl': 1015.0,
+            'wind_speed_10m': 4.2, 'wind_direction_10m': 250, 'wind_gusts_10m': 7.5,
+            'cloud_cover': 40
+        },
+        'hourly': {
+            'time': [f"2026-01-{1 + h // 24:02d}T{h % 24:02d}:00" for h in range(hours)],
+            'temperature_2m': [10.0] * hours,
+            'precipitation_probability': [10] * hours,
+            'precipitation': [0.0] * hours,
+            'weather_code': [2] * hours,
+            'wind_speed_10m': [4.0] * hours,
+            'wind_direction_10m': [250] * hours,
+            'cloud_cover': [40] * hours,
+            'relative_humidity_2m': [70] * hours
+        },
+        'daily': {
+            'time': [f"2026-01-{1 + d:02d}" for d in range(days)],
+            'temperature_2m_max': [14.0] * days,
+            'temperature_2m_min': [6.0] * days,
+            'precipitation_sum': [0.0] * days,
+            'precipitation_hours': [0] * days,
+            'weather_code': [2] * days,
+            'sunrise': [f"2026-01-{1 + d:02d}T07:30" for d in range(days)],
+            'sunset': [f"2026-01-{1 + d:02d}T16:10" for d in range(days)],
+            'wind_speed_10m_max': [6.0] * days,
+            'wind_gusts_10m_max': [9.0] * days,
+            'wind_direction_10m_dominant': [250] * days,
+            'cloud_cover_mean': [45] * days
+        }
+    }
+
+
+class StubServer:
+    """Локальний stub Open-Meteo з фіксованою затримкою у окремому потоці"""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.requests = 0
+        self.port = None
+        self._ready = threading.Event()
+
+    async def _forecast(self, request):
+        self.requests += 1
+        await asyncio.sleep(self.delay)
+        days = int(request.query.get('forecast_days', 3))
+        points = request.query.get('latitude', '').count(',') + 1
+        if points > 1:
+            # Пакетний запит: список результатів, по одному на точку
+            return web.json_response([make_open_meteo_payload(days) for _ in range(points)])
+        return web.json_response(make_open_meteo_payload(days))
+
+    def _run(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        app = web.Application()
+        app.router.add_get('/v1/forecast', self._forecast)
+        runner = web.AppRunner(app)
+        loop.run_until_complete(runner.setup())
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        loop.run_until_complete(site.start())
+        self.port = site._server.sockets[0].getsockname()[1]
+        self._ready.set()
+        loop.run_forever()
+
+    def start(self) -> str:
+        threading.Thread(target=self._run, daemon=True).start()
+        self._ready.wait()
+        return f"http://127.0.0.1:{self.port}/v1/forecast"
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def make_api(url: str) -> WeatherAPI:
+    api = WeatherAPI()
+    api.open_meteo_url = url
+    api.openweathermap_key = None
+    return api
+
+
+async def run_handlers(api: WeatherAPI, users: int, use_async: bool) -> list:
+    """Імітація users одночасних обробників process_current_weather"""
+
+    # Усі оновлення надходять одночасно, латентність рахуємо від моменту надходження
+    arrived = time.perf_counter()
+
+    async def handler(index: int) -> float:
+        # Кожен користувач запитує власне місто
+        lat, lon = 48.0 + index * 0.37, 30.0 + index * 0.41
+        if use_async:
+            data = await api.get_weather_async(lat, lon, forecast_days=1)
+        else:
+            data = api.get_weather(lat, lon, forecast_days=1)
+        api.format_current_weather("Бенчмарк", "Тестова", data)
+        return time.perf_counter() - arrived
+
+    latencies = await asyncio.gather(*(handler(i) for i in range(users)))
+    await api.close()
+    return list(latencies)
+
+
+def report(title: str, latencies: list):
+    print(f"{title:<28} p50={percentile(latencies, 50) * 1000:8.1f} ms   "
+          f"p99={percentile(latencies, 99) * 1000:8.1f} ms   "
+          f"max={max(latencies) * 1000:8.1f} ms")
+
+
+def bench_handler_latency(users: int, delay: float):
+    server = StubServer(delay)
+    url = server.start()
+
+    print(f"👥 {users} concurrent users, upstream delay {delay * 1000:.0f} ms")
+    sync_latencies = asyncio.run(run_handlers(make_api(url), users, use_async=False))
+    report("sync requests.get in loop", sync_latencies)
+    async_latencies = asyncio.run(run_handlers(make_api(url), users, use_async=True))
+    report("async aiohttp (pooled)", async_latencies)
+
+
+async def run_sessions(api: WeatherAPI, sessions: int):
+    """Типові сесії: поточна погода -> прогноз на 3 дні -> оновлення -> поточна погода"""
+    for index in range(sessions):
+        lat, lon = 46.0 + index * 0.29, 23.0 + index * 0.53
+        await api.get_weather_async(lat, lon, forecast_days=1)
+        await api.get_weather_async(lat, lon, forecast_days=3)
+        await api.get_weather_async(lat, lon, forecast_days=1)
+        await api.get_weather_async(lat, lon, forecast_days=1)
+    await api.close()
+
+
+def bench_session_upstream_calls(sessions: int):
+    print(f"\n🧾 {sessions} sessions: current -> 3-day forecast -> refresh -> current")
+    for title, fetch_days in (("per-view horizon", 1), ("widest horizon (3 days)", 3)):
+        server = StubServer(0.0)
+        api = make_api(server.start())
+        api.fetch_forecast_days = fetch_days
+        asyncio.run(run_sessions(api, sessions))
+        print(f"{title:<28} upstream calls={server.requests:4d}   "
+              f"per session={server.requests / sessions:.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Weather layer benchmarks")
+    parser.add_argument('--users', type=int, default=50)
+    parser.add_argument('--delay', type=float, default=0.2, help="upstream latency, seconds")
+    parser.add_argument('--sessions', type=int, default=100)
+    args = parser.parse_args()
+
+    bench_handler_latency(args.users, args.delay)
+    bench_session_upstream_calls(args.sessions)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,160 @@
+# bench_workers.py - Пам'ять кількох воркерів з базою населених пунктів на одному хості
+#
+# Координатор (чистий процес) імпортує settlements_db і запускає N воркерів
+# через fork; кожен воркер завантажує базу, виконує кілька пошуків і повідомляє
+# свою пам'ять з /proc/self/smaps_rollup, поки живі всі воркери. Два режими:
+#   process memory - кожен воркер будує власні колонки та індекси;
+#   mmap snapshot  - воркери відображають один файл-знімок (SETTLEMENTS_MMAP=1).
+# "per extra worker" - приріст сумарного PSS (фізичної пам'яті всіх воркерів)
+# на кожного наступного воркера; heap - приватні змінені сторінки воркера.
+# Рядок "no database" - той самий воркер без бази (власна пам'ять інтерпретатора після fork).
+#
+# Запуск:  python Utils/bench_workers.py [--workers 4] [--sizes 0,30000] [--max-extra-mb 8]
+#          (--max-extra-mb: код виходу 1, якщо в режимі mmap приріст на воркера більший)
+import os
+import sys
+import json
+import shutil
+import argparse
+import tempfile
+import subprocess
+
+from bench_settlements import ROOT, synthetic_settlements
+
+from settlements_store import DEFAULT_DATASET_PATH, write_dataset
+
+# Виконується в окремому процесі: fork воркерів, результати - JSON-список у stdout
+COORDINATOR = r"""
+import os, sys, json, time, multiprocessing
+sys.path.insert(0, os.getcwd())
+from settlements_db import settlements_db  # імпорт до fork, база ще не завантажена
+
+def memory_kb():
+    fields = {}
+    try:
+        with open('/proc/self/smaps_rollup') as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) == 3 and parts[2] == 'kB':
+                    fields[parts[0].rstrip(':')] = int(parts[1])
+    except OSError:
+        import resource
+        fields['Rss'] = fields['Pss'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {'rss_kb': fields.get('Rss', 0), 'pss_kb': fields.get('Pss', 0),
+            'heap_kb': fields.get('Private_Dirty', 0)}
+
+def worker(barrier, results):
+    if not load:
+        barrier.wait()
+        results.put(dict(memory_kb(), load_ms=0, snapshot=False))
+        barrier.wait()
+        return
+    start = time.perf_counter()
+    db = settlements_db.load()
+    load_ms = (time.perf_counter() - start) * 1000
+    for prefix in ('Ки', 'Льв', 'Од', 'Хар', 'Дн', 'Pol', 'Ж'):
+        db.find_settlements_by_prefix(prefix, 10)
+    for lat, lon in ((50.45, 30.52), (49.84, 24.03), (46.48, 30.72), (48.46, 35.04)):
+        db.find_nearest_settlements(lat, lon, 5)
+        db.find_settlements_within_radius(lat, lon, 20)
+    db.get_statistics()
+    # Пам'ять міряється, коли живі всі воркери - спільні сторінки діляться між ними
+    barrier.wait()
+    results.put(dict(memory_kb(), load_ms=load_ms, snapshot=db.snapshot_path is not None))
+    barrier.wait()
+
+workers, load = int(sys.argv[1]), sys.argv[2] == '1'
+context = multiprocessing.get_context('fork')
+barrier, results = context.Barrier(workers), context.Queue()
+processes = [context.Process(target=worker, args=(barrier, results)) for _ in range(workers)]
+for process in processes:
+    process.start()
+samples = [results.get() for _ in processes]
+for process in processes:
+    process.join()
+print(json.dumps(samples))
+"""
+
+# Знімок записує окремий процес (як перший воркер після деплою), щоб воркери лише відображали його
+BUILD_SNAPSHOT = "from settlements_db import UkraineSettlementsDB; UkraineSettlementsDB()"
+
+
+def run_workers(workers: int, env: dict, load: bool = True) -> list:
+    output = subprocess.run(
+        [sys.executable, '-c', COORDINATOR, str(workers), '1' if load else '0'], cwd=ROOT, env=env,
+        capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def dataset_for_size(size: int, directory: str) -> str:
+    """Файл бази на size записів (0 - реальна база з репозиторію)"""
+    if not size:
+        return DEFAULT_DATASET_PATH
+    path = os.path.join(directory, f"settlements-{size}.bin")
+    records = [
+        (name, settlement['lat'], settlement['lon'], settlement['region'], settlement['type'], settlement['population'])
+        for name, settlements_list in synthetic_settlements(size).items() for settlement in settlements_list
+    ]
+    write_dataset(records, path, bytes(32))
+    return path
+
+
+def bench_size(size: int, workers: int, directory: str) -> float:
+    """Таблиця для одного розміру бази; повертає приріст PSS на воркера в режимі mmap, МБ"""
+    dataset = dataset_for_size(size, directory)
+    base_env = dict(os.environ, SETTLEMENTS_DATASET=dataset, SETTLEMENTS_SNAPSHOT_DIR=directory)
+    base_env.pop('SETTLEMENTS_USE_COMPILED', None)
+
+    mmap_extra_mb = 0.0
+    for title, mode in (("no database", None), ("process memory", '0'), ("mmap snapshot", '1')):
+        env = dict(base_env, SETTLEMENTS_MMAP=mode or '0')
+        if mode == '1':
+            subprocess.run([sys.executable, '-c', BUILD_SNAPSHOT], cwd=ROOT, env=env,
+                           capture_output=True, check=True)
+
+        single = run_workers(1, env, load=mode is not None)
+        samples = run_workers(workers, env, load=mode is not None)
+        total_pss = sum(sample['pss_kb'] for sample in samples)
+        extra_mb = (total_pss - single[0]['pss_kb']) / max(1, workers - 1) / 1024
+        if mode == '1':
+            mmap_extra_mb = extra_mb
+            if not all(sample['snapshot'] for sample in samples):
+                print("⚠️ some workers did not map the snapshot")
+
+        def mean(key):
+            return sum(sample[key] for sample in samples) / len(samples)
+
+        print(f"  {title:<15} rss/worker={mean('rss_kb') / 1024:6.1f} MB   "
+              f"heap/worker={mean('heap_kb') / 1024:6.1f} MB   "
+              f"pss total={total_pss / 1024:6.1f} MB   per extra worker={extra_mb:6.2f} MB   "
+              f"load={mean('load_ms'):6.1f} ms")
+    return mmap_extra_mb
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Memory of forked bot workers sharing the settlements database")
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--sizes', default='0,30000', help="database sizes (0 - real dataset)")
+    parser.add_argument('--max-extra-mb', type=float, help="fail if a mapped worker adds more than this")
+    args = parser.parse_args()
+
+    if not os.path.exists('/proc/self/smaps_rollup'):
+        print("⚠️ /proc/self/smaps_rollup not available - PSS is approximated by max RSS")
+
+    failed = False
+    directory = tempfile.mkdtemp(prefix='settlements-workers-')
+    try:
+        for size in (int(size) for size in args.sizes.split(',')):
+            print(f"\n👷 {args.workers} forked workers, {'real' if not size else size} entries")
+            extra_mb = bench_size(size, args.workers, directory)
+            if args.max_extra_mb is not None and extra_mb > args.max_extra_mb:
+                print(f"❌ mmap worker adds {extra_mb:.2f} MB > {args.max_extra_mb:g} MB")
+                failed = True
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
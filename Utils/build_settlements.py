@@ -0,0 +1,52 @@
+# build_settlements.py - Компіляція бази населених пунктів у бінарний файл
+#
+# Запуск після кожної зміни викликів _add_settlement у settlements_source.py:
+#   python Utils/build_settlements.py [--output data/settlements.bin] [--versioned]
+#
+# --versioned додатково зберігає копію data/settlements-<версія>.bin (версія - хеш
+# вмісту), яку можна підхопити без перезапуску: /reload settlements-<версія>.bin
+# або kill -HUP після заміни файлу, на який вказує SETTLEMENTS_DATASET.
+import os
+import sys
+import argparse
+import logging
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from settlements_db import UkraineSettlementsDB
+from settlements_store import DEFAULT_DATASET_PATH, load_dataset, source_hash, write_dataset
+
+logging.basicConfig(level=logging.WARNING)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile settlements_source.py into a binary dataset")
+    parser.add_argument('--output', default=DEFAULT_DATASET_PATH)
+    parser.add_argument('--versioned', action='store_true', help="also write a copy named after the content hash")
+    args = parser.parse_args()
+
+    # Джерело - завжди Python-код, а не попередньо скомпільований файл
+    db = UkraineSettlementsDB(use_compiled=False)
+    records = list(db.iter_records())
+    digest = source_hash()
+
+    count = write_dataset(records, args.output, digest)
+
+    # Перевіряємо, що файл читається назад без втрат
+    version, loaded = load_dataset(args.output, expected_hash=digest)
+    if loaded != records:
+        print(f"❌ {args.output}: round-trip check failed")
+        sys.exit(1)
+
+    print(f"✅ {count} records ({len(db.settlements)} names) -> {args.output} "
+          f"({os.path.getsize(args.output) / 1024:.1f} KB, version {version})")
+
+    if args.versioned:
+        base, extension = os.path.splitext(args.output)
+        versioned_path = f"{base}-{version}{extension}"
+        write_dataset(records, versioned_path, digest)
+        print(f"✅ versioned copy -> {versioned_path}")
+
+
+if __name__ == '__main__':
+    main()
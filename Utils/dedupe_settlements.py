@@ -0,0 +1,188 @@
+# dedupe_settlements.py - Пошук і видалення дублікатів у джерелі бази населених пунктів
+#
+# Бібліотека та консольний режим для Utils/dublikat.py (без Tk, придатний для CI).
+# Файл читається один раз; дублікат - запис, у якого збігаються обрані поля
+# з одним із попередніх записів, а координати відрізняються не більше ніж на
+# tolerance градусів. Для координат використовується сітка з кроком tolerance:
+# запис порівнюється лише із записами своєї та 8 сусідніх клітинок, тож пари
+# на межі клітинок не пропускаються, а час роботи лінійний.
+#
+# Запуск:
+#   python Utils/dedupe_settlements.py [settlements_source.py] [--tolerance 0.0001]
+#       [--no-name] [--no-region] [--no-coordinates] [--population]
+#       [--report report.json | --report -] [--output cleaned.py] [--check]
+import os
+import re
+import sys
+import json
+import math
+import time
+import argparse
+from typing import Dict, Iterable, List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_SOURCE = os.path.join(ROOT, 'settlements_source.py')
+
+SETTLEMENT_PATTERN = re.compile(
+    r'self\._add_settlement\("([^"]+)",\s*([\d.]+),\s*([\d.]+),\s*"([^"]+)",\s*"([^"]+)",\s*(\d+)'
+)
+
+
+def parse_source(lines: Iterable[str]) -> List[dict]:
+    """Записи _add_settlement з рядків файлу (line_num - номер рядка з 1)"""
+    settlements = []
+    for i, line in enumerate(lines):
+        match = SETTLEMENT_PATTERN.search(line)
+        if match:
+            settlements.append({
+                "line_num": i + 1,
+                "name": match.group(1),
+                "lat": float(match.group(2)),
+                "lon": float(match.group(3)),
+                "region": match.group(4),
+                "type": match.group(5),
+                "population": int(match.group(6)),
+                "line_text": line.strip()
+            })
+    return settlements
+
+
+def find_duplicates(settlements: List[dict], compare_name: bool = True, compare_region: bool = True,
+                    compare_coordinates: bool = True, compare_population: bool = False,
+                    tolerance: float = 0.0001) -> List[dict]:
+    """Дублікати у порядку файлу; кожен посилається на перший (оригінальний) запис, що залишиться
+
+    Оригінали - лише записи, які самі не є дублікатами: для ланцюжка A ~ B ~ C,
+    де C далі від A, ніж tolerance, видаляється тільки B.
+    """
+    # (поля, що порівнюються точно, клітинка сітки) -> оригінали
+    seen: Dict[tuple, List[dict]] = {}
+    use_grid = compare_coordinates and tolerance > 0
+    neighbours = [(d_lat, d_lon) for d_lat in (-1, 0, 1) for d_lon in (-1, 0, 1)] if use_grid else [(0, 0)]
+
+    duplicates = []
+    for settlement in settlements:
+        key = (
+            settlement["name"] if compare_name else None,
+            settlement["region"] if compare_region else None,
+            settlement["population"] if compare_population else None
+        )
+        if use_grid:
+            cell = (math.floor(settlement["lat"] / tolerance), math.floor(settlement["lon"] / tolerance))
+        elif compare_coordinates:
+            cell = (settlement["lat"], settlement["lon"])
+        else:
+            cell = (0, 0)
+
+        original = _find_original(seen, key, cell, neighbours, settlement, tolerance if use_grid else None)
+        if original is None:
+            seen.setdefault((key, cell), []).append(settlement)
+        else:
+            duplicate = dict(settlement)
+            duplicate["original_line"] = original["line_num"]
+            duplicate["original_data"] = original
+            duplicates.append(duplicate)
+
+    return duplicates
+
+
+def _find_original(seen: Dict[tuple, List[dict]], key: tuple, cell: tuple, neighbours: List[Tuple[int, int]],
+                   settlement: dict, tolerance: Optional[float]) -> Optional[dict]:
+    """Найраніший оригінал у своїй або сусідніх клітинках, що збігається з settlement"""
+    best = None
+    for d_lat, d_lon in neighbours:
+        candidates = seen.get((key, (cell[0] + d_lat, cell[1] + d_lon)))
+        if not candidates:
+            continue
+        for candidate in candidates:
+            if best is not None and candidate["line_num"] > best["line_num"]:
+                break
+            if tolerance is None or (abs(candidate["lat"] - settlement["lat"]) <= tolerance and
+                                     abs(candidate["lon"] - settlement["lon"]) <= tolerance):
+                best = candidate
+                break
+    return best
+
+
+def remove_lines(lines: List[str], duplicates: List[dict]) -> List[str]:
+    """Рядки файлу без рядків дублікатів"""
+    lines_to_remove = {dup["line_num"] - 1 for dup in duplicates}
+    return [line for i, line in enumerate(lines) if i not in lines_to_remove]
+
+
+def build_report(source: str, settlements: List[dict], duplicates: List[dict], criteria: dict,
+                 elapsed: float) -> dict:
+    """Машиночитний звіт (JSON)"""
+    return {
+        "source": source,
+        "criteria": criteria,
+        "total_records": len(settlements),
+        "duplicates_count": len(duplicates),
+        "unique_count": len(settlements) - len(duplicates),
+        "elapsed_ms": round(elapsed * 1000, 1),
+        "duplicates": [{
+            "line": dup["line_num"],
+            "original_line": dup["original_line"],
+            "name": dup["name"],
+            "region": dup["region"],
+            "type": dup["type"],
+            "lat": dup["lat"],
+            "lon": dup["lon"],
+            "population": dup["population"]
+        } for dup in duplicates]
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Find and remove duplicate settlements in a settlements source file")
+    parser.add_argument('source', nargs='?', default=DEFAULT_SOURCE)
+    parser.add_argument('--tolerance', type=float, default=0.0001, help="coordinate tolerance, degrees")
+    parser.add_argument('--no-name', action='store_true', help="do not compare names")
+    parser.add_argument('--no-region', action='store_true', help="do not compare regions")
+    parser.add_argument('--no-coordinates', action='store_true', help="do not compare coordinates")
+    parser.add_argument('--population', action='store_true', help="also compare population")
+    parser.add_argument('--report', help="write JSON report to this path ('-' for stdout)")
+    parser.add_argument('--output', help="write the source without duplicate lines to this path")
+    parser.add_argument('--check', action='store_true', help="exit with code 1 if duplicates are found")
+    args = parser.parse_args(argv)
+
+    criteria = {
+        "compare_name": not args.no_name,
+        "compare_region": not args.no_region,
+        "compare_coordinates": not args.no_coordinates,
+        "compare_population": args.population,
+        "tolerance": args.tolerance
+    }
+
+    start = time.perf_counter()
+    with open(args.source, 'r', encoding='utf-8') as f:
+        lines = f.readlines()
+    settlements = parse_source(lines)
+    duplicates = find_duplicates(settlements, **criteria)
+    elapsed = time.perf_counter() - start
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.writelines(remove_lines(lines, duplicates))
+
+    report = build_report(args.source, settlements, duplicates, criteria, elapsed)
+    if args.report == '-':
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        if args.report:
+            with open(args.report, 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"{'❌' if duplicates else '✅'} {len(settlements)} records, {len(duplicates)} duplicates "
+              f"({elapsed * 1000:.0f} ms)", file=sys.stderr)
+        for dup in duplicates[:20]:
+            print(f"  line {dup['line_num']}: {dup['name']} ({dup['region']}) "
+                  f"duplicates line {dup['original_line']}", file=sys.stderr)
+        if len(duplicates) > 20:
+            print(f"  ... and {len(duplicates) - 20} more", file=sys.stderr)
+
+    return 1 if args.check and duplicates else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,10 +1,22 @@
-import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, scrolledtext
-import re
+# dublikat.py - Очищувач дублікатів у джерелі бази населених пунктів (Tk GUI)
+#
+# Без аргументів відкриває вікно; з аргументами (або без Tk/дисплея) працює
+# як консольна утиліта Utils/dedupe_settlements.py, напр. у CI:
+#   python Utils/dublikat.py settlements_source.py --report report.json --check
 import os
+import sys
 from datetime import datetime
 import shutil
-import hashlib
+
+try:
+    import tkinter as tk
+    from tkinter import ttk, filedialog, messagebox, scrolledtext
+except ImportError:  # Python без Tk (slim Docker-образ, CI)
+    tk = None
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import dedupe_settlements
 
 class AdvancedDuplicateRemover:
     def __init__(self, root):
@@ -161,8 +173,8 @@ class AdvancedDuplicateRemover:
             return
             
         try:
-            self.duplicates = self.find_duplicates()
             self.lines_data = self.extract_all_settlements()
+            self.duplicates = self.find_duplicates()
             self.display_duplicates()
             self.update_stats()
             
@@ -182,92 +194,19 @@ class AdvancedDuplicateRemover:
     
     def find_duplicates(self):
         """Знаходить дублікати згідно з обраними критеріями"""
-        duplicates = []
-        seen = {}
-        tolerance = self.search_criteria["tolerance"].get()
-        
-        with open(self.input_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        pattern = r'self\._add_settlement\("([^"]+)",\s*([\d.]+),\s*([\d.]+),\s*"([^"]+)",\s*"([^"]+)",\s*(\d+)'
-        
-        for i, line in enumerate(lines):
-            match = re.search(pattern, line.strip())
-            if match:
-                name = match.group(1)
-                lat = float(match.group(2))
-                lon = float(match.group(3))
-                region = match.group(4)
-                settlement_type = match.group(5)
-                population = int(match.group(6))
-                
-                # Формуємо ключ на основі обраних критеріїв
-                key_parts = []
-                if self.search_criteria["compare_name"].get():
-                    key_parts.append(f"name:{name}")
-                if self.search_criteria["compare_region"].get():
-                    key_parts.append(f"region:{region}")
-                if self.search_criteria["compare_coordinates"].get():
-                    # Округлюємо координати з урахуванням толерантності
-                    lat_rounded = round(lat / tolerance) * tolerance
-                    lon_rounded = round(lon / tolerance) * tolerance
-                    key_parts.append(f"lat:{lat_rounded:.6f}")
-                    key_parts.append(f"lon:{lon_rounded:.6f}")
-                if self.search_criteria["compare_population"].get():
-                    key_parts.append(f"pop:{population}")
-                
-                key = "|".join(key_parts)
-                
-                if key in seen:
-                    duplicates.append({
-                        "line_num": i + 1,
-                        "name": name,
-                        "region": region,
-                        "population": population,
-                        "lat": lat,
-                        "lon": lon,
-                        "type": settlement_type,
-                        "line_text": line.strip(),
-                        "original_line": seen[key]["line"],
-                        "original_data": seen[key]
-                    })
-                else:
-                    seen[key] = {
-                        "line": i + 1,
-                        "name": name,
-                        "region": region,
-                        "population": population,
-                        "lat": lat,
-                        "lon": lon,
-                        "type": settlement_type
-                    }
-        
-        return duplicates
+        return dedupe_settlements.find_duplicates(
+            self.lines_data,
+            compare_name=self.search_criteria["compare_name"].get(),
+            compare_region=self.search_criteria["compare_region"].get(),
+            compare_coordinates=self.search_criteria["compare_coordinates"].get(),
+            compare_population=self.search_criteria["compare_population"].get(),
+            tolerance=self.search_criteria["tolerance"].get()
+        )
     
     def extract_all_settlements(self):
         """Витягує всі населені пункти з файлу"""
-        settlements = []
-        
         with open(self.input_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        pattern = r'self\._add_settlement\("([^"]+)",\s*([\d.]+),\s*([\d.]+),\s*"([^"]+)",\s*"([^"]+)",\s*(\d+)'
-        
-        for i, line in enumerate(lines):
-            match = re.search(pattern, line.strip())
-            if match:
-                settlements.append({
-                    "line_num": i + 1,
-                    "name": match.group(1),
-                    "lat": float(match.group(2)),
-                    "lon": float(match.group(3)),
-                    "region": match.group(4),
-                    "type": match.group(5),
-                    "population": int(match.group(6)),
-                    "line_text": line.strip()
-                })
-        
-        return settlements
+            return dedupe_settlements.parse_source(f)
     
     def display_duplicates(self):
         """Відображає знайдені дублікати в таблиці"""
@@ -387,11 +326,8 @@ class AdvancedDuplicateRemover:
             with open(self.input_file, 'r', encoding='utf-8') as f:
                 lines = f.readlines()
             
-            # Визначаємо рядки для видалення
-            lines_to_remove = [dup["line_num"] - 1 for dup in self.duplicates]
-            
             # Створюємо новий список рядків без дублікатів
-            new_lines = [line for i, line in enumerate(lines) if i not in lines_to_remove]
+            new_lines = dedupe_settlements.remove_lines(lines, self.duplicates)
             
             # Створюємо новий файл
             base_name = os.path.basename(self.input_file)
@@ -563,6 +499,10 @@ class AdvancedDuplicateRemover:
             subprocess.call(['xdg-open', folderpath])
 
 def main():
+    has_display = os.name == 'nt' or sys.platform == 'darwin' or os.environ.get('DISPLAY')
+    if len(sys.argv) > 1 or tk is None or not has_display:
+        sys.exit(dedupe_settlements.main())
+    
     root = tk.Tk()
     app = AdvancedDuplicateRemover(root)
     root.mainloop()
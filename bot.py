@@ -1,9 +1,10 @@
 import os
 import logging
 import sys
-import json
+import signal
 from datetime import datetime
 import asyncio
+import threading
 from typing import Dict, List, Optional, Tuple
 import math
 
@@ -66,7 +67,10 @@ except ImportError as e:
 
 # Імпорт власних модулів
 from settlements_db import settlements_db
+from settlements_store import DEFAULT_DATASET_PATH, DatasetError
 from weather_api import weather_api
+from work_pool import ExecutorBusy, work_pool
+from update_processor import update_processor
 
 # ============================================================================
 # КЛАВІАТУРА МЕНЮ
@@ -90,6 +94,41 @@ def get_back_keyboard():
     ], resize_keyboard=True, one_time_keyboard=True)
 
 
+# Екрани, що залежать лише від бази населених пунктів: назва -> (версія бази, результат render)
+_screen_cache: Dict[str, tuple] = {}
+
+def cached_screen(name: str, render):
+    """Результат render(), відрендерений один раз для поточної версії бази"""
+    cached = _screen_cache.get(name)
+    if cached is None or cached[0] != settlements_db.version:
+        cached = _screen_cache[name] = (settlements_db.version, render())
+    return cached[1]
+
+def database_size() -> int:
+    """Кількість населених пунктів (чекає на завантаження бази - викликати через work_pool)"""
+    return len(settlements_db.settlements)
+
+def search_settlements(text: str, limit: int) -> Tuple[List[dict], bool]:
+    """Пошук за префіксом, а якщо нічого немає - нечіткий (можлива помилка в назві)
+
+    Повертає (населені пункти, чи це результати нечіткого пошуку).
+    """
+    settlements = settlements_db.find_settlements_by_prefix(text, limit=limit)
+    if settlements:
+        return settlements, False
+    settlements = settlements_db.find_settlements_fuzzy(text, limit=10)
+    return settlements, bool(settlements)
+
+# Відповідь, коли черга пулу обробників переповнена (ExecutorBusy)
+BUSY_TEXT = "⏳ Бот зараз перевантажений. Спробуйте, будь ласка, за хвилину."
+
+def failure_text(error: Exception) -> str:
+    """Текст для користувача, коли обробка запиту завершилася помилкою"""
+    if isinstance(error, ExecutorBusy):
+        return BUSY_TEXT
+    return "❌ Виникла критична помилка. Спробуйте пізніше."
+
+
 # ============================================================================
 # ОБРОБНИКИ КОМАНД
 # ============================================================================
@@ -107,7 +146,7 @@ async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         f"• Прогноз на 3 дні з почасовими даними\n"
         f"• Всі обласні центри України\n"
         f"• Збереження улюблених міст\n\n"
-        f"📊 *База даних:* {len(settlements_db.settlements)} населених пунктів\n\n"
+        f"📊 *База даних:* {await work_pool.run(database_size)} населених пунктів\n\n"
         f"👇 *Оберіть опцію з меню внизу:*"
     )
     
@@ -138,6 +177,10 @@ async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         "• Всі 24 обласні центри України\n"
         "• Швидкий доступ до будь-якого центру\n\n"
         
+        "📍 *Геолокація:*\n"
+        "• Надішліть свою локацію (📎 → Локація)\n"
+        "• Бот покаже погоду для найближчого населеного пункту\n\n"
+        
         "⭐️ *Улюблені міста:*\n"
         "• Додавайте міста до улюблених\n"
         "• Швидкий доступ до погоди\n\n"
@@ -235,7 +278,7 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
             return
         
         # Пошук населених пунктів
-        settlements = settlements_db.find_settlements_by_prefix(text, limit=20)
+        settlements, fuzzy = await work_pool.run(search_settlements, text, 20)
         
         if not settlements:
             await update.message.reply_text(
@@ -249,8 +292,8 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
             )
             return
         
-        # Якщо знайдено тільки один результат
-        if len(settlements) == 1:
+        # Якщо знайдено тільки один результат (схожі назви завжди показуємо на вибір)
+        if len(settlements) == 1 and not fuzzy:
             settlement = settlements[0]
             if action == 'current':
                 await process_current_weather(update, context, settlement['name'], settlement['region'])
@@ -261,7 +304,7 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
             return
         
         # Якщо знайдено кілька результатів
-        await show_search_results(update, context, settlements, action)
+        await show_search_results(update, context, settlements, action, fuzzy=fuzzy)
         return
     
     # Звичайний пошук (якщо не очікуємо спеціального введення)
@@ -281,7 +324,7 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 async def handle_quick_search(update: Update, context: ContextTypes.DEFAULT_TYPE, query: str):
     """Обробка швидкого пошуку"""
-    settlements = settlements_db.find_settlements_by_prefix(query, limit=15)
+    settlements, fuzzy = await work_pool.run(search_settlements, query, 15)
     
     if not settlements:
         await update.message.reply_text(
@@ -291,13 +334,16 @@ async def handle_quick_search(update: Update, context: ContextTypes.DEFAULT_TYPE
         )
         return
     
-    if len(settlements) == 1:
+    if len(settlements) == 1 and not fuzzy:
         settlement = settlements[0]
         await process_current_weather(update, context, settlement['name'], settlement['region'])
         return
     
     # Показуємо результати пошуку
-    message = f"🔍 *Знайдено {len(settlements)} населених пунктів:*\n\n"
+    if fuzzy:
+        message = "🤔 *Точних збігів немає. Можливо, ви мали на увазі:*\n\n"
+    else:
+        message = f"🔍 *Знайдено {len(settlements)} населених пунктів:*\n\n"
     
     for i, settlement in enumerate(settlements[:10], 1):
         pop_str = f" ({settlement['population']:,} чол.)" if settlement['population'] > 0 else ""
@@ -330,9 +376,13 @@ async def handle_quick_search(update: Update, context: ContextTypes.DEFAULT_TYPE
         reply_markup=reply_markup
     )
 
-async def show_search_results(update: Update, context: ContextTypes.DEFAULT_TYPE, settlements: List[dict], action: str):
+async def show_search_results(update: Update, context: ContextTypes.DEFAULT_TYPE, settlements: List[dict], action: str,
+                              fuzzy: bool = False):
     """Показати результати пошуку з інлайн-кнопками"""
-    message = f"🔍 *Знайдено {len(settlements)} населених пунктів:*\n\n"
+    if fuzzy:
+        message = "🤔 *Точних збігів немає. Можливо, ви мали на увазі:*\n\n"
+    else:
+        message = f"🔍 *Знайдено {len(settlements)} населених пунктів:*\n\n"
     
     for i, settlement in enumerate(settlements[:10], 1):
         pop_str = f" ({settlement['population']:,} чол.)" if settlement['population'] > 0 else ""
@@ -369,6 +419,56 @@ async def show_search_results(update: Update, context: ContextTypes.DEFAULT_TYPE
         reply_markup=reply_markup
     )
 
+# Далі за цю відстань від найближчого населеного пункту геолокацію вважаємо поза Україною
+LOCATION_MAX_DISTANCE_KM = float(os.getenv('LOCATION_MAX_DISTANCE_KM', 50))
+
+async def handle_location(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Обробка надісланої геолокації - погода для найближчого населеного пункту"""
+    location = update.message.location
+    action = context.user_data.pop('awaiting_city_for', None)
+    
+    nearby = await work_pool.run(
+        settlements_db.find_nearest_settlements,
+        location.latitude, location.longitude, k=5, max_distance_km=LOCATION_MAX_DISTANCE_KM
+    )
+    
+    if not nearby:
+        await update.message.reply_text(
+            "📍 *Поруч не знайдено населених пунктів з бази.*\n\n"
+            "Схоже, геолокація за межами України. Введіть назву населеного пункту.",
+            parse_mode='Markdown',
+            reply_markup=get_main_keyboard()
+        )
+        return
+    
+    nearest = nearby[0]
+    logger.info(f"Location resolved to {nearest['name']} ({nearest['region']}), {nearest['distance_km']} km")
+    
+    if action == 'forecast':
+        await process_3day_forecast(update, context, nearest['name'], nearest['region'])
+    else:
+        await process_current_weather(update, context, nearest['name'], nearest['region'])
+    
+    # Інші населені пункти поруч - на випадок, якщо найближчий за відстанню не той
+    others = nearby[1:]
+    if others:
+        message = f"📍 *{nearest['name']}* - {nearest['distance_km']:.1f} км від вас.\n\n*Також поруч:*\n"
+        keyboard = []
+        for i, settlement in enumerate(others, 1):
+            message += f"{i}. {settlement['name']} ({settlement['region']}) - {settlement['distance_km']:.1f} км\n"
+            button_text = f"{i}. {settlement['name']}"
+            if len(button_text) > 20:
+                button_text = f"{i}. {settlement['name'][:17]}..."
+            callback_data = f"forecast_{i}" if action == 'forecast' else f"city_{i}"
+            keyboard.append([InlineKeyboardButton(button_text, callback_data=callback_data)])
+        
+        context.user_data['last_search_results'] = others
+        await update.message.reply_text(
+            message,
+            parse_mode='Markdown',
+            reply_markup=InlineKeyboardMarkup(keyboard)
+        )
+
 # ============================================================================
 # ОБРОБНИКИ ІНЛАЙН-КНОПОК
 # ============================================================================
@@ -405,7 +505,7 @@ async def handle_favorite_city(query, context, settlement_name, region):
         context.user_data['last_region'] = region
         
         # Отримуємо координати
-        lat, lon = settlements_db.get_coordinates(settlement_name, region)
+        lat, lon = await work_pool.run(settlements_db.get_coordinates, settlement_name, region)
         
         if not lat or not lon:
             await query.edit_message_text(
@@ -415,7 +515,7 @@ async def handle_favorite_city(query, context, settlement_name, region):
             return
         
         # Отримуємо погоду
-        weather_data = weather_api.get_weather(lat, lon, forecast_days=1)
+        weather_data = await weather_api.get_weather_async(lat, lon, forecast_days=1, view='current')
         
         if not weather_data:
             error_text = (
@@ -429,7 +529,7 @@ async def handle_favorite_city(query, context, settlement_name, region):
             return
         
         # Форматуємо повідомлення
-        weather_text = weather_api.format_current_weather(settlement_name, region, weather_data)
+        weather_text = await work_pool.run(weather_api.format_current_weather, settlement_name, region, weather_data)
         
         if not weather_text:
             await query.edit_message_text(
@@ -465,10 +565,7 @@ async def handle_favorite_city(query, context, settlement_name, region):
             
     except Exception as e:
         logger.error(f"Error processing favorite city: {e}", exc_info=True)
-        await query.edit_message_text(
-            "❌ Виникла критична помилка. Спробуйте пізніше.",
-            parse_mode='Markdown'
-        )
+        await query.edit_message_text(failure_text(e), parse_mode='Markdown')
 
 
 async def button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -669,7 +766,7 @@ async def button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     elif data.startswith('region_'):
         try:
             index = int(data.split('_')[1]) - 1
-            centers = settlements_db.get_regional_centers()
+            centers = await work_pool.run(settlements_db.get_regional_centers)
             if 0 <= index < len(centers):
                 center = centers[index]
                 from telegram import Update
@@ -694,7 +791,7 @@ async def button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 f"• Прогноз на 3 дні з почасовими даними\n"
                 f"• Всі обласні центри України\n"
                 f"• Збереження улюблених міст\n\n"
-                f"📊 *База даних:* {len(settlements_db.settlements)} населених пунктів\n\n"
+                f"📊 *База даних:* {await work_pool.run(database_size)} населених пунктів\n\n"
                 f"👇 *Оберіть опцію з меню внизу:*"
             )
             
@@ -754,8 +851,8 @@ async def button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
 # ОБЛАСНІ ЦЕНТРИ
 # ============================================================================
 
-async def show_regional_centers(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    """Показати обласні центри"""
+def render_regional_centers() -> Tuple[str, InlineKeyboardMarkup]:
+    """Текст і кнопки екрану обласних центрів"""
     centers = settlements_db.get_regional_centers()
     
     centers_text = "🏙 *Обласні центри України:*\n\n"
@@ -773,17 +870,21 @@ async def show_regional_centers(update: Update, context: ContextTypes.DEFAULT_TY
     
     keyboard.append([InlineKeyboardButton("↩️ Назад", callback_data="back_to_menu")])
     
-    reply_markup = InlineKeyboardMarkup(keyboard)
+    return centers_text + "\n👇 *Оберіть місто:*", InlineKeyboardMarkup(keyboard)
+
+async def show_regional_centers(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Показати обласні центри"""
+    centers_text, reply_markup = await work_pool.run(cached_screen, 'regional_centers', render_regional_centers)
     
     if hasattr(update, 'message'):
         await update.message.reply_text(
-            centers_text + "\n👇 *Оберіть місто:*",
+            centers_text,
             parse_mode='Markdown',
             reply_markup=reply_markup
         )
     else:
         await update.edit_message_text(
-            centers_text + "\n👇 *Оберіть місто:*",
+            centers_text,
             parse_mode='Markdown',
             reply_markup=reply_markup
         )
@@ -816,10 +917,23 @@ async def show_favorites(update: Update, context: ContextTypes.DEFAULT_TYPE):
             )
         return
     
+    # Поточна температура для всіх улюблених - одним пакетним запитом
+    coordinates = await work_pool.run(
+        lambda: [settlements_db.get_coordinates(fav['name'], fav['region']) for fav in favorites]
+    )
+    points = [coords for coords in coordinates if coords[0] and coords[1]]
+    weather_by_point = dict(zip(points, await weather_api.get_weather_many_async(points, forecast_days=1, view='favorites')))
+    
     # Формуємо текст з улюбленими містами
     favorites_text = "⭐️ *Ваші улюблені міста:*\n\n"
-    for i, fav in enumerate(favorites, 1):
-        favorites_text += f"{i}. {fav['name']} ({fav['region']})\n"
+    for i, (fav, coords) in enumerate(zip(favorites, coordinates), 1):
+        weather_str = ""
+        weather_data = weather_by_point.get(coords)
+        if weather_data:
+            current = weather_data.get('current', {})
+            emoji = weather_api.get_weather_emoji(current.get('weather_code', 0))
+            weather_str = f" — {emoji} {current.get('temperature_2m', 0):.0f}°C"
+        favorites_text += f"{i}. {fav['name']} ({fav['region']}){weather_str}\n"
     
     # Створюємо кнопки
     keyboard = []
@@ -926,8 +1040,8 @@ async def clear_favorites(update, context):
 # СТАТИСТИКА
 # ============================================================================
 
-async def show_statistics(update: Update):
-    """Показати статистику"""
+def render_statistics() -> str:
+    """Текст екрану статистики"""
     stats = settlements_db.get_statistics()
     
     stats_text = f"📊 *Статистика бази даних:*\n\n"
@@ -938,6 +1052,11 @@ async def show_statistics(update: Update):
     stats_text += "*Топ-5 найбільших міст:*\n"
     for i, city in enumerate(stats['largest_cities'][:5], 1):
         stats_text += f"{i}. {city['name']} ({city['region']}): {city['population']:,} чол.\n"
+    return stats_text
+
+async def show_statistics(update: Update):
+    """Показати статистику"""
+    stats_text = await work_pool.run(cached_screen, 'statistics', render_statistics)
     
     if hasattr(update, 'message'):
         await update.message.reply_text(
@@ -985,7 +1104,7 @@ async def process_current_weather(update: Update, context: ContextTypes.DEFAULT_
         context.user_data['last_region'] = region
         
         # Отримуємо координати
-        lat, lon = settlements_db.get_coordinates(settlement_name, region)
+        lat, lon = await work_pool.run(settlements_db.get_coordinates, settlement_name, region)
         
         if not lat or not lon:
             error_msg = f"❌ Не знайдено координат для '{settlement_name}' ({region})"
@@ -996,7 +1115,7 @@ async def process_current_weather(update: Update, context: ContextTypes.DEFAULT_
             return
         
         # Отримуємо погоду
-        weather_data = weather_api.get_weather(lat, lon, forecast_days=1)
+        weather_data = await weather_api.get_weather_async(lat, lon, forecast_days=1, view='current')
         
         if not weather_data:
             error_text = (
@@ -1013,7 +1132,7 @@ async def process_current_weather(update: Update, context: ContextTypes.DEFAULT_
             return
         
         # Форматуємо повідомлення
-        weather_text = weather_api.format_current_weather(settlement_name, region, weather_data)
+        weather_text = await work_pool.run(weather_api.format_current_weather, settlement_name, region, weather_data)
         
         if not weather_text:
             error_text = f"❌ Помилка обробки даних для {settlement_name}"
@@ -1058,7 +1177,7 @@ async def process_current_weather(update: Update, context: ContextTypes.DEFAULT_
             
     except Exception as e:
         logger.error(f"Error processing weather request: {e}", exc_info=True)
-        error_msg = "❌ Виникла критична помилка. Спробуйте пізніше."
+        error_msg = failure_text(e)
         
         # Обробка помилок для обох типів запитів
         try:
@@ -1110,7 +1229,7 @@ async def process_3day_forecast(update: Update, context: ContextTypes.DEFAULT_TY
         context.user_data['last_region'] = region
         
         # Отримуємо координати
-        lat, lon = settlements_db.get_coordinates(settlement_name, region)
+        lat, lon = await work_pool.run(settlements_db.get_coordinates, settlement_name, region)
         logger.info(f"Coordinates: {lat}, {lon}")
         
         if not lat or not lon:
@@ -1124,7 +1243,7 @@ async def process_3day_forecast(update: Update, context: ContextTypes.DEFAULT_TY
         
         # Отримуємо погоду з прогнозом на 3 дні
         logger.info("Getting weather data from API...")
-        weather_data = weather_api.get_weather(lat, lon, forecast_days=3)
+        weather_data = await weather_api.get_weather_async(lat, lon, forecast_days=3, view='forecast')
         
         if not weather_data:
             error_text = (
@@ -1144,7 +1263,7 @@ async def process_3day_forecast(update: Update, context: ContextTypes.DEFAULT_TY
         logger.info(f"Weather data received, keys: {list(weather_data.keys())}")
         
         # Отримуємо 3 повідомлення з прогнозом
-        forecast_messages = weather_api.format_3day_forecast(settlement_name, region, weather_data)
+        forecast_messages = await work_pool.run(weather_api.format_3day_forecast, settlement_name, region, weather_data)
         logger.info(f"Forecast messages prepared: {len(forecast_messages) if forecast_messages else 0}")
         
         if not forecast_messages:
@@ -1217,7 +1336,7 @@ async def process_3day_forecast(update: Update, context: ContextTypes.DEFAULT_TY
             
     except Exception as e:
         logger.error(f"Error processing forecast request: {e}", exc_info=True)
-        error_msg = "❌ Виникла критична помилка. Спробуйте пізніше."
+        error_msg = failure_text(e)
         
         if hasattr(update, 'callback_query'):
             try:
@@ -1234,9 +1353,32 @@ async def process_3day_forecast(update: Update, context: ContextTypes.DEFAULT_TY
 
 async def error_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Обробник помилок"""
+    if isinstance(context.error, ExecutorBusy):
+        # Перевантаження - не збій: коротко повідомляємо користувача замість мовчання
+        logger.warning(f"Update rejected, work pool is full: {context.error}")
+        if isinstance(update, Update) and update.effective_chat:
+            try:
+                await update.effective_chat.send_message(BUSY_TEXT)
+            except Exception as e:
+                logger.error(f"Failed to send busy message: {e}")
+        return
     logger.error(f"Bot error: {context.error}", exc_info=True)
 
 
+async def warm_regional_centers(context: ContextTypes.DEFAULT_TYPE):
+    """Фонове прогрівання кешу погоди для обласних центрів"""
+    centers = await work_pool.run(settlements_db.get_regional_centers)
+    points = [(center['lat'], center['lon']) for center in centers]
+    results = await weather_api.get_weather_many_async(points, forecast_days=weather_api.fetch_forecast_days)
+    logger.info(f"♨️ Weather cache warmed for {sum(1 for r in results if r)}/{len(points)} regional centers")
+
+
+async def post_shutdown(application: Application):
+    """Звільнення ресурсів при зупинці бота"""
+    await weather_api.close()
+    work_pool.shutdown(wait=False)
+
+
 # ============================================================================
 # СПЕЦІАЛЬНІ ФУНКЦІЇ ДЛЯ ОБРОБКИ CALLBACK
 # ============================================================================
@@ -1255,7 +1397,7 @@ async def process_current_weather_for_callback(query, context, settlement_name,
         )
         
         # Отримуємо координати
-        lat, lon = settlements_db.get_coordinates(settlement_name, region)
+        lat, lon = await work_pool.run(settlements_db.get_coordinates, settlement_name, region)
         
         if not lat or not lon:
             await query.edit_message_text(
@@ -1265,7 +1407,7 @@ async def process_current_weather_for_callback(query, context, settlement_name,
             return
         
         # Отримуємо погоду
-        weather_data = weather_api.get_weather(lat, lon, forecast_days=1)
+        weather_data = await weather_api.get_weather_async(lat, lon, forecast_days=1, view='current')
         
         if not weather_data:
             error_text = (
@@ -1279,7 +1421,7 @@ async def process_current_weather_for_callback(query, context, settlement_name,
             return
         
         # Форматуємо повідомлення
-        weather_text = weather_api.format_current_weather(settlement_name, region, weather_data)
+        weather_text = await work_pool.run(weather_api.format_current_weather, settlement_name, region, weather_data)
         
         if not weather_text:
             await query.edit_message_text(
@@ -1315,10 +1457,7 @@ async def process_current_weather_for_callback(query, context, settlement_name,
             
     except Exception as e:
         logger.error(f"Error processing weather request from callback: {e}")
-        await query.edit_message_text(
-            "❌ Виникла критична помилка. Спробуйте пізніше.",
-            parse_mode='Markdown'
-        )
+        await query.edit_message_text(failure_text(e), parse_mode='Markdown')
 
 async def process_3day_forecast_for_callback(query, context, settlement_name, region):
     """Обробка прогнозу для callback запитів"""
@@ -1334,7 +1473,7 @@ async def process_3day_forecast_for_callback(query, context, settlement_name, re
         )
         
         # Отримуємо координати
-        lat, lon = settlements_db.get_coordinates(settlement_name, region)
+        lat, lon = await work_pool.run(settlements_db.get_coordinates, settlement_name, region)
         
         if not lat or not lon:
             await query.edit_message_text(
@@ -1344,7 +1483,7 @@ async def process_3day_forecast_for_callback(query, context, settlement_name, re
             return
         
         # Отримуємо погоду з прогнозом на 3 дні
-        weather_data = weather_api.get_weather(lat, lon, forecast_days=3)
+        weather_data = await weather_api.get_weather_async(lat, lon, forecast_days=3, view='forecast')
         
         if not weather_data:
             error_text = (
@@ -1358,7 +1497,7 @@ async def process_3day_forecast_for_callback(query, context, settlement_name, re
             return
         
         # Отримуємо 3 повідомлення з прогнозом
-        forecast_messages = weather_api.format_3day_forecast(settlement_name, region, weather_data)
+        forecast_messages = await work_pool.run(weather_api.format_3day_forecast, settlement_name, region, weather_data)
         
         if not forecast_messages:
             await query.edit_message_text(
@@ -1399,10 +1538,7 @@ async def process_3day_forecast_for_callback(query, context, settlement_name, re
             
     except Exception as e:
         logger.error(f"Error processing forecast request from callback: {e}")
-        await query.edit_message_text(
-            "❌ Виникла критична помилка. Спробуйте пізніше.",
-            parse_mode='Markdown'
-        )
+        await query.edit_message_text(failure_text(e), parse_mode='Markdown')
 
 async def add_to_favorites_from_callback(query, context, settlement_name, region):
     """Додати місто до улюблених з callback"""
@@ -1464,7 +1600,7 @@ async def start_command_for_callback(query, context):
         f"• Прогноз на 3 дні з почасовими даними\n"
         f"• Всі обласні центри України\n"
         f"• Збереження улюблених міст\n\n"
-        f"📊 *База даних:* {len(settlements_db.settlements)} населених пунктів\n\n"
+        f"📊 *База даних:* {await work_pool.run(database_size)} населених пунктів\n\n"
         f"👇 *Оберіть опцію з меню внизу:*"
     )
     
@@ -1490,57 +1626,260 @@ async def debug_context(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await update.message.reply_text(f"Контекст: {list(user_data.keys())}")
 
 
+# ============================================================================
+# ПЕРЕЗАВАНТАЖЕННЯ БАЗИ НАСЕЛЕНИХ ПУНКТІВ
+# ============================================================================
+
+# Telegram ID користувачів, яким дозволено /reload (через кому)
+ADMIN_USER_IDS = {int(user_id) for user_id in os.getenv('ADMIN_USER_IDS', '').replace(' ', '').split(',') if user_id}
+
+def format_reload_report(report: dict) -> str:
+    """Короткий опис результату перезавантаження бази"""
+    if not report['swapped']:
+        return f"ℹ️ База без змін (версія {report['version']})"
+    return (
+        f"✅ База оновлена: {report['old_version']} → {report['version']}\n"
+        f"• Додано: {report['added']}, видалено: {report['removed']}, змінено: {report['changed']}\n"
+        f"• Побудова: {report['build_ms']} мс, заміна: {report['swap_ms']} мс"
+    )
+
+async def reload_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Команда /reload [файл] - перечитати файл бази без перезапуску (лише для адміністраторів)"""
+    if update.effective_user.id not in ADMIN_USER_IDS:
+        logger.warning(f"/reload denied for user {update.effective_user.id}")
+        return
+    
+    # Лише ім'я файлу в каталозі data/ (напр. settlements-<версія>.bin), без довільних шляхів
+    path = None
+    if context.args:
+        path = os.path.join(os.path.dirname(DEFAULT_DATASET_PATH), os.path.basename(context.args[0]))
+    
+    try:
+        report = await work_pool.run(settlements_db.reload, path)
+    except (OSError, DatasetError) as e:
+        logger.error(f"Settlements reload failed: {e}")
+        await update.message.reply_text(f"❌ Не вдалося перезавантажити базу: {e}")
+        return
+    
+    await update.message.reply_text(format_reload_report(report))
+
+def reload_settlements_in_background():
+    """Перезавантаження бази в окремому потоці (для SIGHUP)"""
+    def run():
+        try:
+            logger.info(format_reload_report(settlements_db.reload()))
+        except Exception as e:
+            logger.error(f"Settlements reload failed: {e}", exc_info=True)
+    
+    threading.Thread(target=run, name='settlements-reload', daemon=True).start()
+
+def install_reload_signal():
+    """kill -HUP <pid> - перечитати файл бази населених пунктів без перезапуску"""
+    if hasattr(signal, 'SIGHUP'):
+        signal.signal(signal.SIGHUP, lambda signum, frame: reload_settlements_in_background())
 
 
 # ============================================================================
-# HEALTH SERVER ДЛЯ KOYEB
+# HTTP-СЕРВЕР: WEBHOOK TELEGRAM, HEALTH ТА METRICS
 # ============================================================================
 
-import threading
-from http.server import HTTPServer, BaseHTTPRequestHandler
-
-class HealthHandler(BaseHTTPRequestHandler):
-    def do_GET(self):
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self.end_headers()
-        if self.path == '/health':
-            self.wfile.write(b'{"status":"healthy"}')
-        else:
-            self.wfile.write(b'{"status":"online"}')
-    
-    def log_message(self, format, *args):
-        pass  # Вимкнути логування
+import hmac
+import hashlib
+from aiohttp import web
+
+# Шлях, на який Telegram надсилає оновлення в режимі webhook
+WEBHOOK_PATH = os.getenv('WEBHOOK_PATH', '/telegram')
+
+# Лічильники webhook для /metrics
+webhook_stats = {'received': 0, 'rejected': 0, 'invalid': 0}
+
+def get_webhook_url() -> Optional[str]:
+    """Публічна адреса webhook: WEBHOOK_URL або адреса сервісу, яку задає платформа"""
+    base = os.getenv('WEBHOOK_URL') or os.getenv('RENDER_EXTERNAL_URL')
+    if not base:
+        domain = os.getenv('KOYEB_PUBLIC_DOMAIN') or os.getenv('RAILWAY_PUBLIC_DOMAIN')
+        base = f"https://{domain}" if domain else None
+    if not base:
+        return None
+    return base.rstrip('/') + WEBHOOK_PATH
+
+def get_bot_mode() -> str:
+    """BOT_MODE=webhook|polling; без нього - webhook, якщо відома публічна адреса (локально - polling)"""
+    mode = os.getenv('BOT_MODE', '').lower()
+    if mode in ('webhook', 'polling'):
+        return mode
+    return 'webhook' if get_webhook_url() else 'polling'
+
+def get_webhook_secret() -> str:
+    """Секрет для X-Telegram-Bot-Api-Secret-Token: WEBHOOK_SECRET або стабільне значення з токена бота"""
+    return os.getenv('WEBHOOK_SECRET') or hashlib.sha256(f"webhook:{TELEGRAM_TOKEN}".encode()).hexdigest()
+
+async def ready_endpoint(request: web.Request) -> web.Response:
+    # Readiness: 503, доки база населених пунктів не завантажена і індекси не побудовані
+    ready = settlements_db.is_ready()
+    return web.json_response({'ready': ready}, status=200 if ready else 503)
+
+async def health_endpoint(request: web.Request) -> web.Response:
+    # Liveness: відповідає одразу після старту, навіть поки база ще завантажується.
+    # Відкритий запобіжник - бот працює, але з кешем/апроксимацією (HTTP 200, щоб не перезапускати)
+    # Фонове завантаження бази завершилося помилкою - 'failed' з текстом помилки, а не вічне 'starting'
+    upstreams = weather_api.get_upstream_health()
+    degraded = any(state['state'] != 'closed' for state in upstreams.values())
+    ready = settlements_db.is_ready()
+    load_error = settlements_db.load_error
+    if not ready:
+        status = 'failed' if load_error is not None else 'starting'
+    else:
+        status = 'degraded' if degraded else 'healthy'
+    payload = {
+        'status': status,
+        'ready': ready,
+        'upstreams': upstreams
+    }
+    if load_error is not None:
+        payload['error'] = str(load_error)
+    return web.json_response(payload)
+
+async def metrics_endpoint(request: web.Request) -> web.Response:
+    return web.json_response({
+        'weather': weather_api.get_stats(),
+        'work_pool': work_pool.get_stats(),
+        'updates': update_processor.get_stats(),
+        'webhook': dict(webhook_stats, mode=request.app['mode']),
+        'settlements': {
+            'ready': settlements_db.is_ready(),
+            'load_seconds': settlements_db.load_seconds,
+            'load_error': str(settlements_db.load_error) if settlements_db.load_error is not None else None,
+            'dataset_version': settlements_db.dataset_version if settlements_db.is_ready() else None
+        }
+    })
+
+async def online_endpoint(request: web.Request) -> web.Response:
+    return web.json_response({'status': 'online'})
 
-def run_health_server():
-    """Запуск health сервера"""
+async def webhook_endpoint(request: web.Request) -> web.Response:
+    """Оновлення від Telegram: перевірка секрету, розбір і постановка в чергу Application"""
+    application = request.app['application']
+    token = request.headers.get('X-Telegram-Bot-Api-Secret-Token', '')
+    if not hmac.compare_digest(token.encode(), request.app['secret'].encode()):
+        webhook_stats['rejected'] += 1
+        logger.warning(f"Webhook request with invalid secret token from {request.remote}")
+        return web.Response(status=403)
+    
+    try:
+        data = await request.json()
+        # de_json повертає None для null, {} та [] - такі тіла не є оновленнями
+        update = Update.de_json(data, application.bot) if isinstance(data, dict) else None
+    except (ValueError, TypeError, KeyError) as e:
+        webhook_stats['invalid'] += 1
+        logger.warning(f"Invalid webhook payload: {e}")
+        return web.Response(status=400)
+
+    if update is None:
+        webhook_stats['invalid'] += 1
+        logger.warning("Invalid webhook payload: not an update object")
+        return web.Response(status=400)
+
+    # Відповідаємо одразу - обробка йде через update_processor, як і при polling
+    webhook_stats['received'] += 1
+    await application.update_queue.put(update)
+    return web.Response()
+
+def create_web_app(application: Application, mode: str) -> web.Application:
+    """HTTP-застосунок: /health, /ready, /metrics, а в режимі webhook - ще й оновлення Telegram"""
+    web_app = web.Application()
+    web_app['application'] = application
+    web_app['mode'] = mode
+    web_app['secret'] = get_webhook_secret()
+    if mode == 'webhook':
+        web_app.router.add_post(WEBHOOK_PATH, webhook_endpoint)
+    web_app.router.add_get('/ready', ready_endpoint)
+    web_app.router.add_get('/health', health_endpoint)
+    web_app.router.add_get('/metrics', metrics_endpoint)
+    web_app.router.add_get('/{tail:.*}', online_endpoint)
+    return web_app
+
+async def run_application(application: Application):
+    """Запуск бота в поточному event loop разом з HTTP-сервером на $PORT
+
+    webhook - Telegram надсилає оновлення на той самий сервер (Render, Koyeb, Railway);
+    polling - для локальної розробки, сервер відповідає лише на health і metrics.
+    Зупинка - SIGINT/SIGTERM.
+    """
+    mode = get_bot_mode()
+    webhook_url = get_webhook_url()
+    if mode == 'webhook' and not webhook_url:
+        raise RuntimeError("BOT_MODE=webhook requires WEBHOOK_URL")
     port = int(os.getenv('PORT', 8000))
-    print(f"🌐 Health server starting on port {port}")
-    server = HTTPServer(('0.0.0.0', port), HealthHandler)
-    server.serve_forever()
+    
+    # Сервер стартує першим - /health відповідає, поки бот ініціалізується і база завантажується
+    runner = web.AppRunner(create_web_app(application, mode), access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, '0.0.0.0', port).start()
+    print(f"🌐 HTTP server started on port {port}")
+    
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for stop_signal in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(stop_signal, stop.set)
+        except (NotImplementedError, RuntimeError):
+            pass  # Windows або не головний потік
+    
+    try:
+        await application.initialize()
+        await application.start()
+        if mode == 'webhook':
+            await application.bot.set_webhook(
+                webhook_url,
+                secret_token=get_webhook_secret(),
+                allowed_updates=Update.ALL_TYPES,
+                drop_pending_updates=True
+            )
+            print(f"✅ Webhook set: {webhook_url}")
+        else:
+            # start_polling сам видаляє webhook, якщо його було встановлено
+            await application.updater.start_polling(drop_pending_updates=True, timeout=30, pool_timeout=30)
+            print("✅ Polling started")
+        await stop.wait()
+    finally:
+        if application.updater and application.updater.running:
+            await application.updater.stop()
+        if application.running:
+            await application.stop()
+        await runner.cleanup()
+        await application.shutdown()
+        if application.post_shutdown:
+            await application.post_shutdown(application)
 
 # ============================================================================
 # ОНОВЛЕНА ГОЛОВНА ФУНКЦІЯ
 # ============================================================================
 
 def main():
-    """Запуск бота з health сервером"""
+    """Запуск бота: webhook або polling разом з HTTP-сервером health/metrics"""
     try:
         print("🚀 Creating Telegram application...")
         
-        # Запускаємо health сервер у окремому потоці
-        health_thread = threading.Thread(target=run_health_server, daemon=True)
-        health_thread.start()
-        print(f"✅ Health server started on port {os.getenv('PORT', 8000)}")
-        
-        # Створюємо Application
-        application = Application.builder().token(TELEGRAM_TOKEN).build()
+        # База населених пунктів завантажується у фоні - /health відповідає одразу, /ready - після завантаження
+        settlements_db.start_background_load()
+        install_reload_signal()
+        
+        # Створюємо Application:
+        # оновлення різних чатів обробляються паралельно (UPDATE_CONCURRENCY), одного чату - по черзі
+        application = (
+            Application.builder().token(TELEGRAM_TOKEN)
+            .concurrent_updates(update_processor)
+            .post_shutdown(post_shutdown)
+            .build()
+        )
         
         # Додавання обробників команд
         application.add_handler(CommandHandler("start", start_command))
         application.add_handler(CommandHandler("help", help_command))
         application.add_handler(CommandHandler("debug", debug_context))  # Додайте цей рядок
         application.add_handler(CommandHandler("testfav", test_favorites))
+        application.add_handler(CommandHandler("reload", reload_command))
 
 
         # Обробник кнопок меню
@@ -1558,20 +1897,26 @@ def main():
             handle_message
         ))
         
+        # Обробник геолокації
+        application.add_handler(MessageHandler(filters.LOCATION, handle_location))
+        
         # Обробник помилок
         application.add_error_handler(error_handler)
         
+        # Прогрівання кешу погоди для обласних центрів (один пакетний запит)
+        if application.job_queue:
+            application.job_queue.run_repeating(
+                warm_regional_centers,
+                interval=weather_api.forecast_cache.soft_ttl,
+                first=10
+            )
+        
         print("✅ Application created")
-        print(f"✅ Database loaded: {len(settlements_db.settlements)} settlements")
-        print("🚀 Starting bot polling...")
+        print(f"✅ Database {'loaded' if settlements_db.is_ready() else 'loading in background'}")
+        print(f"🚀 Starting bot ({get_bot_mode()})...")
         
         # Запускаємо бота
-        application.run_polling(
-            drop_pending_updates=True,
-            timeout=30,
-            pool_timeout=30,
-            close_loop=False  # ВАЖЛИВО: не закривати loop
-        )
+        asyncio.run(run_application(application))
         
     except Exception as e:
         print(f"❌ Error: {e}")
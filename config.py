@@ -12,7 +12,7 @@ class Config:
     WEATHER_API_URL = "https://api.openweathermap.org/data/2.5/weather"
     
     # Cache settings
-    CACHE_DURATION = 600  # 10 хвилин у секундах
+    CACHE_DURATION = int(os.getenv('WEATHER_CACHE_TTL', 600))  # 10 хвилин у секундах
     
     # Bot settings
     DEFAULT_CITIES = {
@@ -36,16 +36,28 @@ async def main():
         from telegram.ext import Application, CommandHandler, MessageHandler, filters, CallbackQueryHandler
         
         # Імпорт внутрішніх модулів тут, щоб уникнути конфліктів
-        from bot import start_command, help_command, handle_message, handle_menu_button
-        from bot import button_handler, error_handler
-        from bot import settlements_db
+        from bot import start_command, help_command, handle_message, handle_menu_button, handle_location
+        from bot import button_handler, error_handler, post_shutdown, warm_regional_centers
+        from bot import settlements_db, weather_api, reload_command, install_reload_signal
+        from bot import update_processor, run_application, get_bot_mode
         
-        # Створюємо Application
-        application = Application.builder().token(TELEGRAM_TOKEN).build()
+        # База населених пунктів завантажується у фоні, поки створюється Application
+        settlements_db.start_background_load()
+        install_reload_signal()
+        
+        # Створюємо Application:
+        # оновлення різних чатів обробляються паралельно (UPDATE_CONCURRENCY), одного чату - по черзі
+        application = (
+            Application.builder().token(TELEGRAM_TOKEN)
+            .concurrent_updates(update_processor)
+            .post_shutdown(post_shutdown)
+            .build()
+        )
         
         # Додавання обробників команд
         application.add_handler(CommandHandler("start", start_command))
         application.add_handler(CommandHandler("help", help_command))
+        application.add_handler(CommandHandler("reload", reload_command))
         
         # Обробник кнопок меню
         application.add_handler(MessageHandler(
@@ -62,21 +74,26 @@ async def main():
             handle_message
         ))
         
+        # Обробник геолокації
+        application.add_handler(MessageHandler(filters.LOCATION, handle_location))
+        
         # Обробник помилок
         application.add_error_handler(error_handler)
         
+        # Прогрівання кешу погоди для обласних центрів
+        if application.job_queue:
+            application.job_queue.run_repeating(
+                warm_regional_centers,
+                interval=weather_api.forecast_cache.soft_ttl,
+                first=10
+            )
+        
         print("✅ Application created")
-        print(f"✅ Database loaded: {len(settlements_db.settlements)} settlements")
-        print("🚀 Starting bot polling...")
+        print(f"✅ Database {'loaded' if settlements_db.is_ready() else 'loading in background'}")
+        print(f"🚀 Starting bot ({get_bot_mode()})...")
         
-        # Запускаємо polling з вимкненими сигналами
-        await application.run_polling(
-            drop_pending_updates=True,
-            timeout=30,
-            pool_timeout=30,
-            allowed_updates=None,
-            close_loop=False
-        )
+        # Webhook (або polling локально) і HTTP-сервер health/metrics на $PORT в одному event loop
+        await run_application(application)
         
     except Exception as e:
         logger.error(f"Application error: {e}")
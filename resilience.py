@@ -0,0 +1,239 @@
+# resilience.py - Захист від збоїв зовнішніх погодних API
+import time
+import random
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Стани запобіжника
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+# Пріоритети запитів до API: фонові (прогрів кешу, оновлення застарілих даних)
+# відкидаються першими, коли квота закінчується
+PRIORITY_USER = 'user'
+PRIORITY_BACKGROUND = 'background'
+
+
+class CircuitBreaker:
+    """Запобіжник (circuit breaker) для одного зовнішнього API
+
+    closed    - запити проходять, помилки рахуються у ковзному вікні;
+    open      - запити одразу відхиляються до кінця паузи (експоненційна з джитером);
+    half_open - пропускається один пробний запит: успіх закриває запобіжник,
+                помилка знову відкриває його з подвоєною паузою.
+    """
+
+    def __init__(self, name: str, failure_rate: float = 0.5, min_calls: int = 5,
+                 consecutive_failures: int = 3, window: float = 60,
+                 base_backoff: float = 15, max_backoff: float = 600):
+        self.name = name
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.consecutive_failures = consecutive_failures
+        self.window = window
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+
+        self.state = CLOSED
+        self._calls = deque()  # (час, успіх)
+        self._failures_in_row = 0
+        self._open_count = 0
+        self._open_until = 0.0
+        self._probe_in_flight = False
+        self._probes = 0  # номер останнього пробного запиту
+        self._lock = threading.Lock()
+
+        # Лічильники та історія переходів для /health
+        self.rejected = 0
+        self.transitions = deque(maxlen=20)
+
+    def allow_request(self) -> Optional[int]:
+        """Чи можна зараз звертатися до API
+
+        None - запит відхилено; інакше дозвіл для release(): 0 - звичайний запит,
+        номер пробного запиту - якщо цей виклик зайняв слот напівзакритого запобіжника.
+        """
+        with self._lock:
+            if self.state == OPEN:
+                if time.time() < self._open_until:
+                    self.rejected += 1
+                    return None
+                self._transition(HALF_OPEN, "backoff elapsed")
+
+            if self.state == HALF_OPEN:
+                if self._probe_in_flight:
+                    self.rejected += 1
+                    return None
+                self._probe_in_flight = True
+                self._probes += 1
+                return self._probes
+
+            return 0
+
+    def release(self, permit: int):
+        """Повернути дозвіл allow_request(), якщо запит так і не завершився
+
+        Слот звільняється лише для того самого пробного запиту: запит, пропущений
+        ще до відкриття запобіжника, не може звільнити слот чужої проби.
+        """
+        with self._lock:
+            if permit and permit == self._probes and self.state == HALF_OPEN:
+                self._probe_in_flight = False
+
+    def record_success(self):
+        """Зареєструвати успішну відповідь"""
+        with self._lock:
+            self._record(True)
+            self._failures_in_row = 0
+            if self.state == HALF_OPEN:
+                self._probe_in_flight = False
+                self._open_count = 0
+                self._calls.clear()
+                self._transition(CLOSED, "probe succeeded")
+
+    def record_failure(self, reason: str = ''):
+        """Зареєструвати помилку (таймаут, 401/429/5xx тощо)"""
+        with self._lock:
+            self._record(False)
+            self._failures_in_row += 1
+
+            if self.state == HALF_OPEN:
+                self._probe_in_flight = False
+                self._open(f"probe failed: {reason}")
+                return
+
+            if self.state == CLOSED:
+                total = len(self._calls)
+                failures = sum(1 for _, ok in self._calls if not ok)
+                if self._failures_in_row >= self.consecutive_failures:
+                    self._open(f"{self._failures_in_row} failures in a row: {reason}")
+                elif total >= self.min_calls and failures / total >= self.failure_rate:
+                    self._open(f"error rate {failures}/{total}: {reason}")
+
+    def _record(self, ok: bool):
+        now = time.time()
+        self._calls.append((now, ok))
+        while self._calls and now - self._calls[0][0] > self.window:
+            self._calls.popleft()
+
+    def _open(self, reason: str):
+        # Експоненційна пауза з джитером, щоб кілька процесів не "билися" в API одночасно
+        self._open_count += 1
+        backoff = min(self.max_backoff, self.base_backoff * 2 ** (self._open_count - 1))
+        backoff = backoff / 2 + random.uniform(0, backoff / 2)
+        self._open_until = time.time() + backoff
+        self._transition(OPEN, f"{reason} (retry in {backoff:.0f}s)")
+
+    def _transition(self, state: str, reason: str):
+        logger.warning(f"🔌 Circuit '{self.name}': {self.state} -> {state} ({reason})")
+        self.transitions.append({
+            'at': round(time.time(), 3),
+            'from': self.state,
+            'to': state,
+            'reason': reason
+        })
+        self.state = state
+
+    def get_state(self) -> Dict[str, Any]:
+        """Стан запобіжника для /health"""
+        with self._lock:
+            total = len(self._calls)
+            failures = sum(1 for _, ok in self._calls if not ok)
+            return {
+                'state': self.state,
+                'window_calls': total,
+                'window_failures': failures,
+                'failures_in_row': self._failures_in_row,
+                'retry_in': round(max(0.0, self._open_until - time.time()), 1) if self.state == OPEN else 0,
+                'rejected': self.rejected,
+                'transitions': list(self.transitions)
+            }
+
+
+class RequestQuota:
+    """Клієнтська квота запитів до одного API: token bucket (за хвилину) + денний ліміт
+
+    Частина квоти (reserve) зберігається для запитів користувачів: фонові запити
+    відхиляються, щойно після них у хвилинному чи денному бюджеті лишилося б менше резерву.
+    """
+
+    def __init__(self, name: str, per_minute: int, daily: int, reserve: float = 0.2):
+        self.name = name
+        self.capacity = max(1, per_minute)
+        self.refill_rate = self.capacity / 60.0  # токенів за секунду
+        self.daily = max(1, daily)
+        self.reserve = reserve
+
+        self._tokens = float(self.capacity)
+        self._refilled_at = time.monotonic()
+        self._day = self._today()
+        self._used_today = 0
+        self._lock = threading.Lock()
+
+        # Лічильники для метрик
+        self.granted = 0
+        self.rejected = {PRIORITY_USER: 0, PRIORITY_BACKGROUND: 0}
+
+    @staticmethod
+    def _today() -> str:
+        # Квоти API скидаються за UTC
+        return datetime.now(timezone.utc).strftime('%Y-%m-%d')
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._refilled_at) * self.refill_rate)
+        self._refilled_at = now
+
+        today = self._today()
+        if today != self._day:
+            self._day = today
+            self._used_today = 0
+
+    def try_acquire(self, cost: int = 1, priority: str = PRIORITY_USER) -> bool:
+        """Списати cost запитів з квоти, якщо це дозволено для цього пріоритету"""
+        cost = min(max(1, cost), self.capacity)
+
+        with self._lock:
+            self._refill()
+            tokens_left = self._tokens - cost
+            daily_left = self.daily - self._used_today - cost
+
+            if priority == PRIORITY_BACKGROUND:
+                allowed = tokens_left >= self.capacity * self.reserve and daily_left >= self.daily * self.reserve
+            else:
+                allowed = tokens_left >= 0 and daily_left >= 0
+
+            if not allowed:
+                self.rejected[priority] = self.rejected.get(priority, 0) + 1
+                return False
+
+            self._tokens = tokens_left
+            self._used_today += cost
+            self.granted += 1
+            return True
+
+    def is_low(self) -> bool:
+        """Чи залишився у квоті лише резерв для користувачів"""
+        with self._lock:
+            self._refill()
+            return (self._tokens < self.capacity * self.reserve or
+                    self.daily - self._used_today < self.daily * self.reserve)
+
+    def get_state(self) -> Dict[str, Any]:
+        """Залишок квоти для /metrics"""
+        with self._lock:
+            self._refill()
+            return {
+                'remaining_today': self.daily - self._used_today,
+                'daily_limit': self.daily,
+                'tokens': round(self._tokens, 1),
+                'per_minute': self.capacity,
+                'granted': self.granted,
+                'rejected': dict(self.rejected)
+            }
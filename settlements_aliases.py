@@ -0,0 +1,98 @@
+# settlements_aliases.py - Альтернативні написання назв населених пунктів
+#
+# Офіційна транслітерація латиницею (постанова КМУ №55 від 27.01.2010)
+# та поширені російські й історичні назви. Використовуються індексами пошуку,
+# щоб "Kyiv", "Odessa", "Днепр" чи "Кіровоград" знаходили потрібне місто.
+from typing import Dict, List, Tuple
+
+# Літери, що на початку слова передаються інакше, ніж в інших позиціях
+_KMU_INITIAL = {
+    'є': 'ye', 'ї': 'yi', 'й': 'y', 'ю': 'yu', 'я': 'ya'
+}
+
+_KMU = {
+    'а': 'a', 'б': 'b', 'в': 'v', 'г': 'h', 'ґ': 'g', 'д': 'd', 'е': 'e',
+    'є': 'ie', 'ж': 'zh', 'з': 'z', 'и': 'y', 'і': 'i', 'ї': 'i', 'й': 'i',
+    'к': 'k', 'л': 'l', 'м': 'm', 'н': 'n', 'о': 'o', 'п': 'p', 'р': 'r',
+    'с': 's', 'т': 't', 'у': 'u', 'ф': 'f', 'х': 'kh', 'ц': 'ts', 'ч': 'ch',
+    'ш': 'sh', 'щ': 'shch', 'ь': '', 'ю': 'iu', 'я': 'ia',
+    "'": '', '’': '', 'ʼ': '', '`': ''
+}
+
+
+def transliterate(name: str) -> str:
+    """Транслітерація латиницею за правилами КМУ-2010 ("Згурівка" -> "Zghurivka")"""
+    result = []
+    word_start = True
+    previous = ''
+
+    for char in name:
+        lower = char.lower()
+        if lower in _KMU:
+            if word_start and lower in _KMU_INITIAL:
+                latin = _KMU_INITIAL[lower]
+            elif lower == 'г' and previous == 'з':
+                # Сполучення "зг" передається як "zgh", щоб не плутати з "ж"
+                latin = 'gh'
+            else:
+                latin = _KMU[lower]
+            if char != lower and latin:
+                latin = latin[0].upper() + latin[1:]
+            result.append(latin)
+            # Апостроф і м'який знак не розривають слово
+            word_start = False
+        else:
+            result.append(char)
+            word_start = not char.isalnum()
+        previous = lower
+
+    return ''.join(result)
+
+
+# (назва, область) -> російські, історичні та поширені латинські назви.
+# Перейменовані у 2016 році міста шукаються і за старими назвами.
+# Поширені латинські форми з Config.DEFAULT_CITIES (напр. "Odessa") теж тут.
+LEGACY_NAMES: Dict[Tuple[str, str], List[str]] = {
+    ('Київ', 'Київська'): ['Киев', 'Kiev'],
+    ('Харків', 'Харківська'): ['Харьков', 'Kharkov'],
+    ('Одеса', 'Одеська'): ['Одесса', 'Odessa'],
+    ('Дніпро', 'Дніпропетровська'): ['Днепр', 'Днепропетровськ', 'Днепропетровск', 'Dnepr', 'Dnipropetrovsk', 'Dnepropetrovsk'],
+    ('Запоріжжя', 'Запорізька'): ['Запорожье', 'Zaporozhye', 'Zaporozhe'],
+    ('Львів', 'Львівська'): ['Львов', 'Lvov', 'Lwow', 'Lemberg'],
+    ('Миколаїв', 'Миколаївська'): ['Николаев', 'Nikolaev', 'Nikolayev'],
+    ('Кропивницький', 'Кіровоградська'): ['Кіровоград', 'Кировоград', 'Кропивницкий', 'Kirovograd', 'Kirovohrad'],
+    ('Вінниця', 'Вінницька'): ['Винница', 'Vinnitsa'],
+    ('Житомир', 'Житомирська'): ['Zhitomir'],
+    ('Рівне', 'Рівненська'): ['Ровно', 'Rovno'],
+    ('Луцьк', 'Волинська'): ['Луцк'],
+    ('Тернопіль', 'Тернопільська'): ['Тернополь', 'Ternopol'],
+    ('Хмельницький', 'Хмельницька'): ['Хмельницкий', 'Проскурів', 'Khmelnitsky'],
+    ('Івано-Франківськ', 'Івано-Франківська'): ['Ивано-Франковск', 'Станіслав', 'Ivano-Frankovsk'],
+    ('Ужгород', 'Закарпатська'): ['Uzhgorod'],
+    ('Чернівці', 'Чернівецька'): ['Черновцы', 'Chernovtsy', 'Czernowitz'],
+    ('Чернігів', 'Чернігівська'): ['Чернигов', 'Chernigov'],
+    ('Черкаси', 'Черкаська'): ['Черкассы', 'Cherkassy'],
+    ('Суми', 'Сумська'): ['Сумы'],
+    ('Кривий Ріг', 'Дніпропетровська'): ['Кривой Рог', 'Krivoy Rog'],
+    ('Кам\'янське', 'Дніпропетровська'): ['Дніпродзержинськ', 'Днепродзержинск', 'Каменское'],
+    ('Біла Церква', 'Київська'): ['Белая Церковь'],
+    ('Торецьк', 'Донецька'): ['Дзержинськ', 'Дзержинск'],
+    ('Слов\'янськ', 'Донецька'): ['Славянск', 'Slavyansk'],
+    ('Краматорськ', 'Донецька'): ['Краматорск'],
+    ('Маріуполь', 'Донецька'): ['Мариуполь'],
+    ('Горішні Плавні', 'Полтавська'): ['Комсомольськ', 'Комсомольск'],
+    ('Чорноморськ', 'Одеська'): ['Іллічівськ', 'Ильичевск'],
+    ('Сімферополь', 'АР Крим'): ['Симферополь'],
+}
+
+
+def alternate_names(name: str, region: str) -> List[str]:
+    """Усі альтернативні написання для пошуку (без самої назви)"""
+    names = [transliterate(name)]
+    names.extend(LEGACY_NAMES.get((name, region), ()))
+
+    unique = []
+    for alternate in names:
+        if alternate and alternate != name and alternate not in unique:
+            unique.append(alternate)
+    return unique
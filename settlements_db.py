@@ -1,1726 +1,326 @@
 # settlements_db.py
 import json
 import os
+import time
+import heapq
+import hashlib
+import tempfile
+import itertools
+import threading
+from collections import Counter
 from typing import Dict, List, Optional, Tuple
 import logging
 
+from settlements_aliases import alternate_names
+from settlements_index import FuzzyIndex, LookupIndex, PrefixIndex, SpatialIndex
+from settlements_store import (DEFAULT_DATASET_PATH, SNAPSHOT_VERSION, DatasetError, check_dataset, diff_records,
+                               load_dataset, map_snapshot, source_hash, write_snapshot)
+from settlements_table import SettlementTable, SettlementView, SettlementsByName
+
 logger = logging.getLogger(__name__)
 
+# Версії даних унікальні в межах процесу - і для змін однієї бази, і для нових знімків після перезавантаження
+_data_versions = itertools.count(1)
+
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+# Код, від якого залежить вміст файлу-знімка: знімок старої версії коду не підхоплюється
+_SNAPSHOT_CODE_FILES = ('settlements_table.py', 'settlements_index.py', 'settlements_aliases.py')
+_snapshot_code: Optional[str] = None
+
+
+def snapshot_path(dataset_version: str, directory: Optional[str] = None) -> str:
+    """Файл-знімок (таблиця + індекси пошуку, крім нечіткого) для версії бази
+
+    Спільний для всіх процесів хоста: каталог SETTLEMENTS_SNAPSHOT_DIR або тимчасовий каталог системи.
+    """
+    global _snapshot_code
+    if _snapshot_code is None:
+        digest = hashlib.sha256(str(SNAPSHOT_VERSION).encode())
+        for name in _SNAPSHOT_CODE_FILES:
+            with open(os.path.join(_ROOT, name), 'rb') as f:
+                digest.update(f.read())
+        _snapshot_code = digest.hexdigest()[:8]
+    directory = directory or os.getenv('SETTLEMENTS_SNAPSHOT_DIR') or tempfile.gettempdir()
+    return os.path.join(directory, f"settlements-{dataset_version}-{_snapshot_code}.snap")
+
+
+def remove_replaced_snapshot(path: str) -> bool:
+    """Видалити знімок версії, яку цей процес щойно замінив при перезавантаженні
+
+    Інші знімки каталогу не чіпаємо: їх можуть використовувати воркери, ще не
+    перезавантажені, процеси іншої версії коду (поступовий деплой) чи інший бот
+    на тому ж хості. Видалення не зачіпає наявних відображень (POSIX) - воркери
+    зі старою версією читають її до власного перезавантаження.
+    """
+    try:
+        os.remove(path)
+    except OSError as e:
+        # Уже видалив інший воркер або файл відображено (Windows)
+        logger.debug(f"Settlements snapshot {path} not removed: {e}")
+        return False
+    logger.info(f"🧹 Removed replaced settlements snapshot {path}")
+    return True
+
+
 class UkraineSettlementsDB:
-    def __init__(self):
-        self.settlements = {}
-        self._load_extended_database()
+    def __init__(self, dataset_path: Optional[str] = None, use_compiled: Optional[bool] = None,
+                 use_mmap: Optional[bool] = None):
+        # Версія файлу бази (хеш вмісту) або 'source', якщо база завантажена з settlements_source.py
+        self.dataset_version = 'source'
+        self.dataset_path = None
+        # Файл-знімок, з якого відображені таблиця та індекси (None - усе в пам'яті процесу)
+        self.snapshot_path = None
+        self._set_table(SettlementTable())
+        
+        # За замовчуванням база читається зі скомпільованого файлу (Utils/build_settlements.py);
+        # виклики _add_settlement у settlements_source.py - формат редагування і запасний варіант
+        if use_compiled is None:
+            use_compiled = os.getenv('SETTLEMENTS_USE_COMPILED', '1') != '0'
+        # Кілька воркерів на одному хості: таблиця та індекси - спільний для всіх процесів mmap-знімок
+        if use_mmap is None:
+            use_mmap = os.getenv('SETTLEMENTS_MMAP', '0') == '1'
+        dataset_path = dataset_path or os.getenv('SETTLEMENTS_DATASET', DEFAULT_DATASET_PATH)
+        
+        if not (use_compiled and self._load_compiled_database(dataset_path, use_mmap)):
+            self._load_extended_database()
+        if self._lookup_index is None:
+            self._build_indexes()
         logger.info(f"Завантажено {len(self.settlements)} населених пунктів")
     
+    def _load_compiled_database(self, path: str, use_mmap: bool = False) -> bool:
+        """Завантажити базу з бінарного файлу; False - якщо файл відсутній або застарів"""
+        if not os.path.exists(path):
+            logger.info(f"Compiled settlements dataset not found ({path}), loading from source")
+            return False
+        
+        # Файл з репозиторію має відповідати settlements_source.py; явно вказаний файл
+        # (SETTLEMENTS_DATASET, виправлення без редеплою) приймається будь-якої версії
+        expected_hash = source_hash() if os.path.abspath(path) == DEFAULT_DATASET_PATH else None
+        try:
+            if use_mmap:
+                # Знімок цієї версії вже записав інший процес - лише відображаємо його
+                snapshot = snapshot_path(check_dataset(path, expected_hash=expected_hash))
+                if os.path.exists(snapshot) and self._try_map_snapshot(snapshot, path):
+                    return True
+            version, records = load_dataset(path, expected_hash=expected_hash)
+        except (OSError, DatasetError) as e:
+            logger.warning(f"⚠️ Compiled settlements dataset ignored: {e}")
+            return False
+        
+        self._set_table(SettlementTable.from_records(records))
+        self.dataset_version = version
+        self.dataset_path = path
+        logger.info(f"✅ Loaded {len(records)} settlement records from {path} (version {version})")
+        
+        if use_mmap:
+            # Перший процес будує індекси і записує знімок; далі працює з відображенням, як і решта
+            try:
+                self.save_snapshot(snapshot)
+            except OSError as e:
+                logger.warning(f"⚠️ Settlements snapshot not written, using process memory: {e}")
+            else:
+                self._try_map_snapshot(snapshot, path)
+        return True
+    
+    def save_snapshot(self, path: str) -> int:
+        """Записати таблицю та індекси (крім нечіткого) у файл-знімок, повернути його розмір"""
+        self.warm_indexes(fuzzy=False)
+        meta = {'dataset_version': self.dataset_version}
+        arrays = {}
+        for section, part in (('table', self.table), ('lookup', self._lookup_index),
+                              ('prefix', self._prefix_index), ('spatial', self._spatial_index)):
+            meta[section], part_arrays = part.to_snapshot()
+            arrays.update((f"{section}.{name}", values) for name, values in part_arrays.items())
+        return write_snapshot(path, meta, arrays)
+    
+    def _map_snapshot(self, path: str):
+        """Перейти на відображений у пам'ять знімок: колонки й індекси читаються зі сторінок файлу"""
+        meta, arrays = map_snapshot(path)
+        sections = {}
+        for name, values in arrays.items():
+            section, _, field = name.partition('.')
+            sections.setdefault(section, {})[field] = values
+        
+        try:
+            table = SettlementTable.from_snapshot(meta['table'], sections['table'])
+            lookup_index = LookupIndex.from_snapshot(table, sections['lookup'])
+            prefix_index = PrefixIndex.from_snapshot(meta['prefix'], sections['prefix'])
+            spatial_index = SpatialIndex.from_snapshot(meta['spatial'], sections['spatial'])
+        except KeyError as e:
+            raise DatasetError(f"{path}: snapshot has no {e}")
+        
+        self._set_table(table)
+        self._prefix_index = prefix_index
+        self._spatial_index = spatial_index
+        self._lookup_index = lookup_index
+        self.dataset_version = meta['dataset_version']
+        self.snapshot_path = path
+    
+    def _try_map_snapshot(self, path: str, dataset_path: Optional[str]) -> bool:
+        try:
+            self._map_snapshot(path)
+        except (OSError, DatasetError) as e:
+            logger.warning(f"⚠️ Settlements snapshot ignored: {e}")
+            return False
+        self.dataset_path = dataset_path
+        logger.info(f"✅ Mapped {len(self.table)} settlement records from {path} (version {self.dataset_version})")
+        return True
+    
+    @classmethod
+    def from_records(cls, records, dataset_version: str = 'records',
+                     dataset_path: Optional[str] = None) -> 'UkraineSettlementsDB':
+        """База з довільних записів (без завантаження файлу); індекси будуються при першому пошуку"""
+        db = cls.__new__(cls)
+        db.dataset_version = dataset_version
+        db.dataset_path = dataset_path
+        db.snapshot_path = None
+        db._set_table(SettlementTable.from_records(records))
+        return db
+    
+    @classmethod
+    def from_snapshot(cls, path: str, dataset_path: Optional[str] = None) -> 'UkraineSettlementsDB':
+        """База поверх файлу-знімка (save_snapshot), без копіювання колонок та індексів у пам'ять процесу"""
+        db = cls.from_records((), dataset_path=dataset_path)
+        db._map_snapshot(path)
+        return db
+    
+    def _set_table(self, table: SettlementTable):
+        # Записи - у колонковій таблиці; self.settlements - сумісне представлення назва -> [словники]
+        self.table = table
+        self.settlements = SettlementsByName(table)
+        self._invalidate_indexes()
+    
+    def iter_records(self):
+        """Усі записи, згруповані за назвою: (назва, lat, lon, область, тип, населення)"""
+        return self.table.iter_records()
+    
     def _load_extended_database(self):
-        """Завантаження розширеної бази населених пунктів України"""
-        # ========== ДОНЕЦЬКА ОБЛАСТЬ ==========
-        # Слов'янськ та околиці
-        self._add_settlement("Слов'янськ", 48.8531, 37.6050, "Донецька", "місто", 106000)
-        self._add_settlement("Краматорськ", 48.7392, 37.5839, "Донецька", "місто", 157000)
-        self._add_settlement("Дружківка", 48.6167, 37.5333, "Донецька", "місто", 59000)
-        self._add_settlement("Костянтинівка", 48.5278, 37.7056, "Донецька", "місто", 70000)
-        self._add_settlement("Лиман", 48.9833, 37.8167, "Донецька", "місто", 22000)
-        self._add_settlement("Святогірськ", 49.0333, 37.5667, "Донецька", "місто", 4500)
-        
-        # Населені пункти навколо Слов'янська
-        self._add_settlement("Андріївка", 48.9333, 37.6833, "Донецька", "селище", 2500)
-        self._add_settlement("Билбасівка", 48.8500, 37.5500, "Донецька", "село", 1800)
-        self._add_settlement("Бражине", 48.8833, 37.5167, "Донецька", "село", 1200)
-        self._add_settlement("Григорівка", 48.9167, 37.7500, "Донецька", "село", 800)
-        self._add_settlement("Дмитрівка", 48.9667, 37.6000, "Донецька", "село", 1500)
-        self._add_settlement("Донецьке", 48.8667, 37.6667, "Донецька", "село", 900)
-        self._add_settlement("Закітне", 48.9167, 37.6333, "Донецька", "село", 1100)
-        self._add_settlement("Кам'янка", 48.9500, 37.5333, "Донецька", "село", 700)
-        self._add_settlement("Карпівка", 48.9667, 37.6833, "Донецька", "село", 600)
-        self._add_settlement("Красноармійське", 48.9333, 37.6167, "Донецька", "село", 1300)
-        self._add_settlement("Миколаївка", 48.9000, 37.7000, "Донецька", "село", 1600)
-        self._add_settlement("Новодмитрівка", 48.9833, 37.6500, "Донецька", "село", 1400)
-        self._add_settlement("Олександрівка", 48.9167, 37.5833, "Донецька", "село", 1000)
-        self._add_settlement("Привілля", 48.8833, 37.6167, "Донецька", "село", 1700)
-        self._add_settlement("Райгородок", 48.8667, 37.7167, "Донецька", "село", 1900)
-        self._add_settlement("Серебрянка", 48.9167, 37.6667, "Донецька", "село", 2200)
-        self._add_settlement("Тетянівка", 48.9333, 37.5333, "Донецька", "село", 1100)
-        self._add_settlement("Червоний Лиман", 48.9667, 37.7667, "Донецька", "село", 800)
-        
-        # Населені пункти навколо Краматорська
-        self._add_settlement("Абазівка", 48.7833, 37.5167, "Донецька", "село", 900)
-        self._add_settlement("Біленьке", 48.7667, 37.5500, "Донецька", "село", 1200)
-        self._add_settlement("Білокузьминівка", 48.7167, 37.6167, "Донецька", "селище", 3500)
-        self._add_settlement("Велика Камишуваха", 48.6667, 37.4833, "Донецька", "село", 1800)
-        self._add_settlement("Галицинівка", 48.7000, 37.5333, "Донецька", "село", 1100)
-        self._add_settlement("Грузько-Зорянське", 48.6833, 37.6667, "Донецька", "село", 1300)
-        self._add_settlement("Іванопілля", 48.7333, 37.6833, "Донецька", "село", 1500)
-        self._add_settlement("Іллінка", 48.7500, 37.6000, "Донецька", "село", 1600)
-        self._add_settlement("Крамарка", 48.8000, 37.6500, "Донецька", "село", 1400)
-        self._add_settlement("Красноторка", 48.7667, 37.6833, "Донецька", "селище", 8000)
-        self._add_settlement("Малотаранівка", 48.6833, 37.6167, "Донецька", "село", 900)
-        self._add_settlement("Новоекономічне", 48.7000, 37.5833, "Донецька", "село", 1700)
-        self._add_settlement("Олексієво-Дружківка", 48.6333, 37.6167, "Донецька", "селище", 4200)
-        self._add_settlement("Пантелеймонівка", 48.7333, 37.5333, "Донецька", "село", 1900)
-        self._add_settlement("Петрівка", 48.6833, 37.5333, "Донецька", "село", 1100)
-        self._add_settlement("Привілне", 48.7167, 37.6833, "Донецька", "село", 1300)
-        self._add_settlement("Рай-Олександрівка", 48.7500, 37.6667, "Донецька", "село", 1500)
-        self._add_settlement("Семенівка", 48.7833, 37.5833, "Донецька", "село", 1600)
-        self._add_settlement("Софіївка", 48.7000, 37.6500, "Донецька", "село", 1400)
-        self._add_settlement("Шабельківка", 48.7667, 37.6167, "Донецька", "селище", 5500)
-        self._add_settlement("Ясна Поляна", 48.6833, 37.5833, "Донецька", "село", 1200)
-        self._add_settlement("Ясногірка", 48.7333, 37.6167, "Донецька", "селище", 6800)
-        
-        # Додаткові міста Донецької області
-        self._add_settlement("Донецьк", 48.0159, 37.8028, "Донецька", "обласний центр", 901000)
-        self._add_settlement("Маріуполь", 47.0971, 37.5434, "Донецька", "місто", 431000)
-        self._add_settlement("Макіївка", 48.0556, 38.0647, "Донецька", "місто", 344000)
-        self._add_settlement("Горлівка", 48.3056, 38.0297, "Донецька", "місто", 242000)
-        self._add_settlement("Єнакієве", 48.2311, 38.2053, "Донецька", "місто", 79300)
-        self._add_settlement("Харцизьк", 48.0333, 38.1500, "Донецька", "місто", 59000)
-        self._add_settlement("Шахтарськ", 48.0333, 38.4833, "Донецька", "місто", 51800)
-        self._add_settlement("Сніжне", 48.0333, 38.7667, "Донецька", "місто", 47800)
-        self._add_settlement("Торецьк", 48.3983, 37.8617, "Донецька", "місто", 34600)
-        self._add_settlement("Ясинувата", 48.1167, 37.8333, "Донецька", "місто", 35800)
-        self._add_settlement("Авдіївка", 48.1333, 37.7500, "Донецька", "місто", 32000)
-        self._add_settlement("Добропілля", 48.4667, 37.0833, "Донецька", "місто", 29200)
-        self._add_settlement("Волноваха", 47.6011, 37.4964, "Донецька", "місто", 21700)
-        
-        # ========== ВСІ ОБЛАСНІ ЦЕНТРИ ==========
-        self._add_settlement("Київ", 50.4501, 30.5234, "Київська", "столиця", 2967000)
-        self._add_settlement("Вінниця", 49.2328, 28.4816, "Вінницька", "обласний центр", 369000)
-        self._add_settlement("Луцьк", 50.7472, 25.3254, "Волинська", "обласний центр", 217000)
-        self._add_settlement("Дніпро", 48.4647, 35.0462, "Дніпропетровська", "обласний центр", 966000)
-        self._add_settlement("Житомир", 50.2547, 28.6587, "Житомирська", "обласний центр", 261000)
-        self._add_settlement("Ужгород", 48.6208, 22.2879, "Закарпатська", "обласний центр", 115000)
-        self._add_settlement("Запоріжжя", 47.8229, 35.1903, "Запорізька", "обласний центр", 722000)
-        self._add_settlement("Івано-Франківськ", 48.9226, 24.7111, "Івано-Франківська", "обласний центр", 238000)
-        self._add_settlement("Кропивницький", 48.5132, 32.2597, "Кіровоградська", "обласний центр", 222000)
-        self._add_settlement("Львів", 49.8397, 24.0297, "Львівська", "обласний центр", 717000)
-        self._add_settlement("Миколаїв", 46.9750, 31.9946, "Миколаївська", "обласний центр", 480000)
-        self._add_settlement("Одеса", 46.4825, 30.7233, "Одеська", "обласний центр", 1017000)
-        self._add_settlement("Полтава", 49.5883, 34.5514, "Полтавська", "обласний центр", 279000)
-        self._add_settlement("Рівне", 50.6199, 26.2516, "Рівненська", "обласний центр", 246000)
-        self._add_settlement("Суми", 50.9077, 34.7981, "Сумська", "обласний центр", 259000)
-        self._add_settlement("Тернопіль", 49.5535, 25.5948, "Тернопільська", "обласний центр", 225000)
-        self._add_settlement("Харків", 49.9935, 36.2304, "Харківська", "обласний центр", 1441000)
-        self._add_settlement("Херсон", 46.6354, 32.6169, "Херсонська", "обласний центр", 283000)
-        self._add_settlement("Хмельницький", 49.4220, 26.9841, "Хмельницька", "обласний центр", 274000)
-        self._add_settlement("Черкаси", 49.4444, 32.0598, "Черкаська", "обласний центр", 269000)
-        self._add_settlement("Чернівці", 48.2921, 25.9358, "Чернівецька", "обласний центр", 265000)
-        self._add_settlement("Чернігів", 51.4982, 31.2893, "Чернігівська", "обласний центр", 286000)
-        self._add_settlement("Луганськ", 48.5736, 39.3078, "Луганська", "обласний центр", 401000)
-        self._add_settlement("Сімферополь", 44.9521, 34.1024, "АР Крим", "обласний центр", 332000)
-        self._add_settlement("Севастополь", 44.6167, 33.5254, "АР Крим", "місто", 343000)
-        
-        # ========== ІНШІ ВЕЛИКІ МІСТА ==========
-        self._add_settlement("Кривий Ріг", 47.9105, 33.3918, "Дніпропетровська", "місто", 612000)
-        self._add_settlement("Кам'янське", 48.5076, 34.6132, "Дніпропетровська", "місто", 235000)
-        self._add_settlement("Кременчук", 49.0667, 33.4167, "Полтавська", "місто", 217000)
-        self._add_settlement("Мелітополь", 46.8489, 35.3653, "Запорізька", "місто", 150000)
-        self._add_settlement("Біла Церква", 49.7956, 30.1167, "Київська", "місто", 208000)
-        self._add_settlement("Нікополь", 47.5667, 34.4000, "Дніпропетровська", "місто", 110000)
-        self._add_settlement("Павлоград", 48.5200, 35.8700, "Дніпропетровська", "місто", 105000)
-        self._add_settlement("Бердянськ", 46.7590, 36.7869, "Запорізька", "місто", 107000)
-        self._add_settlement("Євпаторія", 45.1906, 33.3675, "АР Крим", "місто", 106000)
-        self._add_settlement("Керч", 45.3567, 36.4758, "АР Крим", "місто", 147000)
-        
-        # ========== СЕЛА ТА СЕЛИЩА КИЇВСЬКОЇ ОБЛАСТІ ==========
-        self._add_settlement("Вишневе", 50.3869, 30.3639, "Київська", "місто", 39000)
-        self._add_settlement("Ірпінь", 50.5167, 30.2500, "Київська", "місто", 60000)
-        self._add_settlement("Буча", 50.5500, 30.2167, "Київська", "місто", 36000)
-        self._add_settlement("Боярка", 50.3300, 30.2889, "Київська", "місто", 35000)
-        self._add_settlement("Гостомель", 50.5833, 30.2667, "Київська", "селище", 17000)
-        self._add_settlement("Ворзель", 50.5500, 30.1500, "Київська", "селище", 6500)
-        self._add_settlement("Іванків", 50.9333, 29.9000, "Київська", "селище", 11000)
-        
-        # ========== ЛЬВІВСЬКА ОБЛАСТЬ ==========
-        self._add_settlement("Стрий", 49.2553, 23.8506, "Львівська", "місто", 59000)
-        self._add_settlement("Дрогобич", 49.3500, 23.5000, "Львівська", "місто", 74000)
-        self._add_settlement("Червоноград", 50.3833, 24.2333, "Львівська", "місто", 65000)
-        self._add_settlement("Самбір", 49.5167, 23.2000, "Львівська", "місто", 34000)
-        
-        # ========== ХАРКІВСЬКА ОБЛАСТЬ ==========
-        self._add_settlement("Ізюм", 49.2125, 37.2617, "Харківська", "місто", 46000)
-        self._add_settlement("Лозова", 48.8833, 36.3167, "Харківська", "місто", 57000)
-        self._add_settlement("Первомайський", 49.3833, 36.2167, "Харківська", "місто", 29000)
-        self._add_settlement("Балаклія", 49.4567, 36.8511, "Харківська", "місто", 27000)
-        
-        # ========== СЕЛА ТА СЕЛИЩА ДОНЕЦЬКОЇ ОБЛАСТІ ==========
-        # Додаткові населені пункти околиць Слов'янська
-        self._add_settlement("Барвінкове", 48.9000, 37.5000, "Донецька", "село", 950)
-        self._add_settlement("Веселе", 48.8833, 37.6833, "Донецька", "село", 850)
-        self._add_settlement("Володимирівка", 48.9333, 37.6667, "Донецька", "село", 1100)
-        self._add_settlement("Горлівка (село)", 48.8500, 37.5667, "Донецька", "село", 1400)
-        self._add_settlement("Заможне", 48.9167, 37.5833, "Донецька", "село", 1200)
-        self._add_settlement("Зоряне", 48.9000, 37.6333, "Донецька", "село", 1000)
-        self._add_settlement("Калинівка", 48.9500, 37.6000, "Донецька", "село", 750)
-        self._add_settlement("Комунар", 48.8667, 37.5333, "Донецька", "селище", 3200)
-        self._add_settlement("Красний Лиман", 48.9667, 37.7167, "Донецька", "село", 650)
-        self._add_settlement("Лісне", 48.9000, 37.6833, "Донецька", "село", 800)
-        self._add_settlement("Майдан", 48.9333, 37.6167, "Донецька", "село", 900)
-        self._add_settlement("Новоселівка", 48.8833, 37.6667, "Донецька", "село", 1150)
-        self._add_settlement("Олександрівка (Слов'янськ)", 48.9000, 37.5833, "Донецька", "село", 1300)
-        self._add_settlement("Підгірне", 48.9167, 37.6000, "Донецька", "село", 950)
-        self._add_settlement("Пролетарське", 48.8667, 37.5833, "Донецька", "селище", 2800)
-        self._add_settlement("Соснівка", 48.9500, 37.6667, "Донецька", "село", 850)
-        self._add_settlement("Троїцьке", 48.9167, 37.7000, "Донецька", "село", 1050)
-        self._add_settlement("Червоний Прапор", 48.8833, 37.7167, "Донецька", "селище", 1900)
-        self._add_settlement("Шевченка", 48.9333, 37.7000, "Донецька", "село", 1250)
-        
-                # ========== СЛОВ'ЯНСЬКА МІСЬКА ГРОМАДА ==========
-        self._add_settlement("Оріхуватка", 48.8908, 37.6017, "Донецька", "село", 3500)
-        self._add_settlement("Теплянка", 48.8750, 37.5750, "Донецька", "село", 2800)
-        self._add_settlement("Рай-Олександрівка", 48.9681, 37.6611, "Донецька", "село", 2200)
-        self._add_settlement("Михайлівка", 48.9069, 37.6861, "Донецька", "село", 1800)
-        self._add_settlement("Червоний Шахтар", 48.8669, 37.5469, "Донецька", "селище", 4200)
-        self._add_settlement("Слов'янська Січ", 48.8569, 37.6208, "Донецька", "селище", 3100)
-        self._add_settlement("Залізничне", 48.8369, 37.5711, "Донецька", "селище", 2500)
-        self._add_settlement("Новоселівка (Оріхуватська)", 48.9028, 37.6250, "Донецька", "село", 1500)
-        self._add_settlement("Водяне", 48.9167, 37.5833, "Донецька", "село", 1200)
-        self._add_settlement("Зарічне", 48.9067, 37.5900, "Донецька", "село", 1100)
-        self._add_settlement("Лісове", 48.8950, 37.5750, "Донецька", "село", 900)
-        self._add_settlement("Підлісне", 48.8856, 37.5958, "Донецька", "село", 850)
-        self._add_settlement("Соснове", 48.9056, 37.6150, "Донецька", "село", 950)
-        self._add_settlement("Улянівка", 48.8933, 37.5858, "Донецька", "село", 800)
-        self._add_settlement("Червоний Яр", 48.9008, 37.5789, "Донецька", "село", 700)
-        
-        # ========== ДРУГІ НАСЕЛЕНІ ПУНКТИ СЛОВ'ЯНСЬКОГО РАЙОНУ ==========
-        self._add_settlement("Богородичне", 48.8500, 37.5000, "Донецька", "село", 2400)
-        self._add_settlement("Бразолове", 48.8333, 37.5333, "Донецька", "село", 1800)
-        self._add_settlement("Долина", 48.8667, 37.5333, "Донецька", "село", 1600)
-        self._add_settlement("Кам'янка (Слов'янський район)", 48.9167, 37.4333, "Донецька", "село", 1400)
-        self._add_settlement("Мазанівка", 48.8833, 37.4667, "Донецька", "село", 1900)
-        self._add_settlement("Нова Дмитрівка", 48.9000, 37.4833, "Донецька", "село", 1300)
-        self._add_settlement("Новоандріївка", 48.8500, 37.4500, "Донецька", "село", 1700)
-        self._add_settlement("Новоолександрівка", 48.8667, 37.4667, "Донецька", "село", 1500)
-        self._add_settlement("Олексіївка", 48.8333, 37.4833, "Донецька", "село", 1200)
-        self._add_settlement("Петрівське (Слов'янський район)", 48.9000, 37.4333, "Донецька", "село", 1100)
-        self._add_settlement("Прелесне", 48.8833, 37.4833, "Донецька", "село", 1000)
-        self._add_settlement("Райгородок (Слов'янський район)", 48.8167, 37.5000, "Донецька", "село", 2100)
-        self._add_settlement("Семенівка (Слов'янський район)", 48.8667, 37.4500, "Донецька", "село", 1400)
-        self._add_settlement("Софіївка (Слов'янський район)", 48.8500, 37.4667, "Донецька", "село", 1600)
-        self._add_settlement("Шевченка (Слов'янський район)", 48.8333, 37.4500, "Донецька", "село", 1300)
-        
-        # ========== КРАМАТОРСЬКА МІСЬКА ГРОМАДА ==========
-        self._add_settlement("Іллінка", 48.7442, 37.6000, "Донецька", "село", 3200)
-        self._add_settlement("Новодонецьке", 48.6333, 37.4833, "Донецька", "селище", 4100)
-        self._add_settlement("Сергіївка", 48.7050, 37.5333, "Донецька", "село", 2800)
-        self._add_settlement("Софіївка (Краматорський район)", 48.7167, 37.4500, "Донецька", "село", 2400)
-        self._add_settlement("Шевченка (Краматорський район)", 48.6833, 37.4333, "Донецька", "село", 1900)
-        self._add_settlement("Берестовенька", 48.6561, 37.5228, "Донецька", "село", 2200)
-        self._add_settlement("Весела Долина", 48.6356, 37.5389, "Донецька", "селище", 3500)
-        self._add_settlement("Гірницьке", 48.6986, 37.5806, "Донецька", "селище", 3900)
-        self._add_settlement("Дружне", 48.6461, 37.5667, "Донецька", "селище", 3100)
-        self._add_settlement("Затишшя", 48.6583, 37.5833, "Донецька", "село", 1800)
-        self._add_settlement("Калинівка (Краматорський район)", 48.6250, 37.5208, "Донецька", "село", 1600)
-        self._add_settlement("Комуна", 48.6731, 37.5389, "Донецька", "селище", 2700)
-        self._add_settlement("Мирне (Краматорський район)", 48.6450, 37.5556, "Донецька", "село", 1400)
-        self._add_settlement("Новоіванівка", 48.6389, 37.5778, "Донецька", "село", 1300)
-        self._add_settlement("Оріхове", 48.6150, 37.5889, "Донецька", "село", 1100)
-        self._add_settlement("Першотравневе", 48.6267, 37.6000, "Донецька", "село", 1200)
-        self._add_settlement("Петрівське (Краматорський район)", 48.6036, 37.6111, "Донецька", "село", 1500)
-        self._add_settlement("Піщане", 48.5928, 37.6222, "Донецька", "село", 1700)
-        self._add_settlement("Поділля", 48.5833, 37.6333, "Донецька", "село", 1900)
-        self._add_settlement("Пролісне", 48.5750, 37.6444, "Донецька", "село", 1600)
-        self._add_settlement("Світле", 48.5667, 37.6556, "Донецька", "селище", 3300)
-        self._add_settlement("Тарасівка", 48.5583, 37.6667, "Донецька", "село", 1400)
-        self._add_settlement("Урожайне", 48.5500, 37.6778, "Донецька", "село", 1200)
-        self._add_settlement("Федорівка", 48.5417, 37.6889, "Донецька", "село", 1300)
-        self._add_settlement("Хлібодарівка", 48.5333, 37.7000, "Донецька", "село", 1500)
-        self._add_settlement("Цвіточе", 48.5250, 37.7111, "Донецька", "селище", 3800)
-        self._add_settlement("Червоне", 48.5167, 37.7222, "Донецька", "село", 1100)
-        self._add_settlement("Широке", 48.5083, 37.7333, "Донецька", "село", 1400)
-        self._add_settlement("Яблуневе (Краматорський район)", 48.5000, 37.7444, "Донецька", "село", 1300)
-        self._add_settlement("Ясне", 48.4917, 37.7556, "Донецька", "село", 1200)
-        
-        # Додаткові населені пункти околиць Краматорська
-        self._add_settlement("Андріївка (Краматорськ)", 48.7833, 37.5333, "Донецька", "село", 1400)
-        self._add_settlement("Берестове", 48.7167, 37.5667, "Донецька", "село", 1100)
-        self._add_settlement("Богданівка", 48.7333, 37.6500, "Донецька", "село", 1300)
-        self._add_settlement("Василівка", 48.7000, 37.6000, "Донецька", "село", 1050)
-        self._add_settlement("Весняне", 48.7667, 37.6167, "Донецька", "селище", 2100)
-        self._add_settlement("Вільне", 48.6833, 37.5500, "Донецька", "село", 950)
-        self._add_settlement("Гірське", 48.7500, 37.6833, "Донецька", "селище", 3400)
-        self._add_settlement("Дмитрівка (Краматорськ)", 48.7333, 37.5667, "Донецька", "село", 1200)
-        self._add_settlement("Дубове", 48.6833, 37.6333, "Донецька", "село", 850)
-        self._add_settlement("Жовтневе", 48.7667, 37.5333, "Донецька", "селище", 2700)
-        self._add_settlement("Затишне", 48.7167, 37.6833, "Донецька", "село", 1150)
-        self._add_settlement("Калинове", 48.7000, 37.5667, "Донецька", "село", 900)
-        self._add_settlement("Київка", 48.7333, 37.6000, "Донецька", "селище", 3100)
-        self._add_settlement("Кленове", 48.6833, 37.6000, "Донецька", "село", 1000)
-        self._add_settlement("Комуна", 48.7500, 37.5500, "Донецька", "селище", 2500)
-        self._add_settlement("Ленінське", 48.7167, 37.6167, "Донецька", "селище", 3800)
-        self._add_settlement("Мирне", 48.6833, 37.5667, "Донецька", "село", 1100)
-        self._add_settlement("Надія", 48.7000, 37.6500, "Донецька", "село", 950)
-        self._add_settlement("Новоолександрівка", 48.7500, 37.5833, "Донецька", "село", 1350)
-        self._add_settlement("Орлівка", 48.6833, 37.5833, "Донецька", "село", 1200)
-        self._add_settlement("Первомайське (Краматорськ)", 48.7667, 37.6000, "Донецька", "селище", 2900)
-        self._add_settlement("Петрівське", 48.7000, 37.5833, "Донецька", "село", 1050)
-        self._add_settlement("Подільське", 48.7333, 37.5333, "Донецька", "село", 1250)
-        self._add_settlement("Прогрес", 48.6833, 37.6167, "Донецька", "селище", 2200)
-        self._add_settlement("Роздолля", 48.7167, 37.5333, "Донецька", "село", 1150)
-        self._add_settlement("Садки", 48.7500, 37.6333, "Донецька", "селище", 2600)
-        self._add_settlement("Світанок", 48.6833, 37.6500, "Донецька", "село", 900)
-        self._add_settlement("Сонячне", 48.7667, 37.6500, "Донецька", "селище", 2400)
-        self._add_settlement("Українка", 48.7167, 37.6000, "Донецька", "селище", 3200)
-        self._add_settlement("Фрунзе", 48.6833, 37.5333, "Донецька", "селище", 1900)
-        self._add_settlement("Холодне", 48.7000, 37.6833, "Донецька", "село", 850)
-        self._add_settlement("Цвіткове", 48.7333, 37.6667, "Донецька", "селище", 3000)
-        self._add_settlement("Ювілейне", 48.6833, 37.5667, "Донецька", "селище", 1800)
-        self._add_settlement("Яблуневе", 48.7000, 37.6167, "Донецька", "село", 1100)
-        
-        # ========== РАЙОННІ ЦЕНТРИ ТА ІНШІ ВАЖЛИВІ МІСТА ==========
-        # Дніпропетровська область
-        self._add_settlement("Новомосковськ", 48.6333, 35.2167, "Дніпропетровська", "місто", 72000)
-        self._add_settlement("Жовті Води", 48.3500, 33.5167, "Дніпропетровська", "місто", 45000)
-        self._add_settlement("Марганець", 47.6472, 34.6175, "Дніпропетровська", "місто", 46000)
-        self._add_settlement("Синельникове", 48.3183, 35.5100, "Дніпропетровська", "місто", 32000)
-        
-        # Запорізька область
-        self._add_settlement("Енергодар", 47.4989, 34.6558, "Запорізька", "місто", 53000)
-        self._add_settlement("Токмак", 47.2500, 35.7000, "Запорізька", "місто", 32000)
-        
-        # Львівська область
-        self._add_settlement("Борислав", 49.2867, 23.4236, "Львівська", "місто", 33000)
-        self._add_settlement("Трускавець", 49.2806, 23.5056, "Львівська", "місто", 29000)
-        
-                # ========== ЛЬВІВСЬКА ОБЛАСТЬ - ВСІ РАЙОНИ ==========
-        # 1. ЛЬВІВСЬКИЙ РАЙОН (околиці Львова)
-        self._add_settlement("Брюховичі", 49.9000, 23.9500, "Львівська", "селище", 15000)
-        self._add_settlement("Винники", 49.8167, 24.1333, "Львівська", "місто", 18000)
-        self._add_settlement("Рудно", 49.8500, 23.9500, "Львівська", "селище", 32000)
-        self._add_settlement("Щирець", 49.6500, 23.8500, "Львівська", "селище", 5800)
-        self._add_settlement("Давидів", 49.7833, 24.1500, "Львівська", "село", 2100)
-        self._add_settlement("Зимна Вода", 49.8333, 23.9333, "Львівська", "село", 3800)
-        self._add_settlement("Малий Любінь", 49.7167, 23.5500, "Львівська", "село", 1200)
-        self._add_settlement("Підберізці", 49.7667, 24.0833, "Львівська", "село", 1800)
-        self._add_settlement("Підгірці", 49.9333, 24.9833, "Львівська", "село", 900)
-        self._add_settlement("Сокільники", 49.8000, 24.0333, "Львівська", "село", 3500)
-        self._add_settlement("Солонка", 49.7667, 24.0167, "Львівська", "село", 2200)
-
-        # 2. ДРОГОБИЦЬКИЙ РАЙОН
-        self._add_settlement("Стебник", 49.3000, 23.5500, "Львівська", "місто", 21000)
-        self._add_settlement("Меденичі", 49.4167, 23.7500, "Львівська", "селище", 4200)
-        self._add_settlement("Східниця", 49.2167, 23.3500, "Львівська", "селище", 2500)
-        self._add_settlement("Верхнє Синевидне", 49.1000, 23.5833, "Львівська", "село", 1800)
-        self._add_settlement("Доброгостів", 49.4833, 23.5833, "Львівська", "село", 1200)
-        self._add_settlement("Довге", 49.2333, 23.2833, "Львівська", "село", 1500)
-        self._add_settlement("Модричі", 49.5500, 23.5333, "Львівська", "село", 1100)
-        self._add_settlement("Нижанковичі", 49.6833, 23.4833, "Львівська", "село", 1400)
-        self._add_settlement("Ралівка", 49.5000, 23.6167, "Львівська", "село", 900)
-
-        # 3. СТРИЙСЬКИЙ РАЙОН
-        self._add_settlement("Сколів", 49.0333, 23.5167, "Львівська", "місто", 6200)
-        self._add_settlement("Журавно", 49.2333, 24.2667, "Львівська", "селище", 3800)
-        self._add_settlement("Моршин", 49.1500, 23.8667, "Львівська", "місто", 6000)
-        self._add_settlement("Ходорів", 49.4000, 24.3167, "Львівська", "місто", 9800)
-        self._add_settlement("Дашава", 49.2667, 23.9833, "Львівська", "селище", 2500)
-        self._add_settlement("Добряни", 49.3333, 23.8000, "Львівська", "село", 1800)
-        self._add_settlement("Завалля", 49.2000, 23.7000, "Львівська", "село", 2200)
-        self._add_settlement("Конюшки", 49.2833, 23.9333, "Львівська", "село", 1500)
-        self._add_settlement("Лани", 49.3167, 23.7833, "Львівська", "село", 1300)
-        self._add_settlement("Семигинів", 49.2333, 23.9167, "Львівська", "село", 1100)
-        self._add_settlement("Угерсько", 49.2500, 23.7667, "Львівська", "село", 1400)
-
-        # 4. ЧЕРВОНОГРАДСЬКИЙ РАЙОН
-        self._add_settlement("Сокаль", 50.4833, 24.2833, "Львівська", "місто", 21000)
-        self._add_settlement("Белз", 50.3833, 24.0167, "Львівська", "місто", 2400)
-        self._add_settlement("Великі Мости", 50.2333, 24.1333, "Львівська", "місто", 5400)
-        self._add_settlement("Жвирка", 50.0500, 23.9667, "Львівська", "селище", 3200)
-        self._add_settlement("Угнів", 50.3667, 23.7500, "Львівська", "місто", 1000)
-        self._add_settlement("Добротвір", 50.2000, 24.3833, "Львівська", "селище", 6800)
-        self._add_settlement("Дуліби", 50.3167, 24.0833, "Львівська", "село", 900)
-        self._add_settlement("Лопатин", 50.2167, 24.8333, "Львівська", "селище", 3400)
-        self._add_settlement("Старий Яр", 50.2500, 24.3167, "Львівська", "село", 1200)
-
-        # 5. ЯВОРІВСЬКИЙ РАЙОН
-        self._add_settlement("Яворів", 49.9500, 23.3833, "Львівська", "місто", 13000)
-        self._add_settlement("Новояворівське", 49.9333, 23.5667, "Львівська", "місто", 30000)
-        self._add_settlement("Шкло", 49.9667, 23.5167, "Львівська", "селище", 5400)
-        self._add_settlement("Івано-Франкове", 49.9167, 23.7333, "Львівська", "селище", 6800)
-        self._add_settlement("Краковець", 50.0833, 23.1500, "Львівська", "селище", 4200)
-        self._add_settlement("Муроване", 49.8833, 23.5167, "Львівська", "село", 1500)
-        self._add_settlement("Немирів", 50.1167, 23.3833, "Львівська", "село", 1800)
-        self._add_settlement("Старий Яр", 49.9167, 23.6167, "Львівська", "село", 1200)
-        self._add_settlement("Судова Вишня", 49.7833, 23.3667, "Львівська", "місто", 6600)
-
-        # 6. ГОРОДОКСЬКИЙ РАЙОН
-        self._add_settlement("Городок", 49.7833, 23.6500, "Львівська", "місто", 16000)
-        self._add_settlement("Комарно", 49.6333, 23.7000, "Львівська", "місто", 3800)
-        self._add_settlement("Великий Любінь", 49.7167, 23.5333, "Львівська", "селище", 4900)
-        self._add_settlement("Грабовець", 49.7333, 23.8833, "Львівська", "село", 1100)
-        self._add_settlement("Запитів", 49.9333, 23.7333, "Львівська", "село", 1300)
-        self._add_settlement("Колодруби", 49.8333, 23.7667, "Львівська", "село", 900)
-        self._add_settlement("Підгородне", 49.8000, 23.7667, "Львівська", "село", 1500)
-        self._add_settlement("Родатичі", 49.8000, 23.5333, "Львівська", "село", 1200)
-        self._add_settlement("Чижиків", 49.6833, 23.5833, "Львівська", "село", 1000)
-
-        # 7. ЖИДАЧІВСЬКИЙ РАЙОН
-        self._add_settlement("Жидачів", 49.3833, 24.1500, "Львівська", "місто", 11000)
-        self._add_settlement("Бережниця", 49.4500, 24.2167, "Львівська", "село", 1400)
-        self._add_settlement("Гніздичів", 49.3167, 24.1333, "Львівська", "селище", 3200)
-        self._add_settlement("Журавне", 49.2333, 24.2667, "Львівська", "селище", 3800)
-        self._add_settlement("Любша", 49.4167, 24.2833, "Львівська", "село", 1100)
-        self._add_settlement("Монастирець", 49.4833, 24.1667, "Львівська", "село", 1300)
-        self._add_settlement("Новострілища", 49.4833, 24.2167, "Львівська", "село", 1500)
-        self._add_settlement("Станиля", 49.3500, 24.2333, "Львівська", "село", 1200)
-
-        # 8. ЗОЛОЧІВСЬКИЙ РАЙОН
-        self._add_settlement("Золочів", 49.8000, 24.9000, "Львівська", "місто", 24000)
-        self._add_settlement("Глиняни", 49.8167, 24.5167, "Львівська", "місто", 3400)
-        self._add_settlement("Поморяни", 49.6333, 24.9333, "Львівська", "селище", 2500)
-        self._add_settlement("Бібрка", 49.6333, 24.3000, "Львівська", "місто", 3900)
-        self._add_settlement("Зашків", 49.7167, 24.2833, "Львівська", "село", 1300)
-        self._add_settlement("Козівка", 49.8333, 24.7167, "Львівська", "село", 1100)
-        self._add_settlement("Перемишляни", 49.6667, 24.5667, "Львівська", "місто", 7200)
-        self._add_settlement("Підкамінь", 49.9500, 25.3167, "Львівська", "селище", 2800)
-
-        # 9. МОСТИСЬКИЙ РАЙОН
-        self._add_settlement("Мостиська", 49.7833, 23.1500, "Львівська", "місто", 9000)
-        self._add_settlement("Арламівська Воля", 49.8333, 22.9167, "Львівська", "село", 800)
-        self._add_settlement("Гусаків", 49.7167, 23.2000, "Львівська", "село", 1200)
-        self._add_settlement("Мала Горожана", 49.7667, 23.0667, "Львівська", "село", 900)
-        self._add_settlement("Пнікут", 49.7000, 23.1333, "Львівська", "село", 1100)
-        self._add_settlement("Твіржа", 49.6167, 22.8667, "Львівська", "село", 1300)
-        self._add_settlement("Черневе", 49.7333, 23.0000, "Львівська", "село", 1000)
-
-        # 10. ПЕРЕМИШЛЯНСЬКИЙ РАЙОН
-        self._add_settlement("Великі Глібовичі", 49.7333, 24.4500, "Львівська", "село", 1500)
-        self._add_settlement("Дунаїв", 49.7167, 24.9000, "Львівська", "село", 1300)
-        self._add_settlement("Задвір'я", 49.6833, 24.6333, "Львівська", "село", 1100)
-        self._add_settlement("Коросно", 49.6000, 24.7500, "Львівська", "село", 1400)
-        self._add_settlement("Лани", 49.7167, 24.5167, "Львівська", "село", 1200)
-        self._add_settlement("Унів", 49.7167, 24.5333, "Львівська", "селище", 1900)
-
-        # 11. ПУСТОМИТІВСЬКИЙ РАЙОН
-        self._add_settlement("Пустомити", 49.7167, 23.9167, "Львівська", "місто", 11000)
-        self._add_settlement("Сороки-Львівські", 49.7500, 23.8667, "Львівська", "село", 2500)
-        self._add_settlement("Чишки", 49.7833, 24.0333, "Львівська", "село", 1800)
-        self._add_settlement("Шоломинь", 49.8167, 23.8667, "Львівська", "село", 1300)
-
-        # 12. САМБІРСЬКИЙ РАЙОН
-        self._add_settlement("Добромиль", 49.5667, 22.7833, "Львівська", "місто", 4500)
-        self._add_settlement("Новий Калинів", 49.5667, 23.3000, "Львівська", "місто", 4200)
-        self._add_settlement("Рудки", 49.6500, 23.4833, "Львівська", "місто", 5200)
-        self._add_settlement("Старий Самбір", 49.4333, 23.0000, "Львівська", "місто", 5600)
-        self._add_settlement("Терло", 49.5667, 22.7167, "Львівська", "село", 900)
-        self._add_settlement("Хирів", 49.5333, 22.8500, "Львівська", "місто", 4600)
-        self._add_settlement("Сусідовичі", 49.4167, 23.1667, "Львівська", "село", 1500)
-        self._add_settlement("Тершів", 49.5167, 23.3333, "Львівська", "село", 1200)
-
-        # 13. СТАРОСАМБІРСЬКИЙ РАЙОН
-        self._add_settlement("Стрілки", 49.3167, 22.9333, "Львівська", "селище", 2500)
-        self._add_settlement("Тернава", 49.5333, 22.7167, "Львівська", "село", 1100)
-        self._add_settlement("Турка", 49.1500, 23.0333, "Львівська", "місто", 7300)
-        self._add_settlement("Ходовичі", 49.4000, 23.0000, "Львівська", "село", 900)
-        self._add_settlement("Чайковичі", 49.4333, 22.8667, "Львівська", "село", 1300)
-
-        # 14. ТУРКІВСЬКИЙ РАЙОН
-        self._add_settlement("Бориня", 49.0833, 22.9667, "Львівська", "селище", 1800)
-        self._add_settlement("Верхнє Синьовидне", 49.1000, 23.5833, "Львівська", "село", 1800)
-        self._add_settlement("Комарники", 49.0333, 22.9667, "Львівська", "село", 1200)
-        self._add_settlement("Лімна", 49.1833, 22.8500, "Львівська", "село", 1000)
-        self._add_settlement("Нижнє Синьовидне", 49.0667, 23.5833, "Львівська", "село", 1500)
-
-        # 15. ЖОВКІВСЬКИЙ РАЙОН (колишній)
-        self._add_settlement("Жовква", 50.0667, 23.9667, "Львівська", "місто", 14000)
-        self._add_settlement("Куликів", 49.9833, 24.0833, "Львівська", "селище", 4500)
-        self._add_settlement("Магерів", 50.0667, 24.0833, "Львівська", "селище", 3200)
-        self._add_settlement("Рава-Руська", 50.2333, 23.6167, "Львівська", "місто", 8500)
-        self._add_settlement("Великі Підліски", 50.1500, 23.8167, "Львівська", "село", 1300)
-        self._add_settlement("Деревня", 50.1333, 23.7667, "Львівська", "село", 1100)
-
-        # 16. БУСЬКИЙ РАЙОН (колишній)
-        self._add_settlement("Буськ", 49.9667, 24.6167, "Львівська", "місто", 8700)
-        self._add_settlement("Красне", 49.9167, 24.6167, "Львівська", "селище", 3800)
-        self._add_settlement("Олесько", 49.9667, 24.9000, "Львівська", "селище", 1500)
-        self._add_settlement("Соколівка", 50.1167, 24.8500, "Львівська", "село", 1200)
-
-        # 17. КАМ'ЯНКА-БУЗЬКИЙ РАЙОН
-        self._add_settlement("Кам'янка-Бузька", 50.1000, 24.3500, "Львівська", "місто", 11000)
-        self._add_settlement("Новий Яричів", 49.9000, 24.3000, "Львівська", "селище", 4200)
-        self._add_settlement("Старий Яричів", 49.9333, 24.2833, "Львівська", "село", 1500)
-
-        # 18. НОВОРОЗДІЛЬСЬКИЙ РАЙОН
-        self._add_settlement("Новий Розділ", 49.4667, 24.1333, "Львівська", "місто", 29000)
-        self._add_settlement("Гірник", 49.2333, 23.0667, "Львівська", "селище", 3500)
-        self._add_settlement("Розділ", 49.4500, 24.0667, "Львівська", "селище", 2800)
-        self._add_settlement("Сходниця", 49.1667, 23.2833, "Львівська", "селище", 2200)
-
-        # 19. ПІДКАМІНСЬКИЙ РАЙОН (історичний)
-
-        # ДОДАТКОВІ ВАЖЛИВІ СЕЛА ЛЬВІВСЬКОЇ ОБЛАСТІ
-        self._add_settlement("Батятичі", 49.8167, 23.9167, "Львівська", "село", 1800)
-        self._add_settlement("Бірки", 49.9667, 24.0667, "Львівська", "село", 1200)
-        self._add_settlement("Великий Дорошів", 49.7167, 23.8667, "Львівська", "село", 1500)
-        self._add_settlement("Городислав", 49.8167, 24.3167, "Львівська", "село", 1100)
-        self._add_settlement("Дмитре", 49.5833, 23.8333, "Львівська", "село", 1300)
-        self._add_settlement("Жуличи", 49.8333, 23.9167, "Львівська", "село", 1400)
-        self._add_settlement("Княгиничі", 49.6833, 23.8167, "Львівська", "село", 1200)
-        self._add_settlement("Коропуж", 49.7000, 23.8000, "Львівська", "село", 1000)
-        self._add_settlement("Крехів", 50.0500, 23.8000, "Львівська", "село", 900)
-        self._add_settlement("Лаврів", 49.8667, 23.9833, "Львівська", "село", 1300)
-        self._add_settlement("Липники", 49.9000, 24.0333, "Львівська", "село", 1100)
-        self._add_settlement("Мостище", 49.8000, 23.1833, "Львівська", "село", 1200)
-        self._add_settlement("Наварія", 49.7500, 23.9167, "Львівська", "село", 1400)
-        self._add_settlement("Оброшине", 49.7833, 23.8667, "Львівська", "село", 2500)
-        self._add_settlement("Підбірці", 49.8333, 24.2333, "Львівська", "село", 1500)
-        self._add_settlement("Підрясне", 49.9000, 23.9833, "Львівська", "село", 1300)
-        self._add_settlement("Підсмереки", 49.6667, 23.6833, "Львівська", "село", 1100)
-        self._add_settlement("Підтемне", 49.7167, 23.7500, "Львівська", "село", 1200)
-        self._add_settlement("Рокині", 49.9000, 24.1833, "Львівська", "село", 1000)
-        self._add_settlement("Сарники", 49.8500, 24.2000, "Львівська", "село", 1100)
-        self._add_settlement("Сілець", 49.5000, 23.5333, "Львівська", "село", 1200)
-        self._add_settlement("Спас", 49.9333, 24.0667, "Львівська", "село", 900)
-        self._add_settlement("Старе Село", 49.7000, 24.2000, "Львівська", "село", 1400)
-        self._add_settlement("Стриганці", 49.7833, 24.0333, "Львівська", "село", 1300)
-        self._add_settlement("Тустановичі", 49.5667, 23.2000, "Львівська", "село", 1100)
-        self._add_settlement("Хильчиці", 49.5333, 23.1333, "Львівська", "село", 1200)
-        self._add_settlement("Цунів", 49.6833, 23.8167, "Львівська", "село", 1000)
-        self._add_settlement("Черкаси", 49.4500, 23.8667, "Львівська", "село", 1300)
-        self._add_settlement("Ямпіль", 49.9667, 24.2333, "Львівська", "село", 1100)
-
-                # ========== ЛЬВІВСЬКА ОБЛАСТЬ - ЩЕ БІЛЬШЕ СІЛ ==========
-        # СЕЛА ЛЬВІВСЬКОГО РАЙОНУ
-        self._add_settlement("Бар", 49.7833, 24.0333, "Львівська", "село", 850)
-        self._add_settlement("Басівка", 49.8500, 24.0000, "Львівська", "село", 780)
-        self._add_settlement("Бережани", 49.8000, 23.9833, "Львівська", "село", 920)
-        self._add_settlement("Біберка", 49.7833, 24.1000, "Львівська", "село", 650)
-        self._add_settlement("Білогорща", 49.7833, 23.8667, "Львівська", "село", 1800)
-        self._add_settlement("Борщовичі", 49.7667, 24.0667, "Львівська", "село", 1100)
-        self._add_settlement("Великі Грибовичі", 49.8000, 23.9167, "Львівська", "село", 1400)
-        self._add_settlement("Верхня Білка", 49.8167, 24.3000, "Львівська", "село", 950)
-        self._add_settlement("Вовків", 49.7833, 23.6333, "Львівська", "село", 1200)
-        self._add_settlement("Гамаліївка", 49.8333, 24.2500, "Львівська", "село", 880)
-        self._add_settlement("Гаї", 49.8500, 24.0667, "Львівська", "село", 1100)
-        self._add_settlement("Гірка Полонка", 49.9333, 24.2833, "Львівська", "село", 750)
-        self._add_settlement("Глібовичі", 49.8000, 24.3167, "Львівська", "село", 980)
-        self._add_settlement("Годовиця", 49.7833, 24.2833, "Львівська", "село", 850)
-        self._add_settlement("Годі", 49.8500, 24.1833, "Львівська", "село", 920)
-        self._add_settlement("Гологори", 49.9000, 24.1667, "Львівська", "село", 780)
-        self._add_settlement("Горбачі", 49.8167, 24.0000, "Львівська", "село", 1100)
-        self._add_settlement("Гряда", 49.8333, 24.1333, "Львівська", "село", 950)
-        self._add_settlement("Деревач", 49.8000, 23.7000, "Львівська", "село", 1200)
-        self._add_settlement("Діброва", 49.8667, 24.2000, "Львівська", "село", 880)
-        self._add_settlement("Добряни", 49.8667, 24.0167, "Львівська", "село", 1050)
-        self._add_settlement("Заболоття", 49.7833, 24.2333, "Львівська", "село", 920)
-        self._add_settlement("Зубра", 49.8333, 24.0833, "Львівська", "село", 780)
-        self._add_settlement("Кам'янобрід", 49.9000, 24.1167, "Львівська", "село", 850)
-        self._add_settlement("Козельники", 49.8667, 24.1333, "Львівська", "село", 950)
-        self._add_settlement("Колоденці", 49.8000, 23.9833, "Львівська", "село", 1100)
-        self._add_settlement("Коротенко", 49.8500, 23.9667, "Львівська", "село", 920)
-        self._add_settlement("Кривчиці", 49.8333, 24.0333, "Львівська", "село", 1400)
-        self._add_settlement("Лисиничі", 49.7833, 24.1000, "Львівська", "село", 880)
-        self._add_settlement("Малі Грибовичі", 49.8000, 23.9000, "Львівська", "село", 1050)
-        self._add_settlement("Мерещів", 49.7667, 24.1667, "Львівська", "село", 920)
-        self._add_settlement("Милятичі", 49.8333, 24.2167, "Львівська", "село", 1100)
-        self._add_settlement("Миляч", 49.8000, 23.5667, "Львівська", "село", 950)
-        self._add_settlement("Містки", 49.7667, 24.2333, "Львівська", "село", 880)
-        self._add_settlement("Нове Село", 49.8500, 24.2500, "Львівська", "село", 780)
-        self._add_settlement("Опака", 49.8333, 24.3000, "Львівська", "село", 920)
-        self._add_settlement("Пасіки", 49.8667, 24.1667, "Львівська", "село", 850)
-        self._add_settlement("Пасічна", 49.8000, 23.8333, "Львівська", "село", 1100)
-        self._add_settlement("Підмонастирок", 49.7667, 24.0333, "Львівська", "село", 1050)
-        self._add_settlement("Підріччя", 49.7833, 24.1833, "Львівська", "село", 920)
-        self._add_settlement("Під'ярків", 49.8000, 24.0000, "Львівська", "село", 1300)
-        self._add_settlement("Піски", 49.8333, 24.1167, "Львівська", "село", 950)
-        self._add_settlement("Пнятин", 49.8667, 24.0833, "Львівська", "село", 1050)
-        self._add_settlement("Полтва", 49.8000, 23.9167, "Львівська", "село", 1100)
-        self._add_settlement("Руда", 49.7833, 24.2667, "Львівська", "село", 880)
-        self._add_settlement("Свірж", 49.6500, 24.4333, "Львівська", "село", 1200)
-        self._add_settlement("Семенівка", 49.8667, 24.0333, "Львівська", "село", 950)
-        self._add_settlement("Сердиця", 49.8000, 23.9833, "Львівська", "село", 1050)
-        self._add_settlement("Сихів", 49.7833, 24.0167, "Львівська", "село", 15000)
-        self._add_settlement("Скнилів", 49.7833, 24.0667, "Львівська", "село", 3500)
-        self._add_settlement("Сколе", 49.0333, 23.5167, "Львівська", "місто", 6200)
-        self._add_settlement("Словіта", 49.8167, 24.1500, "Львівська", "село", 920)
-        self._add_settlement("Смолів", 49.7333, 23.8667, "Львівська", "село", 1100)
-        self._add_settlement("Чернилява", 49.8333, 24.2833, "Львівська", "село", 880)
-
-        # СЕЛА САМБІРСЬКОГО РАЙОНУ
-        self._add_settlement("Бабино", 49.4500, 23.0833, "Львівська", "село", 850)
-        self._add_settlement("Береги", 49.4000, 22.9500, "Львівська", "село", 780)
-        self._add_settlement("Блищиводи", 49.4833, 23.1833, "Львівська", "село", 920)
-        self._add_settlement("Боршевичі", 49.4333, 23.2333, "Львівська", "село", 1100)
-        self._add_settlement("Букова", 49.3833, 23.1500, "Львівська", "село", 950)
-        self._add_settlement("Велика Білина", 49.3667, 23.2000, "Львівська", "село", 1050)
-        self._add_settlement("Велика Озимина", 49.3500, 23.1667, "Львівська", "село", 980)
-        self._add_settlement("Верхній Лужок", 49.3167, 22.9833, "Львівська", "село", 850)
-        self._add_settlement("Вістова", 49.4167, 23.0333, "Львівська", "село", 920)
-        self._add_settlement("Воля", 49.3833, 23.1000, "Львівська", "село", 1050)
-        self._add_settlement("Воля-Баранецька", 49.4000, 23.0667, "Львівська", "село", 880)
-        self._add_settlement("Ганьковичі", 49.4333, 23.1000, "Львівська", "село", 950)
-        self._add_settlement("Горішнє", 49.3667, 23.0333, "Львівська", "село", 780)
-        self._add_settlement("Грозьово", 49.3333, 23.1333, "Львівська", "село", 1100)
-        self._add_settlement("Дубрівка", 49.4167, 23.1667, "Львівська", "село", 920)
-        self._add_settlement("Загір'я", 49.3833, 23.2333, "Львівська", "село", 850)
-        self._add_settlement("Задільське", 49.3500, 23.2000, "Львівська", "село", 780)
-        self._add_settlement("Заріччя", 49.4000, 23.1333, "Львівська", "село", 1100)
-        self._add_settlement("Калинів", 49.3667, 23.0833, "Львівська", "село", 1050)
-        self._add_settlement("Княжий Міст", 49.3333, 23.0333, "Львівська", "село", 880)
-        self._add_settlement("Кобиловичі", 49.4167, 23.2000, "Львівська", "село", 950)
-        self._add_settlement("Корналовичі", 49.3833, 23.1667, "Львівська", "село", 920)
-        self._add_settlement("Корчин", 49.3500, 23.1167, "Львівська", "село", 1050)
-        self._add_settlement("Круковець", 49.4333, 23.0333, "Львівська", "село", 780)
-        self._add_settlement("Лановичі", 49.4000, 23.1000, "Львівська", "село", 1100)
-        self._add_settlement("Лопушанка", 49.3667, 23.0500, "Львівська", "село", 950)
-        self._add_settlement("Луки", 49.4167, 23.0833, "Львівська", "село", 920)
-        self._add_settlement("Лютовиска", 49.3333, 22.9167, "Львівська", "селище", 1500)
-        self._add_settlement("Мала Білина", 49.3667, 23.1833, "Львівська", "село", 850)
-        self._add_settlement("Мала Озимина", 49.3500, 23.1500, "Львівська", "село", 780)
-        self._add_settlement("Малійово", 49.3833, 23.0333, "Львівська", "село", 1100)
-        self._add_settlement("Медведичі", 49.4167, 23.1500, "Львівська", "село", 1050)
-        self._add_settlement("Михайлевичі", 49.4000, 23.0333, "Львівська", "село", 880)
-        self._add_settlement("Міженець", 49.3667, 23.1333, "Львівська", "село", 950)
-        self._add_settlement("Міжгор'я", 49.3333, 23.1000, "Львівська", "село", 920)
-        self._add_settlement("Надітичі", 49.4333, 23.1167, "Львівська", "село", 1050)
-        self._add_settlement("Нижній Лужок", 49.3167, 23.0000, "Львівська", "село", 780)
-        self._add_settlement("Новосілки", 49.3833, 23.2000, "Львівська", "село", 1100)
-        self._add_settlement("Орховичі", 49.4167, 23.0667, "Львівська", "село", 950)
-        self._add_settlement("Островки", 49.3667, 23.1667, "Львівська", "село", 920)
-        self._add_settlement("Перекоп", 49.4000, 23.1833, "Львівська", "село", 1050)
-        self._add_settlement("Підмостичі", 49.4333, 23.1500, "Львівська", "село", 880)
-        self._add_settlement("Піски", 49.3833, 23.1167, "Львівська", "село", 950)
-        self._add_settlement("Погірці", 49.3500, 23.0333, "Львівська", "село", 920)
-        self._add_settlement("Порохник", 49.3333, 23.0500, "Львівська", "село", 1050)
-        self._add_settlement("Радич", 49.4167, 23.0333, "Львівська", "село", 780)
-        self._add_settlement("Радохинці", 49.3667, 23.1000, "Львівська", "село", 1100)
-        self._add_settlement("Ріп'яна", 49.4000, 23.1500, "Львівська", "село", 950)
-        self._add_settlement("Рожанка", 49.3833, 23.0667, "Львівська", "село", 920)
-        self._add_settlement("Санники", 49.3667, 23.0333, "Львівська", "село", 1050)
-        self._add_settlement("Сасів", 49.4333, 23.2000, "Львівська", "село", 880)
-        self._add_settlement("Созань", 49.4000, 23.1000, "Львівська", "село", 950)
-        self._add_settlement("Тисовиця", 49.3667, 23.1500, "Львівська", "село", 1050)
-        self._add_settlement("Торчиновичі", 49.4000, 23.0333, "Львівська", "село", 880)
-        self._add_settlement("Тучапи", 49.4167, 23.1167, "Львівська", "село", 950)
-        self._add_settlement("Чуква", 49.3833, 23.1833, "Львівська", "село", 1050)
-
-        # СЕЛА СТРИЙСЬКОГО РАЙОНУ
-        self._add_settlement("Баня Лисовицька", 49.2000, 23.7667, "Львівська", "село", 850)
-        self._add_settlement("Бережниця", 49.1833, 23.8333, "Львівська", "село", 780)
-        self._add_settlement("Бистре", 49.2500, 23.9000, "Львівська", "село", 920)
-        self._add_settlement("Болохів", 49.2167, 23.8500, "Львівська", "село", 1100)
-        self._add_settlement("Верхня Стинава", 49.2667, 23.9333, "Львівська", "село", 950)
-        self._add_settlement("Воля-Задеревацька", 49.2333, 23.8000, "Львівська", "село", 1050)
-        self._add_settlement("Гірне", 49.1833, 23.7667, "Львівська", "село", 980)
-        self._add_settlement("Голобутів", 49.2000, 23.8167, "Львівська", "село", 850)
-        self._add_settlement("Грабовець", 49.2333, 23.8667, "Львівська", "село", 920)
-        self._add_settlement("Діброва", 49.2167, 23.9333, "Львівська", "село", 1050)
-        self._add_settlement("Довге", 49.1500, 23.7667, "Львівська", "село", 880)
-        self._add_settlement("Довпотів", 49.1833, 23.9000, "Львівська", "село", 950)
-        self._add_settlement("Дуліби", 49.2500, 23.9667, "Львівська", "село", 920)
-        self._add_settlement("Завадів", 49.2333, 23.7833, "Львівська", "село", 1050)
-        self._add_settlement("Загір'я", 49.2667, 23.8500, "Львівська", "село", 780)
-        self._add_settlement("Задністряни", 49.1833, 23.8333, "Львівська", "село", 1100)
-        self._add_settlement("Заріччя", 49.2167, 23.9000, "Львівська", "село", 950)
-        self._add_settlement("Іванівка", 49.1500, 23.8167, "Львівська", "село", 920)
-        self._add_settlement("Кальне", 49.2833, 23.9167, "Львівська", "село", 1050)
-        self._add_settlement("Коростів", 49.2333, 23.8500, "Львівська", "село", 880)
-        self._add_settlement("Крушельниця", 49.2000, 23.9333, "Львівська", "село", 950)
-        self._add_settlement("Лисовичі", 49.2500, 23.8000, "Львівська", "село", 920)
-        self._add_settlement("Лука", 49.2167, 23.9667, "Львівська", "село", 1050)
-        self._add_settlement("Любинці", 49.1833, 23.7667, "Львівська", "село", 780)
-        self._add_settlement("Мала Розтока", 49.1500, 23.8500, "Львівська", "село", 1100)
-        self._add_settlement("Нижня Стинава", 49.2667, 23.9167, "Львівська", "село", 950)
-        self._add_settlement("Підгірці", 49.2333, 23.8333, "Львівська", "село", 920)
-        self._add_settlement("Пісочне", 49.2000, 23.8833, "Львівська", "село", 1050)
-        self._add_settlement("Плаве", 49.2667, 23.7833, "Львівська", "село", 880)
-        self._add_settlement("Побук", 49.1833, 23.9000, "Львівська", "село", 950)
-        self._add_settlement("П'ядики", 49.2167, 23.9167, "Львівська", "село", 920)
-        self._add_settlement("Розгірче", 49.2500, 23.8667, "Львівська", "село", 1050)
-        self._add_settlement("Слобідка", 49.2000, 23.8333, "Львівська", "село", 950)
-        self._add_settlement("Стриганці", 49.1833, 23.7833, "Львівська", "село", 920)
-        self._add_settlement("Трибушані", 49.2333, 23.9667, "Львівська", "село", 1050)
-        self._add_settlement("Тростянець", 49.2167, 23.8500, "Львівська", "село", 880)
-        self._add_settlement("Фалиш", 49.1833, 23.8167, "Львівська", "село", 950)
-        self._add_settlement("Ходовичі", 49.2167, 23.9000, "Львівська", "село", 920)
-        self._add_settlement("Черниця", 49.2500, 23.9333, "Львівська", "село", 1050)
-        self._add_settlement("Яблунів", 49.2000, 23.8667, "Львівська", "село", 880)
-
-        # СЕЛА ДРОГОБИЦЬКОГО РАЙОНУ
-        self._add_settlement("Болехів", 49.0667, 23.8500, "Львівська", "місто", 10600)
-        self._add_settlement("Верхнє", 49.1000, 23.4333, "Львівська", "село", 850)
-        self._add_settlement("Верхній Топільник", 49.1500, 23.4667, "Львівська", "село", 780)
-        self._add_settlement("Верхня Яблунька", 49.1333, 23.4000, "Львівська", "село", 920)
-        self._add_settlement("Витвиця", 49.0833, 23.5167, "Львівська", "село", 1100)
-        self._add_settlement("Вовче", 49.1667, 23.4333, "Львівська", "село", 950)
-        self._add_settlement("Глинка", 49.1167, 23.5500, "Львівська", "село", 1050)
-        self._add_settlement("Головське", 49.1333, 23.4833, "Львівська", "село", 980)
-        self._add_settlement("Горішнє", 49.1000, 23.4667, "Львівська", "село", 850)
-        self._add_settlement("Довголука", 49.1167, 23.4333, "Львівська", "село", 920)
-        self._add_settlement("Долішнє", 49.0833, 23.4500, "Львівська", "село", 1050)
-        self._add_settlement("Дубляни", 49.1667, 23.5167, "Львівська", "село", 880)
-        self._add_settlement("Жукотин", 49.1500, 23.5500, "Львівська", "село", 950)
-        self._add_settlement("Задільське", 49.1333, 23.4333, "Львівська", "село", 920)
-        self._add_settlement("Залужани", 49.1000, 23.5167, "Львівська", "село", 1050)
-        self._add_settlement("Заріччя", 49.1167, 23.4667, "Львівська", "село", 880)
-        self._add_settlement("Івана-Франка", 49.1333, 23.4000, "Львівська", "село", 950)
-        self._add_settlement("Калинів", 49.0833, 23.4833, "Львівська", "село", 920)
-        self._add_settlement("Клещівна", 49.1667, 23.4667, "Львівська", "село", 1050)
-        self._add_settlement("Козьова", 49.1000, 23.4333, "Львівська", "село", 780)
-        self._add_settlement("Кропивник", 49.1333, 23.5167, "Львівська", "село", 1100)
-        self._add_settlement("Липівці", 49.1167, 23.4000, "Львівська", "село", 950)
-        self._add_settlement("Липник", 49.0833, 23.4667, "Львівська", "село", 920)
-        self._add_settlement("Лолин", 49.1500, 23.4333, "Львівська", "село", 1050)
-        self._add_settlement("Луги", 49.1333, 23.5500, "Львівська", "село", 880)
-        self._add_settlement("Мокряни", 49.1000, 23.5500, "Львівська", "село", 950)
-        self._add_settlement("Нижній Топільник", 49.1500, 23.4833, "Львівська", "село", 920)
-        self._add_settlement("Нижня Яблунька", 49.1333, 23.4333, "Львівська", "село", 1050)
-        self._add_settlement("Нова Кропивня", 49.1167, 23.4667, "Львівська", "село", 880)
-        self._add_settlement("Новосілки", 49.0833, 23.5167, "Львівська", "село", 950)
-        self._add_settlement("Підбузьк", 49.1500, 23.4000, "Львівська", "село", 920)
-        self._add_settlement("Підгородне", 49.1333, 23.4667, "Львівська", "село", 1050)
-        self._add_settlement("Підмонастирок", 49.1000, 23.4333, "Львівська", "село", 780)
-        self._add_settlement("Підсадки", 49.1167, 23.5167, "Львівська", "село", 1100)
-        self._add_settlement("Плоске", 49.0833, 23.4500, "Львівська", "село", 950)
-        self._add_settlement("Пнятин", 49.1333, 23.4000, "Львівська", "село", 920)
-        self._add_settlement("Підгірці", 49.1000, 23.4833, "Львівська", "село", 1050)
-        self._add_settlement("Раневичі", 49.1500, 23.4333, "Львівська", "село", 880)
-        self._add_settlement("Рихтичі", 49.1167, 23.4667, "Львівська", "село", 950)
-        self._add_settlement("Славське", 48.8500, 23.4500, "Львівська", "селище", 3500)
-        self._add_settlement("Сможе", 49.0833, 23.4333, "Львівська", "село", 920)
-        self._add_settlement("Спас", 49.1333, 23.5500, "Львівська", "село", 1050)
-        self._add_settlement("Стара Сіль", 49.1000, 23.4000, "Львівська", "село", 880)
-        self._add_settlement("Стопчатів", 49.1167, 23.4833, "Львівська", "село", 950)
-        self._add_settlement("Уличне", 49.0833, 23.4667, "Львівська", "село", 920)
-        self._add_settlement("Уріж", 49.1500, 23.5167, "Львівська", "село", 1050)
-        self._add_settlement("Хітар", 49.1333, 23.4333, "Львівська", "село", 880)
-        self._add_settlement("Ясениця", 49.1000, 23.5500, "Львівська", "село", 950)
-
-                # ========== ЛЬВІВСЬКА ОБЛАСТЬ - ІНШІ РАЙОНИ ==========
-        # 1. ЗОЛОЧІВСЬКИЙ РАЙОН (додаткові села)
-        self._add_settlement("Багнівка", 49.9167, 25.0333, "Львівська", "село", 850)
-        self._add_settlement("Білий Камінь", 49.8833, 25.3167, "Львівська", "село", 1200)
-        self._add_settlement("Білогірка", 49.8000, 25.1000, "Львівська", "село", 950)
-        self._add_settlement("Бовдури", 49.9333, 25.2000, "Львівська", "село", 780)
-        self._add_settlement("Борщівка", 49.8667, 25.2667, "Львівська", "село", 1100)
-        self._add_settlement("Великий Полюхів", 49.9333, 25.1000, "Львівська", "село", 1050)
-        self._add_settlement("Вербляни", 49.8833, 25.1500, "Львівська", "село", 920)
-        self._add_settlement("Волиця", 49.9000, 25.2333, "Львівська", "село", 880)
-        self._add_settlement("Голоско", 49.9167, 25.1667, "Львівська", "село", 950)
-        self._add_settlement("Городислав", 49.8500, 25.0500, "Львівська", "село", 1050)
-        self._add_settlement("Деревня", 49.9500, 25.0833, "Львівська", "село", 780)
-        self._add_settlement("Добряни", 49.8833, 25.0333, "Львівська", "село", 1100)
-        self._add_settlement("Жуличі", 49.8667, 25.1167, "Львівська", "село", 920)
-        self._add_settlement("Заболотці", 49.9500, 25.2333, "Львівська", "село", 1050)
-        self._add_settlement("Зарудці", 49.9000, 25.1000, "Львівська", "село", 880)
-        self._add_settlement("Княже", 49.9333, 25.0333, "Львівська", "село", 950)
-        self._add_settlement("Колтів", 49.9667, 25.1500, "Львівська", "село", 920)
-        self._add_settlement("Криве", 49.9000, 25.0333, "Львівська", "село", 1050)
-        self._add_settlement("Куровичі", 49.8667, 25.2000, "Львівська", "село", 780)
-        self._add_settlement("Липник", 49.9167, 25.1167, "Львівська", "село", 1100)
-        self._add_settlement("Мала Вишенька", 49.9333, 25.2000, "Львівська", "село", 920)
-        self._add_settlement("Мала Ольшанка", 49.8833, 25.2667, "Львівська", "село", 1050)
-        self._add_settlement("Малий Полюхів", 49.9167, 25.0833, "Львівська", "село", 880)
-        self._add_settlement("Новосілки", 49.9500, 25.0333, "Львівська", "село", 950)
-        self._add_settlement("Ожидів", 49.9000, 25.1667, "Львівська", "село", 920)
-        self._add_settlement("Підгайці", 49.9500, 25.1000, "Львівська", "село", 1050)
-        self._add_settlement("Підлипці", 49.8833, 25.0333, "Львівська", "село", 880)
-        self._add_settlement("Пониковиця", 49.9333, 25.1667, "Львівська", "село", 950)
-        self._add_settlement("Ражнів", 49.9000, 25.2333, "Львівська", "село", 920)
-        self._add_settlement("Сасів", 49.9500, 25.0333, "Львівська", "село", 1050)
-        self._add_settlement("Словіта", 49.9167, 25.1000, "Львівська", "село", 880)
-        self._add_settlement("Соколівка", 49.9667, 25.2333, "Львівська", "село", 950)
-        self._add_settlement("Солова", 49.8833, 25.1500, "Львівська", "село", 920)
-        self._add_settlement("Сопів", 49.9333, 25.0333, "Львівська", "село", 1050)
-        self._add_settlement("Станимир", 49.9000, 25.0833, "Львівська", "село", 780)
-        self._add_settlement("Страше", 49.9500, 25.2000, "Львівська", "село", 1100)
-        self._add_settlement("Тучне", 49.9167, 25.1667, "Львівська", "село", 920)
-        self._add_settlement("Узин", 49.8833, 25.2333, "Львівська", "село", 1050)
-        self._add_settlement("Ходорівка", 49.9333, 25.1167, "Львівська", "село", 880)
-        self._add_settlement("Черкаси", 49.9500, 25.0333, "Львівська", "село", 950)
-        self._add_settlement("Ясенівці", 49.9000, 25.2000, "Львівська", "село", 920)
-
-        # 2. ЖОВКІВСЬКИЙ РАЙОН (додаткові села)
-        self._add_settlement("Баранівці", 50.0833, 23.8333, "Львівська", "село", 950)
-        self._add_settlement("Біличі", 50.1000, 23.9000, "Львівська", "село", 1100)
-        self._add_settlement("Воля-Висоцька", 50.0333, 23.8167, "Львівська", "село", 1050)
-        self._add_settlement("Глинськ", 50.0667, 23.7667, "Львівська", "село", 920)
-        self._add_settlement("Городислав", 50.1167, 23.8667, "Львівська", "село", 880)
-        self._add_settlement("Добросин", 50.1000, 23.8167, "Львівська", "село", 950)
-        self._add_settlement("Загір'я", 50.0833, 23.9000, "Львівська", "село", 1050)
-        self._add_settlement("Запитів", 50.0333, 23.8667, "Львівська", "село", 920)
-        self._add_settlement("Лапи", 50.1000, 23.7667, "Львівська", "село", 880)
-        self._add_settlement("Малинівка", 50.0333, 23.9000, "Львівська", "село", 1100)
-        self._add_settlement("Мости", 50.1167, 23.8167, "Львівська", "село", 950)
-        self._add_settlement("Нагірці", 50.0833, 23.8667, "Львівська", "село", 1050)
-        self._add_settlement("Новосілки", 50.1000, 23.8333, "Львівська", "село", 920)
-        self._add_settlement("Опаки", 50.0333, 23.8167, "Львівська", "село", 880)
-        self._add_settlement("Пасіки", 50.0667, 23.9000, "Львівська", "село", 1100)
-        self._add_settlement("Підліски", 50.1167, 23.7667, "Львівська", "село", 950)
-        self._add_settlement("Піски", 50.0833, 23.8167, "Львівська", "село", 1050)
-        self._add_settlement("Поляна", 50.0333, 23.8667, "Львівська", "село", 920)
-        self._add_settlement("Річки", 50.1000, 23.9000, "Львівська", "село", 880)
-        self._add_settlement("Соколя", 50.0667, 23.8333, "Львівська", "село", 1100)
-        self._add_settlement("Старий Двір", 50.0833, 23.7667, "Львівська", "село", 950)
-        self._add_settlement("Стоянці", 50.0333, 23.9000, "Львівська", "село", 1050)
-        self._add_settlement("Тартаків", 50.1000, 23.8667, "Львівська", "село", 920)
-        self._add_settlement("Хлівчани", 50.0667, 23.8167, "Львівська", "село", 880)
-        self._add_settlement("Черниця", 50.0833, 23.9000, "Львівська", "село", 1100)
-
-        # 3. МОСТИСЬКИЙ РАЙОН (додаткові села)
-        self._add_settlement("Баличі", 49.7500, 23.1000, "Львівська", "село", 950)
-        self._add_settlement("Бартатів", 49.7833, 23.0500, "Львівська", "село", 1100)
-        self._add_settlement("Березина", 49.7167, 23.1167, "Львівська", "село", 920)
-        self._add_settlement("Біляви", 49.7667, 23.0167, "Львівська", "село", 1050)
-        self._add_settlement("Бориничі", 49.7333, 23.0833, "Львівська", "село", 880)
-        self._add_settlement("Вербляни", 49.7000, 23.0333, "Львівська", "село", 950)
-        self._add_settlement("Гаї", 49.7667, 23.1167, "Львівська", "село", 920)
-        self._add_settlement("Ганьковичі", 49.7333, 23.0500, "Львівська", "село", 1050)
-        self._add_settlement("Годовиця", 49.7500, 23.1000, "Львівська", "село", 880)
-        self._add_settlement("Городислав", 49.7833, 23.0667, "Львівська", "село", 1100)
-        self._add_settlement("Диб'яки", 49.7000, 23.0833, "Львівська", "село", 950)
-        self._add_settlement("Дмитре", 49.7500, 23.0333, "Львівська", "село", 1050)
-        self._add_settlement("Дуброва", 49.7333, 23.1167, "Львівська", "село", 920)
-        self._add_settlement("Завадів", 49.7667, 23.0500, "Львівська", "село", 880)
-        self._add_settlement("Загір'я", 49.7167, 23.0333, "Львівська", "село", 1100)
-        self._add_settlement("Замочок", 49.7000, 23.1000, "Львівська", "село", 950)
-        self._add_settlement("Заріччя", 49.7500, 23.0833, "Львівська", "село", 1050)
-        self._add_settlement("Калинів", 49.7333, 23.0333, "Львівська", "село", 920)
-        self._add_settlement("Кам'янка", 49.7833, 23.1000, "Львівська", "село", 880)
-        self._add_settlement("Колодруби", 49.7167, 23.0500, "Львівська", "село", 1100)
-        self._add_settlement("Корчунок", 49.7500, 23.1167, "Львівська", "село", 950)
-        self._add_settlement("Кути", 49.7333, 23.1000, "Львівська", "село", 1050)
-        self._add_settlement("Лани", 49.7000, 23.0500, "Львівська", "село", 920)
-        self._add_settlement("Лопушанка", 49.7667, 23.0333, "Львівська", "село", 880)
-        self._add_settlement("Малий Дорошів", 49.7000, 23.8667, "Львівська", "село", 1100)
-        self._add_settlement("Новики", 49.7167, 23.1000, "Львівська", "село", 950)
-        self._add_settlement("Острів", 49.7500, 23.0500, "Львівська", "село", 1050)
-        self._add_settlement("Підгайці", 49.7333, 23.0833, "Львівська", "село", 920)
-        self._add_settlement("Підлісне", 49.7000, 23.0333, "Львівська", "село", 880)
-        self._add_settlement("Поляна", 49.7667, 23.1000, "Львівська", "село", 950)
-        self._add_settlement("Раденичі", 49.7333, 23.0500, "Львівська", "село", 1050)
-        self._add_settlement("Річки", 49.7167, 23.1167, "Львівська", "село", 920)
-        self._add_settlement("Терновиця", 49.7500, 23.0333, "Львівська", "село", 880)
-        self._add_settlement("Тишківці", 49.7167, 23.0833, "Львівська", "село", 1100)
-        self._add_settlement("Топільниця", 49.7333, 23.1167, "Львівська", "село", 950)
-        self._add_settlement("Тучне", 49.7000, 23.0500, "Львівська", "село", 1050)
-        self._add_settlement("Ходовичі", 49.7667, 23.0333, "Львівська", "село", 920)
-        self._add_settlement("Ясениця", 49.7500, 23.1167, "Львівська", "село", 880)
-
-        # 4. ЯВОРІВСЬКИЙ РАЙОН (додаткові села)
-        self._add_settlement("Бердихів", 49.9333, 23.4667, "Львівська", "село", 950)
-        self._add_settlement("Борщовичі", 49.9000, 23.5500, "Львівська", "село", 1100)
-        self._add_settlement("Букова", 49.8833, 23.5167, "Львівська", "село", 920)
-        self._add_settlement("Великі Макари", 49.9167, 23.6000, "Львівська", "село", 1050)
-        self._add_settlement("Вербиця", 49.8667, 23.4333, "Львівська", "село", 880)
-        self._add_settlement("Верхнячка", 49.9333, 23.5167, "Львівська", "село", 1100)
-        self._add_settlement("Воля-Добростанська", 49.8500, 23.5000, "Львівська", "село", 950)
-        self._add_settlement("Глиниці", 49.8833, 23.4667, "Львівська", "село", 1050)
-        self._add_settlement("Городислав", 49.9167, 23.4333, "Львівська", "село", 920)
-        self._add_settlement("Деревляни", 49.8667, 23.5500, "Львівська", "село", 880)
-        self._add_settlement("Діброва", 49.9333, 23.4667, "Львівська", "село", 1100)
-        self._add_settlement("Добростани", 49.9000, 23.5000, "Львівська", "село", 950)
-        self._add_settlement("Завадів", 49.8833, 23.4333, "Львівська", "село", 1050)
-        self._add_settlement("Загір'я", 49.9167, 23.5500, "Львівська", "село", 920)
-        self._add_settlement("Залужжя", 49.8667, 23.4667, "Львівська", "село", 880)
-        self._add_settlement("Заріччя", 49.9333, 23.5000, "Львівська", "село", 1100)
-        self._add_settlement("Калинів", 49.8833, 23.5500, "Львівська", "село", 950)
-        self._add_settlement("Кам'янка", 49.9167, 23.4333, "Львівська", "село", 1050)
-        self._add_settlement("Княжпіль", 49.8667, 23.5167, "Львівська", "село", 920)
-        self._add_settlement("Колоденці", 49.9333, 23.4667, "Львівська", "село", 880)
-        self._add_settlement("Крукеничі", 49.8833, 23.5000, "Львівська", "село", 1100)
-        self._add_settlement("Лани", 49.9167, 23.5500, "Львівська", "село", 950)
-        self._add_settlement("Лісова", 49.8667, 23.4333, "Львівська", "село", 1050)
-        self._add_settlement("Любінь Великий", 49.7167, 23.5333, "Львівська", "селище", 4900)
-        self._add_settlement("Малі Макари", 49.9000, 23.6000, "Львівська", "село", 920)
-        self._add_settlement("Медова", 49.9333, 23.5167, "Львівська", "село", 880)
-        self._add_settlement("Ожидів", 49.9167, 23.4667, "Львівська", "село", 1100)
-        self._add_settlement("Пасіки", 49.8667, 23.5500, "Львівська", "село", 950)
-        self._add_settlement("Підгайці", 49.9333, 23.4333, "Львівська", "село", 1050)
-        self._add_settlement("Підлісне", 49.8833, 23.4667, "Львівська", "село", 920)
-        self._add_settlement("Поляна", 49.9167, 23.5000, "Львівська", "село", 880)
-        self._add_settlement("Річки", 49.8667, 23.5167, "Львівська", "село", 1100)
-        self._add_settlement("Садки", 49.9333, 23.5500, "Львівська", "село", 950)
-        self._add_settlement("Соколя", 49.8833, 23.4333, "Львівська", "село", 1050)
-        self._add_settlement("Терновиця", 49.8667, 23.4667, "Львівська", "село", 920)
-        self._add_settlement("Топільниця", 49.9333, 23.5167, "Львівська", "село", 880)
-        self._add_settlement("Тучапи", 49.8833, 23.5500, "Львівська", "село", 1100)
-        self._add_settlement("Угринів", 49.9167, 23.4333, "Львівська", "село", 950)
-        self._add_settlement("Фальків", 49.8667, 23.5000, "Львівська", "село", 1050)
-        self._add_settlement("Черниця", 49.9333, 23.4667, "Львівська", "село", 920)
-
-        # 5. КАМ'ЯНКА-БУЗЬКИЙ РАЙОН (додаткові села)
-        self._add_settlement("Батятичі", 50.0667, 24.3000, "Львівська", "село", 1100)
-        self._add_settlement("Боброїди", 50.1333, 24.3500, "Львівська", "село", 950)
-        self._add_settlement("Борщовичі", 50.1000, 24.4000, "Львівська", "село", 1050)
-        self._add_settlement("Великий Полюхів", 50.0833, 24.3167, "Львівська", "село", 920)
-        self._add_settlement("Вербляни", 50.1167, 24.3667, "Львівська", "село", 880)
-        self._add_settlement("Волиця", 50.0667, 24.3833, "Львівська", "село", 1100)
-        self._add_settlement("Голоско", 50.1000, 24.3333, "Львівська", "село", 950)
-        self._add_settlement("Городислав", 50.0833, 24.3500, "Львівська", "село", 1050)
-        self._add_settlement("Деревня", 50.1333, 24.3167, "Львівська", "село", 920)
-        self._add_settlement("Добряни", 50.1000, 24.3833, "Львівська", "село", 880)
-        self._add_settlement("Жуличі", 50.1167, 24.3333, "Львівська", "село", 1100)
-        self._add_settlement("Заболотці", 50.0667, 24.3667, "Львівська", "село", 950)
-        self._add_settlement("Зарудці", 50.0833, 24.3167, "Львівська", "село", 1050)
-        self._add_settlement("Княже", 50.1333, 24.3500, "Львівська", "село", 920)
-        self._add_settlement("Козівка", 50.0667, 24.4000, "Львівська", "село", 880)
-        self._add_settlement("Колтів", 50.1000, 24.3167, "Львівська", "село", 1100)
-        self._add_settlement("Криве", 50.0833, 24.3667, "Львівська", "село", 950)
-        self._add_settlement("Куровичі", 50.1167, 24.3167, "Львівська", "село", 1050)
-        self._add_settlement("Липник", 50.0667, 24.3333, "Львівська", "село", 920)
-        self._add_settlement("Мала Вишенька", 50.1000, 24.3500, "Львівська", "село", 880)
-        self._add_settlement("Мала Ольшанка", 50.0833, 24.3833, "Львівська", "село", 1100)
-        self._add_settlement("Малий Полюхів", 50.1167, 24.3167, "Львівська", "село", 950)
-        self._add_settlement("Новосілки", 50.0667, 24.3500, "Львівська", "село", 1050)
-        self._add_settlement("Ожидів", 50.0833, 24.3333, "Львівська", "село", 920)
-        self._add_settlement("Підгайці", 50.1000, 24.3667, "Львівська", "село", 880)
-        self._add_settlement("Підлипці", 50.0667, 24.3167, "Львівська", "село", 1100)
-        self._add_settlement("Пониковиця", 50.1167, 24.3333, "Львівська", "село", 950)
-        self._add_settlement("Ражнів", 50.0833, 24.3500, "Львівська", "село", 1050)
-        self._add_settlement("Сасів", 50.0667, 24.3833, "Львівська", "село", 920)
-        self._add_settlement("Словіта", 50.1000, 24.3167, "Львівська", "село", 880)
-        self._add_settlement("Соколівка", 50.1333, 24.3667, "Львівська", "село", 1100)
-        self._add_settlement("Солова", 50.0833, 24.3333, "Львівська", "село", 950)
-        self._add_settlement("Сопів", 50.0667, 24.3500, "Львівська", "село", 1050)
-        self._add_settlement("Станимир", 50.1000, 24.3167, "Львівська", "село", 920)
-        self._add_settlement("Страше", 50.1167, 24.3500, "Львівська", "село", 880)
-        self._add_settlement("Тучне", 50.0833, 24.3333, "Львівська", "село", 1100)
-        self._add_settlement("Узин", 50.0667, 24.3667, "Львівська", "село", 950)
-        self._add_settlement("Ходорівка", 50.1000, 24.3500, "Львівська", "село", 1050)
-        self._add_settlement("Черкаси", 50.0667, 24.3167, "Львівська", "село", 920)
-        self._add_settlement("Ясенівці", 50.0833, 24.3667, "Львівська", "село", 880)
-
-        # 6. ПЕРЕМИШЛЯНСЬКИЙ РАЙОН (додаткові села)
-        self._add_settlement("Вербляни", 49.6667, 24.5333, "Львівська", "село", 1100)
-        self._add_settlement("Волиця", 49.6833, 24.5000, "Львівська", "село", 950)
-        self._add_settlement("Голоско", 49.7000, 24.4667, "Львівська", "село", 1050)
-        self._add_settlement("Городислав", 49.7167, 24.4833, "Львівська", "село", 920)
-        self._add_settlement("Деревня", 49.7500, 24.5167, "Львівська", "село", 880)
-        self._add_settlement("Добряни", 49.6667, 24.4833, "Львівська", "село", 1100)
-        self._add_settlement("Жуличі", 49.6833, 24.5333, "Львівська", "село", 950)
-        self._add_settlement("Заболотці", 49.7000, 24.5000, "Львівська", "село", 1050)
-        self._add_settlement("Зарудці", 49.7167, 24.4667, "Львівська", "село", 920)
-        self._add_settlement("Княже", 49.7500, 24.4833, "Львівська", "село", 880)
-        self._add_settlement("Козівка", 49.6667, 24.5167, "Львівська", "село", 1100)
-        self._add_settlement("Колтів", 49.7000, 24.4667, "Львівська", "село", 950)
-        self._add_settlement("Криве", 49.6833, 24.4833, "Львівська", "село", 1050)
-        self._add_settlement("Куровичі", 49.7167, 24.5333, "Львівська", "село", 920)
-        self._add_settlement("Липник", 49.6667, 24.5000, "Львівська", "село", 880)
-        self._add_settlement("Мала Вишенька", 49.7000, 24.5167, "Львівська", "село", 1100)
-        self._add_settlement("Мала Ольшанка", 49.6833, 24.4667, "Львівська", "село", 950)
-        self._add_settlement("Малий Полюхів", 49.7167, 24.4833, "Львівська", "село", 1050)
-        self._add_settlement("Новосілки", 49.6667, 24.5333, "Львівська", "село", 920)
-        self._add_settlement("Ожидів", 49.7000, 24.4667, "Львівська", "село", 880)
-        self._add_settlement("Підгайці", 49.6833, 24.5000, "Львівська", "село", 1100)
-        self._add_settlement("Підлипці", 49.6667, 24.4667, "Львівська", "село", 950)
-        self._add_settlement("Пониковиця", 49.7167, 24.5333, "Львівська", "село", 1050)
-        self._add_settlement("Ражнів", 49.6833, 24.4833, "Львівська", "село", 920)
-        self._add_settlement("Сасів", 49.6667, 24.5167, "Львівська", "село", 880)
-        self._add_settlement("Словіта", 49.7000, 24.5000, "Львівська", "село", 1100)
-        self._add_settlement("Соколівка", 49.7500, 24.4667, "Львівська", "село", 950)
-        self._add_settlement("Солова", 49.6833, 24.5333, "Львівська", "село", 1050)
-        self._add_settlement("Сопів", 49.6667, 24.4833, "Львівська", "село", 920)
-        self._add_settlement("Станимир", 49.7000, 24.4667, "Львівська", "село", 880)
-        self._add_settlement("Страше", 49.7167, 24.5000, "Львівська", "село", 1100)
-        self._add_settlement("Тучне", 49.6833, 24.4667, "Львівська", "село", 950)
-        self._add_settlement("Узин", 49.6667, 24.5333, "Львівська", "село", 1050)
-        self._add_settlement("Ходорівка", 49.7000, 24.5167, "Львівська", "село", 920)
-        self._add_settlement("Черкаси", 49.6667, 24.4667, "Львівська", "село", 880)
-        self._add_settlement("Ясенівці", 49.6833, 24.5000, "Львівська", "село", 1100)
-
-        # 7. СОКОЛЬНИЦЬКИЙ РАЙОН (історичний)
-
-        # 8. БУСЬКИЙ РАЙОН (додаткові села)
-
-        # 9. НОВОРОЗДІЛЬСЬКИЙ РАЙОН (додаткові села)
-        self._add_settlement("Бережани", 49.4500, 24.4500, "Львівська", "село", 1100)
-        self._add_settlement("Бобрка", 49.6333, 24.3000, "Львівська", "місто", 3800)
-        self._add_settlement("Вербляни", 49.6667, 24.4000, "Львівська", "село", 1050)
-        self._add_settlement("Волиця", 49.7000, 24.3667, "Львівська", "село", 920)
-        self._add_settlement("Голоско", 49.6667, 24.4333, "Львівська", "село", 1100)
-        self._add_settlement("Городислав", 49.6833, 24.4000, "Львівська", "село", 950)
-        self._add_settlement("Деревня", 49.7167, 24.3667, "Львівська", "село", 880)
-        self._add_settlement("Добряни", 49.6667, 24.4667, "Львівська", "село", 1050)
-        self._add_settlement("Жуличі", 49.7000, 24.4000, "Львівська", "село", 920)
-        self._add_settlement("Заболотці", 49.6833, 24.4333, "Львівська", "село", 1100)
-        self._add_settlement("Зарудці", 49.6667, 24.4000, "Львівська", "село", 950)
-        self._add_settlement("Княже", 49.7167, 24.4333, "Львівська", "село", 1050)
-        self._add_settlement("Козівка", 49.6833, 24.4667, "Львівська", "село", 920)
-        self._add_settlement("Колтів", 49.7000, 24.4333, "Львівська", "село", 1100)
-        self._add_settlement("Криве", 49.6667, 24.4333, "Львівська", "село", 950)
-        self._add_settlement("Куровичі", 49.7167, 24.4000, "Львівська", "село", 1050)
-        self._add_settlement("Липник", 49.6833, 24.4000, "Львівська", "село", 920)
-        self._add_settlement("Мала Вишенька", 49.7000, 24.4333, "Львівська", "село", 1100)
-        self._add_settlement("Мала Ольшанка", 49.6667, 24.4667, "Львівська", "село", 950)
-        self._add_settlement("Малий Полюхів", 49.7167, 24.4000, "Львівська", "село", 1050)
-        self._add_settlement("Новосілки", 49.6833, 24.4333, "Львівська", "село", 920)
-        self._add_settlement("Ожидів", 49.6667, 24.4000, "Львівська", "село", 1100)
-        self._add_settlement("Підгайці", 49.7000, 24.4333, "Львівська", "село", 950)
-        self._add_settlement("Підлипці", 49.6667, 24.4667, "Львівська", "село", 1050)
-        self._add_settlement("Ражнів", 49.6833, 24.4000, "Львівська", "село", 920)
-        self._add_settlement("Сасів", 49.7000, 24.4333, "Львівська", "село", 1100)
-        self._add_settlement("Словіта", 49.6667, 24.4000, "Львівська", "село", 950)
-        self._add_settlement("Соколівка", 49.7167, 24.4667, "Львівська", "село", 1050)
-        self._add_settlement("Солова", 49.6833, 24.4333, "Львівська", "село", 920)
-        self._add_settlement("Сопів", 49.6667, 24.4000, "Львівська", "село", 1100)
-        self._add_settlement("Станимир", 49.7000, 24.4333, "Львівська", "село", 950)
-        self._add_settlement("Страше", 49.7167, 24.4000, "Львівська", "село", 1050)
-        self._add_settlement("Тучне", 49.6833, 24.4333, "Львівська", "село", 920)
-        self._add_settlement("Узин", 49.6667, 24.4667, "Львівська", "село", 1100)
-        self._add_settlement("Ходорівка", 49.7000, 24.4000, "Львівська", "село", 950)
-        self._add_settlement("Черкаси", 49.6667, 24.4333, "Львівська", "село", 1050)
-        self._add_settlement("Ясенівці", 49.6833, 24.4000, "Львівська", "село", 920)
-
-        # 10. ТУРКІВСЬКИЙ РАЙОН (додаткові села)
-        self._add_settlement("Бітля", 49.0833, 22.9667, "Львівська", "село", 850)
-        self._add_settlement("Боберка", 49.1167, 22.8833, "Львівська", "село", 780)
-        self._add_settlement("Верхнячка", 49.1333, 22.9333, "Львівська", "село", 920)
-        self._add_settlement("Вовче", 49.1667, 22.8667, "Львівська", "село", 1100)
-        self._add_settlement("Глибока", 49.0833, 22.9000, "Львівська", "село", 950)
-        self._add_settlement("Головське", 49.1333, 22.9167, "Львівська", "село", 1050)
-        self._add_settlement("Горішнє", 49.1000, 22.8833, "Львівська", "село", 980)
-        self._add_settlement("Діброва", 49.1167, 22.9667, "Львівська", "село", 850)
-        self._add_settlement("Довжанка", 49.0833, 22.9167, "Львівська", "село", 920)
-        self._add_settlement("Долішнє", 49.1333, 22.9000, "Львівська", "село", 1050)
-        self._add_settlement("Загір'я", 49.1000, 22.9667, "Львівська", "село", 880)
-        self._add_settlement("Задільське", 49.1167, 22.9167, "Львівська", "село", 950)
-        self._add_settlement("Заріччя", 49.0833, 22.8833, "Львівська", "село", 1050)
-        self._add_settlement("Ільник", 49.1333, 22.9667, "Львівська", "село", 920)
-        self._add_settlement("Карпатське", 49.1000, 22.9167, "Львівська", "село", 880)
-        self._add_settlement("Кобилець", 49.1167, 22.9000, "Львівська", "село", 1100)
-        self._add_settlement("Красна", 49.0833, 22.9667, "Львівська", "село", 950)
-        self._add_settlement("Кривка", 49.1333, 22.8833, "Львівська", "село", 1050)
-        self._add_settlement("Липник", 49.1000, 22.9000, "Львівська", "село", 920)
-        self._add_settlement("Лопушанка", 49.1167, 22.9667, "Львівська", "село", 880)
-        self._add_settlement("Луги", 49.0833, 22.9167, "Львівська", "село", 1100)
-        self._add_settlement("Мала Тухля", 49.1333, 22.9667, "Львівська", "село", 950)
-        self._add_settlement("Медведичі", 49.1000, 22.8833, "Львівська", "село", 1050)
-        self._add_settlement("Нижнячка", 49.1167, 22.9167, "Львівська", "село", 920)
-        self._add_settlement("Новий Кропивник", 49.0833, 22.9667, "Львівська", "село", 880)
-        self._add_settlement("Новосілки", 49.1333, 22.9000, "Львівська", "село", 1100)
-        self._add_settlement("Підгородне", 49.1000, 22.9667, "Львівська", "село", 950)
-        self._add_settlement("Підмонастирок", 49.0833, 22.9167, "Львівська", "село", 1050)
-        self._add_settlement("Підсадки", 49.1167, 22.8833, "Львівська", "село", 920)
-        self._add_settlement("Плоске", 49.1333, 22.9667, "Львівська", "село", 880)
-        self._add_settlement("Пнятин", 49.1000, 22.9000, "Львівська", "село", 1100)
-        self._add_settlement("Підгірці", 49.0833, 22.9167, "Львівська", "село", 950)
-        self._add_settlement("Раневичі", 49.1167, 22.9667, "Львівська", "село", 1050)
-        self._add_settlement("Рихтичі", 49.0833, 22.8833, "Львівська", "село", 920)
-        self._add_settlement("Сможе", 49.1000, 22.9667, "Львівська", "село", 880)
-        self._add_settlement("Спас", 49.1333, 22.9167, "Львівська", "село", 1100)
-        self._add_settlement("Стара Сіль", 49.0833, 22.9000, "Львівська", "село", 950)
-        self._add_settlement("Стопчатів", 49.1167, 22.9667, "Львівська", "село", 1050)
-        self._add_settlement("Уличне", 49.0833, 22.8833, "Львівська", "село", 920)
-        self._add_settlement("Уріж", 49.1167, 22.9167, "Львівська", "село", 1100)
-        self._add_settlement("Хітар", 49.1333, 22.9667, "Львівська", "село", 950)
-        self._add_settlement("Ясениця", 49.1000, 22.9000, "Львівська", "село", 1050)
-
-
-
-
-        # Одеська область
-        self._add_settlement("Чорноморськ", 46.3011, 30.6564, "Одеська", "місто", 60000)
-        self._add_settlement("Білгород-Дністровський", 46.1833, 30.3333, "Одеська", "місто", 50000)
-        self._add_settlement("Южне", 46.6231, 31.1011, "Одеська", "місто", 32000)
-        
-        # Харківська область
-        self._add_settlement("Мерефа", 49.8200, 36.0700, "Харківська", "місто", 23000)
-        self._add_settlement("Південне", 49.8833, 36.0667, "Харківська", "місто", 8000)
-        self._add_settlement("Куп'янськ", 49.7064, 37.6167, "Харківська", "місто", 28000)
-        
-        # Черкаська область
-        self._add_settlement("Умань", 48.7500, 30.2167, "Черкаська", "місто", 82000)
-        self._add_settlement("Сміла", 49.2167, 31.8667, "Черкаська", "місто", 68000)
-        
-        # Чернігівська область
-        self._add_settlement("Ніжин", 51.0478, 31.8867, "Чернігівська", "місто", 71000)
-        self._add_settlement("Прилуки", 50.5928, 32.3875, "Чернігівська", "місто", 57000)
-        
-        # Вінницька область
-        self._add_settlement("Хмільник", 49.5500, 27.9667, "Вінницька", "місто", 27000)
-        self._add_settlement("Жмеринка", 49.0389, 28.1056, "Вінницька", "місто", 34000)
-        
-        # Івано-Франківська область
-        self._add_settlement("Коломия", 48.5303, 25.0364, "Івано-Франківська", "місто", 61000)
-        self._add_settlement("Калуш", 49.0433, 24.3600, "Івано-Франківська", "місто", 67000)
-        
-        # Тернопільська область
-        self._add_settlement("Чортків", 49.0167, 25.8000, "Тернопільська", "місто", 29000)
-        self._add_settlement("Бережани", 49.4444, 24.9389, "Тернопільська", "місто", 17000)
-                # ========== ТЕРНОПІЛЬСЬКА ОБЛАСТЬ - ДОДАТКОВІ НАСЕЛЕНІ ПУНКТИ ==========
-        # Районні центри та міста
-        self._add_settlement("Теребовля", 49.3000, 25.7000, "Тернопільська", "місто", 13000)
-        self._add_settlement("Кременець", 50.1167, 25.7333, "Тернопільська", "місто", 21000)
-        self._add_settlement("Збараж", 49.6667, 25.7833, "Тернопільська", "місто", 14000)
-        self._add_settlement("Заліщики", 48.6333, 25.7333, "Тернопільська", "місто", 10000)
-        self._add_settlement("Борщів", 48.8000, 26.0333, "Тернопільська", "місто", 11000)
-        self._add_settlement("Шумськ", 50.1167, 26.1167, "Тернопільська", "місто", 5500)
-        self._add_settlement("Підволочиськ", 49.5333, 26.1500, "Тернопільська", "селище міського типу", 8000)
-        self._add_settlement("Скалат", 49.4333, 25.9833, "Тернопільська", "місто", 4000)
-        self._add_settlement("Гусятин", 49.0667, 26.2000, "Тернопільська", "селище міського типу", 7000)
-        self._add_settlement("Монастириська", 49.0833, 24.9333, "Тернопільська", "місто", 6000)
+        """Завантаження розширеної бази населених пунктів України з Python-джерела"""
+        from settlements_source import load_extended_database
+        load_extended_database(self)
         
-        # Великі селища
-        self._add_settlement("Великі Бірки", 49.5167, 25.7500, "Тернопільська", "селище", 5000)
-        self._add_settlement("Залізці", 49.8000, 25.3833, "Тернопільська", "селище", 4500)
-        self._add_settlement("Козова", 49.4333, 25.1500, "Тернопільська", "селище", 9000)
-        self._add_settlement("Козлів", 49.4667, 25.2667, "Тернопільська", "селище", 4000)
-        self._add_settlement("Микулинці", 49.3833, 25.6167, "Тернопільська", "селище", 5500)
-        self._add_settlement("Підгайці", 49.2667, 25.1333, "Тернопільська", "місто", 2800)
-        
-        # Селища міського типу
-        self._add_settlement("Бучач", 49.0667, 25.3833, "Тернопільська", "місто", 12000)
-        self._add_settlement("Копичинці", 49.1000, 25.9167, "Тернопільська", "селище міського типу", 7000)
-        self._add_settlement("Почаїв", 50.0000, 25.5000, "Тернопільська", "місто", 8000)
-        self._add_settlement("Вишнівець", 49.9000, 25.7333, "Тернопільська", "селище міського типу", 3500)
-        
-        # Великі села
-        self._add_settlement("Баворів", 49.4333, 25.7333, "Тернопільська", "село", 2500)
-        self._add_settlement("Біла", 49.0333, 25.7667, "Тернопільська", "село", 1800)
-        self._add_settlement("Білокриниця", 49.6500, 25.7167, "Тернопільська", "село", 1600)
-        self._add_settlement("Божиків", 49.7667, 25.5333, "Тернопільська", "село", 1200)
-        self._add_settlement("Велика Березовиця", 49.4833, 25.6000, "Тернопільська", "село", 3500)
-        self._add_settlement("Великі Гаї", 49.4167, 25.7000, "Тернопільська", "село", 2800)
-        self._add_settlement("Глібів", 49.3833, 25.7333, "Тернопільська", "село", 1500)
-        self._add_settlement("Горожанка", 49.3167, 25.8667, "Тернопільська", "село", 2200)
-        self._add_settlement("Дарахів", 49.2333, 25.5167, "Тернопільська", "село", 1300)
-        self._add_settlement("Довге", 49.1833, 25.7167, "Тернопільська", "село", 1700)
-        self._add_settlement("Зборів", 49.6667, 25.1500, "Тернопільська", "місто", 7000)
-        self._add_settlement("Іване-Пусте", 49.6167, 25.9667, "Тернопільська", "село", 1400)
-        self._add_settlement("Колодне", 49.1167, 25.9333, "Тернопільська", "село", 1100)
-        self._add_settlement("Коропець", 48.9333, 25.1833, "Тернопільська", "селище", 3500)
-        self._add_settlement("Коршилів", 49.2667, 25.9500, "Тернопільська", "село", 900)
-        self._add_settlement("Котів", 49.7333, 25.9000, "Тернопільська", "село", 1600)
-        self._add_settlement("Ладичин", 49.3667, 25.5833, "Тернопільська", "село", 1800)
-        self._add_settlement("Лозова", 49.4667, 25.8167, "Тернопільська", "село", 1200)
-        self._add_settlement("Мельниця-Подільська", 48.6000, 26.1500, "Тернопільська", "селище", 4000)
-        self._add_settlement("Мильне", 49.3333, 25.4167, "Тернопільська", "село", 1400)
-        self._add_settlement("Нагірянка", 48.8500, 25.7833, "Тернопільська", "село", 1000)
-        self._add_settlement("Озерна", 49.6333, 25.3167, "Тернопільська", "селище", 2800)
-        self._add_settlement("Острівець", 49.2167, 25.6833, "Тернопільська", "село", 1100)
-        self._add_settlement("Підвисоке", 48.9833, 25.7667, "Тернопільська", "село", 1300)
-        self._add_settlement("Підгородне", 49.5333, 25.5833, "Тернопільська", "село", 1900)
-        self._add_settlement("Пробіжна", 48.8833, 25.7833, "Тернопільська", "село", 1500)
-        self._add_settlement("Самолусківці", 48.7333, 26.0500, "Тернопільська", "село", 1200)
-        self._add_settlement("Скала-Подільська", 48.8500, 26.2000, "Тернопільська", "селище", 4500)
-        self._add_settlement("Слобідка", 49.1000, 25.3833, "Тернопільська", "село", 1000)
-        self._add_settlement("Соколів", 49.4667, 25.9167, "Тернопільська", "село", 800)
-        self._add_settlement("Старий Скалат", 49.4500, 25.9833, "Тернопільська", "село", 900)
-        self._add_settlement("Стриївка", 49.2833, 25.3500, "Тернопільська", "село", 1100)
-        self._add_settlement("Товсте", 48.8500, 25.7167, "Тернопільська", "селище", 3200)
-        self._add_settlement("Трибухівці", 49.0833, 25.3833, "Тернопільська", "село", 1300)
-        self._add_settlement("Увисла", 49.3167, 25.2167, "Тернопільська", "село", 1400)
-        self._add_settlement("Устя", 49.0500, 26.2167, "Тернопільська", "село", 1600)
-        self._add_settlement("Хоростків", 49.2167, 25.9167, "Тернопільська", "місто", 7300)
-        self._add_settlement("Чернилівка", 49.0333, 25.4333, "Тернопільська", "село", 1200)
-        self._add_settlement("Швайківці", 49.0833, 26.1000, "Тернопільська", "село", 1100)
-        self._add_settlement("Яблунівка", 49.1500, 25.6667, "Тернопільська", "село", 1000)
-        self._add_settlement("Ягільниця", 48.9333, 25.7333, "Тернопільська", "селище", 2900)
-
-                # Додаткові села Тернопільської області
-        self._add_settlement("Антонівці", 49.2167, 25.3667, "Тернопільська", "село", 800)
-        self._add_settlement("Багновиця", 49.1167, 25.7833, "Тернопільська", "село", 600)
-        self._add_settlement("Бережанка", 49.4500, 25.5167, "Тернопільська", "село", 950)
-        self._add_settlement("Біле", 49.5667, 25.6000, "Тернопільська", "село", 1100)
-        self._add_settlement("Білобожниця", 49.0500, 25.6667, "Тернопільська", "село", 750)
-        self._add_settlement("Борисівка", 49.3000, 25.2500, "Тернопільська", "село", 900)
-        self._add_settlement("Буданів", 49.2333, 25.6833, "Тернопільська", "село", 1200)
-        self._add_settlement("Бурдяківці", 48.9833, 26.0000, "Тернопільська", "село", 850)
-        self._add_settlement("Великі Дедеркали", 49.3667, 25.7667, "Тернопільська", "село", 1300)
-        self._add_settlement("Вербів", 49.4667, 25.6833, "Тернопільська", "село", 1400)
-        self._add_settlement("Верхняківці", 49.0833, 25.9167, "Тернопільська", "село", 1100)
-        self._add_settlement("Вигнанка", 49.1500, 25.5167, "Тернопільська", "село", 950)
-        self._add_settlement("Вірлів", 49.5167, 25.7333, "Тернопільська", "село", 1000)
-        self._add_settlement("Вікно", 49.1000, 25.2333, "Тернопільська", "село", 800)
-        self._add_settlement("Волощина", 49.5333, 25.1667, "Тернопільська", "село", 1200)
-        self._add_settlement("Гадинківці", 48.9500, 26.0333, "Тернопільська", "село", 700)
-        self._add_settlement("Гайок", 49.3167, 25.3667, "Тернопільська", "село", 650)
-        self._add_settlement("Гвардійське", 49.3833, 25.1500, "Тернопільська", "село", 1100)
-        self._add_settlement("Глибочок", 48.9167, 25.9333, "Тернопільська", "село", 900)
-        self._add_settlement("Гнилиці", 49.2333, 25.4333, "Тернопільська", "село", 850)
-        self._add_settlement("Гори", 49.5833, 25.8833, "Тернопільська", "село", 950)
-        self._add_settlement("Грабавці", 49.1167, 25.4500, "Тернопільська", "село", 1000)
-        self._add_settlement("Губин", 49.0500, 25.5833, "Тернопільська", "село", 1200)
-        self._add_settlement("Гутисько", 49.1833, 25.2333, "Тернопільська", "село", 750)
-        self._add_settlement("Двірець", 49.6333, 25.8333, "Тернопільська", "село", 1100)
-        self._add_settlement("Демня", 49.5667, 25.2333, "Тернопільська", "село", 900)
-        self._add_settlement("Денисів", 49.4000, 25.2333, "Тернопільська", "село", 850)
-        self._add_settlement("Діброва", 49.1500, 25.1667, "Тернопільська", "село", 800)
-        self._add_settlement("Доброводи", 49.2333, 25.0833, "Тернопільська", "село", 1200)
-        self._add_settlement("Довжанка", 49.6667, 25.5000, "Тернопільська", "село", 1300)
-        self._add_settlement("Долина", 49.0167, 25.7833, "Тернопільська", "село", 1100)
-        self._add_settlement("Дружба", 49.4833, 25.2667, "Тернопільська", "село", 950)
-        self._add_settlement("Жабинці", 49.6333, 25.6000, "Тернопільська", "село", 1400)
-        self._add_settlement("Жеребки", 49.3833, 25.6667, "Тернопільська", "село", 1200)
-        self._add_settlement("Залав'є", 49.2833, 25.5500, "Тернопільська", "село", 900)
-        self._add_settlement("Залісся", 49.5333, 25.5167, "Тернопільська", "село", 1100)
-        self._add_settlement("Заруддя", 49.3333, 25.1667, "Тернопільська", "село", 800)
-        self._add_settlement("Зарваниця", 49.1500, 25.3000, "Тернопільська", "село", 700)
-        self._add_settlement("Застіноче", 49.0500, 25.5167, "Тернопільська", "село", 950)
-        self._add_settlement("Золотники", 49.3333, 25.2833, "Тернопільська", "село", 1300)
-        self._add_settlement("Іванівка", 49.4667, 25.1500, "Тернопільська", "село", 1000)
-        self._add_settlement("Іванків", 49.5667, 25.7500, "Тернопільська", "село", 1200)
-        self._add_settlement("Кальне", 49.4333, 25.8333, "Тернопільська", "село", 950)
-        self._add_settlement("Кам'янка", 49.0333, 25.3833, "Тернопільська", "село", 1100)
-        self._add_settlement("Карашин", 49.1167, 25.1000, "Тернопільська", "село", 850)
-        self._add_settlement("Кобилля", 49.0833, 25.8167, "Тернопільська", "село", 1000)
-        self._add_settlement("Колосова", 49.2167, 25.2833, "Тернопільська", "село", 900)
-        self._add_settlement("Конилів", 49.3333, 25.4833, "Тернопільська", "село", 1200)
-        self._add_settlement("Королівка", 49.0500, 25.1833, "Тернопільська", "село", 750)
-        self._add_settlement("Косів", 49.2167, 25.9167, "Тернопільська", "село", 1100)
-        self._add_settlement("Костільники", 49.3833, 25.5333, "Тернопільська", "село", 1000)
-        self._add_settlement("Котузів", 49.1833, 25.5833, "Тернопільська", "село", 850)
-        self._add_settlement("Кривче", 48.7000, 26.1167, "Тернопільська", "село", 1300)
-        self._add_settlement("Крилос", 49.5167, 25.3667, "Тернопільська", "село", 950)
-        self._add_settlement("Куряни", 49.5333, 25.6833, "Тернопільська", "село", 1100)
-        self._add_settlement("Ласківці", 49.1500, 25.8833, "Тернопільська", "село", 1000)
-        self._add_settlement("Липовиця", 49.2333, 25.7500, "Тернопільська", "село", 1200)
-        self._add_settlement("Лошнів", 49.7500, 25.6000, "Тернопільська", "село", 1100)
-        self._add_settlement("Лучинці", 49.0333, 25.6667, "Тернопільська", "село", 900)
-        self._add_settlement("Людвищі", 49.2833, 25.4000, "Тернопільська", "село", 850)
-        self._add_settlement("Малинівка", 49.1167, 25.6667, "Тернопільська", "село", 950)
-        self._add_settlement("Малі Бірки", 49.5333, 25.7667, "Тернопільська", "село", 800)
-        self._add_settlement("Медова", 49.3833, 25.4167, "Тернопільська", "село", 1100)
-        self._add_settlement("Мишковичі", 49.6667, 25.2333, "Тернопільська", "село", 900)
-        self._add_settlement("Млинці", 49.0833, 25.3333, "Тернопільська", "село", 750)
-        self._add_settlement("Мушкатівка", 49.2333, 25.1833, "Тернопільська", "село", 850)
-        self._add_settlement("Нараїв", 49.5167, 24.7667, "Тернопільська", "село", 1300)
-        self._add_settlement("Нестаничі", 49.3333, 25.1167, "Тернопільська", "село", 900)
-        self._add_settlement("Нижбірок", 49.4500, 25.3500, "Тернопільська", "село", 1100)
-        self._add_settlement("Новики", 49.1833, 25.4500, "Тернопільська", "село", 950)
-        self._add_settlement("Носів", 49.3000, 25.6833, "Тернопільська", "село", 1200)
-        self._add_settlement("Озеряни", 49.6333, 25.3333, "Тернопільська", "село", 1400)
-        self._add_settlement("Оліїв", 49.5167, 25.0667, "Тернопільська", "село", 1000)
-        self._add_settlement("Острів", 49.3667, 25.2333, "Тернопільська", "село", 1100)
-        self._add_settlement("Палашівка", 49.4167, 25.1667, "Тернопільська", "село", 900)
-        self._add_settlement("Петриків", 49.5333, 25.4500, "Тернопільська", "село", 1200)
-        self._add_settlement("Підберізці", 49.4500, 25.4500, "Тернопільська", "село", 1100)
-        self._add_settlement("Підгайчики", 49.2667, 25.1333, "Тернопільська", "село", 1000)
-        self._add_settlement("Підлісне", 49.2333, 25.0333, "Тернопільська", "село", 850)
-        self._add_settlement("Пісочне", 49.1167, 25.2333, "Тернопільська", "село", 750)
-        self._add_settlement("Плотича", 49.6667, 25.0667, "Тернопільська", "село", 1100)
-        self._add_settlement("Пнів", 49.6167, 25.5167, "Тернопільська", "село", 1200)
-        self._add_settlement("Поточище", 49.0500, 25.9000, "Тернопільська", "село", 950)
-        self._add_settlement("Присівці", 49.3833, 25.8000, "Тернопільська", "село", 1000)
-        self._add_settlement("Різдвяни", 49.5167, 25.1833, "Тернопільська", "село", 850)
-        self._add_settlement("Ромашівка", 49.3167, 25.8333, "Тернопільська", "село", 1100)
-        self._add_settlement("Рудки", 49.1833, 25.7167, "Тернопільська", "село", 1200)
-        self._add_settlement("Сахнівці", 49.1167, 25.5833, "Тернопільська", "село", 1000)
-        self._add_settlement("Семиківці", 49.2833, 25.2833, "Тернопільська", "село", 950)
-        self._add_settlement("Серетець", 49.4667, 25.5667, "Тернопільська", "село", 1100)
-        self._add_settlement("Скородинці", 49.0333, 25.2333, "Тернопільська", "село", 800)
-        self._add_settlement("Слав'ятин", 49.2167, 25.8333, "Тернопільська", "село", 1200)
-        self._add_settlement("Сокиринці", 49.0833, 25.6667, "Тернопільська", "село", 900)
-        self._add_settlement("Солоне", 49.5667, 25.4000, "Тернопільська", "село", 1100)
-        self._add_settlement("Сопів", 49.3833, 25.3167, "Тернопільська", "село", 1000)
-        self._add_settlement("Соснів", 49.5167, 25.2667, "Тернопільська", "село", 950)
-        self._add_settlement("Старий Вишнівець", 49.9000, 25.5500, "Тернопільська", "село", 1300)
-        self._add_settlement("Струсів", 49.2833, 25.9833, "Тернопільська", "село", 1400)
-        self._add_settlement("Суховоля", 49.1667, 25.1500, "Тернопільська", "село", 900)
-        self._add_settlement("Тарноруда", 49.6333, 25.8333, "Тернопільська", "село", 1100)
-        self._add_settlement("Теклівка", 49.0500, 25.5167, "Тернопільська", "село", 950)
-        self._add_settlement("Терновиця", 49.3500, 25.5667, "Тернопільська", "село", 1000)
-        self._add_settlement("Товстеньке", 48.9167, 25.7833, "Тернопільська", "село", 1200)
-        self._add_settlement("Токів", 49.2667, 25.9167, "Тернопільська", "село", 1100)
-        self._add_settlement("Тростянець", 49.0167, 25.7167, "Тернопільська", "село", 1300)
-        self._add_settlement("Угрин", 49.3667, 25.1500, "Тернопільська", "село", 900)
-        self._add_settlement("Хартонівці", 49.1500, 25.3667, "Тернопільська", "село", 950)
-        self._add_settlement("Хмелівка", 49.2833, 25.1333, "Тернопільська", "село", 800)
-        self._add_settlement("Хомівка", 49.4667, 25.2333, "Тернопільська", "село", 900)
-        self._add_settlement("Цебрів", 49.0667, 25.4333, "Тернопільська", "село", 1100)
-        self._add_settlement("Чернихів", 49.1833, 25.5167, "Тернопільська", "село", 1000)
-        self._add_settlement("Чистилів", 49.2833, 25.6333, "Тернопільська", "село", 1200)
-        self._add_settlement("Шельпаки", 49.2333, 25.3333, "Тернопільська", "село", 950)
-        self._add_settlement("Шманьківці", 48.9833, 25.8500, "Тернопільська", "село", 1000)
-        self._add_settlement("Шумляни", 49.2833, 25.0667, "Тернопільська", "село", 900)
-        self._add_settlement("Яворів", 49.4333, 25.0667, "Тернопільська", "село", 1100)
-        self._add_settlement("Якимівці", 49.1167, 25.9167, "Тернопільська", "село", 1000)
-
-                # ========== ТЕРНОПІЛЬСЬКА ОБЛАСТЬ - ЩЕ БІЛЬШЕ СЕЛ ==========
-        # Села Теребовлянського району
-        self._add_settlement("Бернардівка", 49.3833, 25.6333, "Тернопільська", "село", 850)
-        self._add_settlement("Богданівка", 49.3333, 25.6833, "Тернопільська", "село", 920)
-        self._add_settlement("Будилів", 49.3500, 25.7500, "Тернопільська", "село", 1100)
-        self._add_settlement("Вербовець", 49.3167, 25.6167, "Тернопільська", "село", 780)
-        self._add_settlement("Волиця", 49.2833, 25.6500, "Тернопільська", "село", 950)
-        self._add_settlement("Глещава", 49.4000, 25.7667, "Тернопільська", "село", 1200)
-        self._add_settlement("Гніздичне", 49.3500, 25.7167, "Тернопільська", "село", 880)
-        self._add_settlement("Горішня Липниця", 49.4667, 25.6833, "Тернопільська", "село", 1400)
-        self._add_settlement("Деренівка", 49.3000, 25.7167, "Тернопільська", "село", 1020)
-        self._add_settlement("Діброва", 49.3833, 25.6500, "Тернопільська", "село", 920)
-        self._add_settlement("Іванівка", 49.2667, 25.7000, "Тернопільська", "село", 1150)
-        self._add_settlement("Кобиловолоки", 49.3333, 25.7667, "Тернопільська", "село", 980)
-        self._add_settlement("Колінці", 49.4167, 25.7667, "Тернопільська", "село", 870)
-        self._add_settlement("Котівка", 49.3667, 25.8000, "Тернопільська", "село", 760)
-        self._add_settlement("Кровинка", 49.2833, 25.6667, "Тернопільська", "село", 1050)
-        self._add_settlement("Мала Березовиця", 49.4500, 25.6333, "Тернопільська", "село", 1250)
-        self._add_settlement("Малий Ходачків", 49.4167, 25.7333, "Тернопільська", "село", 1100)
-        self._add_settlement("Милове", 49.2833, 25.6000, "Тернопільська", "село", 890)
-        self._add_settlement("Млинівці", 49.2500, 25.6500, "Тернопільська", "село", 950)
-        self._add_settlement("Нараївка", 49.3667, 25.6833, "Тернопільська", "село", 1020)
-        self._add_settlement("Плескачівка", 49.3333, 25.7000, "Тернопільська", "село", 840)
-        self._add_settlement("Плотича", 49.4000, 25.6833, "Тернопільська", "село", 960)
-        self._add_settlement("Почапинці", 49.3167, 25.7333, "Тернопільська", "село", 1120)
-        self._add_settlement("Романівка", 49.2833, 25.6833, "Тернопільська", "село", 980)
-        self._add_settlement("Семенів", 49.3333, 25.6667, "Тернопільська", "село", 1050)
-        self._add_settlement("Слобідка", 49.3833, 25.7000, "Тернопільська", "село", 920)
-        self._add_settlement("Сущин", 49.4167, 25.8167, "Тернопільська", "село", 880)
-        self._add_settlement("Теклівка", 49.3667, 25.7500, "Тернопільська", "село", 950)
-        self._add_settlement("Чагарі", 49.4000, 25.7167, "Тернопільська", "село", 820)
-        self._add_settlement("Шляхтинці", 49.3333, 25.8000, "Тернопільська", "село", 910)
-        self._add_settlement("Щепанів", 49.2667, 25.7667, "Тернопільська", "село", 1050)
-        
-        # Села Чортківського району
-        self._add_settlement("Баликівці", 48.9833, 25.4667, "Тернопільська", "село", 1200)
-        self._add_settlement("Біловож", 48.9333, 25.6333, "Тернопільська", "село", 1100)
-        self._add_settlement("Вигода", 49.0167, 25.5667, "Тернопільська", "село", 950)
-        self._add_settlement("Вільхівці", 48.9833, 25.5833, "Тернопільська", "село", 1250)
-        self._add_settlement("Говди", 48.9333, 25.7000, "Тернопільська", "село", 1350)
-        self._add_settlement("Горигляди", 48.9667, 25.5167, "Тернопільська", "село", 1150)
-        self._add_settlement("Джурин", 48.8667, 25.7167, "Тернопільська", "село", 1400)
-        self._add_settlement("Довге", 48.9667, 25.7667, "Тернопільська", "село", 1300)
-        self._add_settlement("Жабче", 49.0000, 25.6333, "Тернопільська", "село", 1050)
-        self._add_settlement("Залісся", 48.9833, 25.5167, "Тернопільська", "село", 980)
-        self._add_settlement("Зелена", 48.9333, 25.5667, "Тернопільська", "село", 1120)
-        self._add_settlement("Іванів", 48.9000, 25.6833, "Тернопільська", "село", 1250)
-        self._add_settlement("Коржова", 48.9500, 25.5167, "Тернопільська", "село", 1050)
-        self._add_settlement("Лазарівка", 48.9833, 25.7000, "Тернопільська", "село", 1150)
-        self._add_settlement("Лисичники", 48.9167, 25.6333, "Тернопільська", "село", 1200)
-        self._add_settlement("Малий Ходачків", 48.9667, 25.5667, "Тернопільська", "село", 920)
-        self._add_settlement("Незвисько", 48.9833, 25.6167, "Тернопільська", "село", 1080)
-        self._add_settlement("Окописька", 48.9000, 25.7333, "Тернопільська", "село", 950)
-        self._add_settlement("Оришківці", 48.9333, 25.6667, "Тернопільська", "село", 1120)
-        self._add_settlement("Перемилів", 48.9667, 25.6833, "Тернопільська", "село", 1250)
-        self._add_settlement("Підлісне", 48.9500, 25.5833, "Тернопільська", "село", 1050)
-        self._add_settlement("Різдвяни", 48.9833, 25.5333, "Тернопільська", "село", 980)
-        self._add_settlement("Росохач", 48.9333, 25.6167, "Тернопільська", "село", 1150)
-        self._add_settlement("Семиківці", 48.9667, 25.5167, "Тернопільська", "село", 1020)
-        self._add_settlement("Скоморохи", 48.9167, 25.6833, "Тернопільська", "село", 1180)
-        self._add_settlement("Слобідка", 48.9500, 25.7167, "Тернопільська", "село", 1250)
-        self._add_settlement("Сосулівка", 48.9833, 25.6500, "Тернопільська", "село", 1120)
-        self._add_settlement("Стара Ягільниця", 48.9333, 25.7500, "Тернопільська", "село", 1350)
-        self._add_settlement("Стецівка", 48.9667, 25.6000, "Тернопільська", "село", 1080)
-        self._add_settlement("Трудове", 48.9333, 25.5333, "Тернопільська", "село", 980)
-        self._add_settlement("Увисла", 48.9500, 25.6833, "Тернопільська", "село", 1120)
-        self._add_settlement("Хомівка", 48.9833, 25.5833, "Тернопільська", "село", 1050)
-        self._add_settlement("Чернихів", 48.9667, 25.5167, "Тернопільська", "село", 1150)
-        self._add_settlement("Швайківці", 48.9167, 25.6167, "Тернопільська", "село", 1200)
-        self._add_settlement("Юрківка", 48.9500, 25.6667, "Тернопільська", "село", 1180)
-        
-        # Села Бережанського району
-        self._add_settlement("Бариш", 49.5167, 24.9333, "Тернопільська", "село", 1250)
-        self._add_settlement("Біще", 49.4833, 24.8833, "Тернопільська", "село", 980)
-        self._add_settlement("Божиківка", 49.5167, 24.9667, "Тернопільська", "село", 1050)
-        self._add_settlement("Боків", 49.4833, 24.9500, "Тернопільська", "село", 920)
-        self._add_settlement("Бронгалівка", 49.4500, 24.8667, "Тернопільська", "село", 880)
-        self._add_settlement("Волиця", 49.4167, 24.9833, "Тернопільська", "село", 950)
-        self._add_settlement("Гай", 49.4333, 24.9167, "Тернопільська", "село", 1120)
-        self._add_settlement("Гнильче", 49.4000, 24.9333, "Тернопільська", "село", 1050)
-        self._add_settlement("Гончарівка", 49.3667, 24.9500, "Тернопільська", "село", 980)
-        self._add_settlement("Горішня", 49.5167, 24.9000, "Тернопільська", "село", 1150)
-        self._add_settlement("Доброполе", 49.4833, 24.9167, "Тернопільська", "село", 1020)
-        self._add_settlement("Залуччя", 49.4333, 24.9667, "Тернопільська", "село", 920)
-        self._add_settlement("Золота", 49.4667, 24.9833, "Тернопільська", "село", 1050)
-        self._add_settlement("Княже", 49.5167, 24.8667, "Тернопільська", "село", 880)
-        self._add_settlement("Кобиляни", 49.4333, 24.8833, "Тернопільська", "село", 1120)
-        self._add_settlement("Козівка", 49.4000, 24.9000, "Тернопільська", "село", 1050)
-        self._add_settlement("Красна", 49.3667, 24.9167, "Тернопільська", "село", 980)
-        self._add_settlement("Кривки", 49.4833, 24.9333, "Тернопільська", "село", 920)
-        self._add_settlement("Лапшин", 49.4167, 24.9500, "Тернопільська", "село", 1050)
-        self._add_settlement("Лисня", 49.4500, 24.9333, "Тернопільська", "село", 1120)
-        self._add_settlement("Літятин", 49.5167, 24.9500, "Тернопільська", "село", 980)
-        self._add_settlement("Мала Березовиця", 49.5167, 24.9167, "Тернопільська", "село", 920)
-        self._add_settlement("Малий Ходачків", 49.4333, 24.9667, "Тернопільська", "село", 880)
-        self._add_settlement("Млинівці", 49.4500, 24.9000, "Тернопільська", "село", 1050)
-        self._add_settlement("Надорожнів", 49.4833, 24.9000, "Тернопільська", "село", 980)
-        self._add_settlement("Нове Село", 49.4000, 24.9667, "Тернопільська", "село", 920)
-        self._add_settlement("Підлісне", 49.4333, 24.9333, "Тернопільська", "село", 880)
-        self._add_settlement("Плотича", 49.4000, 24.9833, "Тернопільська", "село", 1050)
-        self._add_settlement("Почапинці", 49.4333, 24.9167, "Тернопільська", "село", 980)
-        self._add_settlement("Рай", 49.4667, 24.9500, "Тернопільська", "село", 920)
-        self._add_settlement("Росохач", 49.4333, 24.9667, "Тернопільська", "село", 1050)
-        self._add_settlement("Садки", 49.4833, 24.9333, "Тернопільська", "село", 920)
-        self._add_settlement("Семенів", 49.4333, 24.9000, "Тернопільська", "село", 980)
-        self._add_settlement("Скоморохи", 49.4500, 24.9833, "Тернопільська", "село", 1050)
-        self._add_settlement("Слобідка", 49.4167, 24.9333, "Тернопільська", "село", 920)
-        self._add_settlement("Сопич", 49.4833, 24.8833, "Тернопільська", "село", 880)
-        self._add_settlement("Старе Село", 49.4000, 24.9167, "Тернопільська", "село", 980)
-        self._add_settlement("Степківці", 49.4667, 24.9667, "Тернопільська", "село", 920)
-        self._add_settlement("Стрілківці", 49.4333, 24.9500, "Тернопільська", "село", 1050)
-        self._add_settlement("Суходіл", 49.5167, 24.9333, "Тернопільська", "село", 980)
-        self._add_settlement("Теклівка", 49.4333, 24.9000, "Тернопільська", "село", 920)
-        self._add_settlement("Тростянець", 49.5167, 24.9500, "Тернопільська", "село", 1050)
-        self._add_settlement("Устя", 49.5167, 24.9667, "Тернопільська", "село", 920)
-        self._add_settlement("Цебрів", 49.4667, 24.9333, "Тернопільська", "село", 980)
-        self._add_settlement("Чернихів", 49.4333, 24.9167, "Тернопільська", "село", 1050)
-        self._add_settlement("Шляхтинці", 49.4833, 24.9500, "Тернопільська", "село", 920)
-        self._add_settlement("Щепанів", 49.4667, 24.9667, "Тернопільська", "село", 880)
-        
-        # Села Кременецького району
-        self._add_settlement("Борисівка", 50.1000, 25.8167, "Тернопільська", "село", 850)
-        self._add_settlement("Вербка", 50.0500, 25.8667, "Тернопільська", "село", 920)
-        self._add_settlement("Волосівка", 50.0833, 25.7833, "Тернопільська", "село", 780)
-        self._add_settlement("Горишня", 50.1167, 25.7500, "Тернопільська", "село", 880)
-        self._add_settlement("Горішня", 50.0667, 25.8167, "Тернопільська", "село", 920)
-        self._add_settlement("Демидівка", 50.0333, 25.7667, "Тернопільська", "село", 850)
-        self._add_settlement("Дермань", 50.0667, 25.8833, "Тернопільська", "село", 980)
-        self._add_settlement("Діброва", 50.1000, 25.8333, "Тернопільська", "село", 920)
-        self._add_settlement("Жабче", 50.0833, 25.9167, "Тернопільська", "село", 1050)
-        self._add_settlement("Загір'я", 50.0333, 25.8500, "Тернопільська", "село", 880)
-        self._add_settlement("Залісся", 50.0667, 25.9000, "Тернопільська", "село", 920)
-        self._add_settlement("Залісці", 49.8000, 25.3833, "Тернопільська", "селище", 4500)
-        self._add_settlement("Заруддя", 50.1167, 25.7833, "Тернопільська", "село", 850)
-        self._add_settlement("Калинівка", 50.0833, 25.8667, "Тернопільська", "село", 920)
-        self._add_settlement("Кам'янка", 50.0500, 25.9167, "Тернопільська", "село", 780)
-        self._add_settlement("Колодне", 50.0333, 25.9333, "Тернопільська", "село", 850)
-        self._add_settlement("Кордишів", 50.1000, 25.9000, "Тернопільська", "село", 920)
-        self._add_settlement("Кривче", 50.0667, 25.8333, "Тернопільська", "село", 980)
-        self._add_settlement("Ланівці", 49.8667, 26.0833, "Тернопільська", "місто", 8500)
-        self._add_settlement("Лісова", 50.0333, 25.7833, "Тернопільська", "село", 880)
-        self._add_settlement("Лопушне", 50.0833, 25.8500, "Тернопільська", "село", 920)
-        self._add_settlement("Мала Березовиця", 50.0667, 25.7667, "Тернопільська", "село", 850)
-        self._add_settlement("Малий Ходачків", 50.1000, 25.8167, "Тернопільська", "село", 920)
-        self._add_settlement("Мишковичі", 50.0500, 25.8833, "Тернопільська", "село", 780)
-        self._add_settlement("Млинівці", 50.0333, 25.8167, "Тернопільська", "село", 850)
-        self._add_settlement("Нове Село", 50.0833, 25.7833, "Тернопільська", "село", 920)
-        self._add_settlement("Острів", 50.0667, 25.8500, "Тернопільська", "село", 980)
-        self._add_settlement("Підгайчики", 50.1000, 25.8667, "Тернопільська", "село", 920)
-        self._add_settlement("Підлісне", 50.0333, 25.7667, "Тернопільська", "село", 850)
-        self._add_settlement("Плотича", 50.0500, 25.8333, "Тернопільська", "село", 880)
-        self._add_settlement("Різдвяни", 50.0667, 25.9000, "Тернопільська", "село", 920)
-        self._add_settlement("Садки", 50.0833, 25.8167, "Тернопільська", "село", 980)
-        self._add_settlement("Семенів", 50.0333, 25.8500, "Тернопільська", "село", 880)
-        self._add_settlement("Слобідка", 50.1000, 25.7833, "Тернопільська", "село", 920)
-        self._add_settlement("Сопів", 50.0667, 25.7667, "Тернопільська", "село", 850)
-        self._add_settlement("Степківці", 50.0500, 25.9000, "Тернопільська", "село", 780)
-        self._add_settlement("Стрілківці", 50.0833, 25.8667, "Тернопільська", "село", 920)
-        self._add_settlement("Теклівка", 50.0333, 25.9167, "Тернопільська", "село", 850)
-        self._add_settlement("Терновиця", 50.0667, 25.8167, "Тернопільська", "село", 980)
-        self._add_settlement("Тростянець", 50.1000, 25.8333, "Тернопільська", "село", 920)
-        self._add_settlement("Угрин", 50.0500, 25.7667, "Тернопільська", "село", 850)
-        self._add_settlement("Устя", 50.0833, 25.9000, "Тернопільська", "село", 920)
-        self._add_settlement("Хомівка", 50.0333, 25.8667, "Тернопільська", "село", 880)
-        self._add_settlement("Цебрів", 50.0667, 25.7833, "Тернопільська", "село", 920)
-        self._add_settlement("Чернихів", 50.1000, 25.8500, "Тернопільська", "село", 980)
-        self._add_settlement("Шляхтинці", 50.0333, 25.8167, "Тернопільська", "село", 850)
-        self._add_settlement("Щепанів", 50.0833, 25.8333, "Тернопільська", "село", 920)
-
-                # ========== ТЕРНОПІЛЬСЬКА ОБЛАСТЬ - ВСІ РАЙОНИ ==========
-        # 1. ЗАЛІЩИЦЬКИЙ РАЙОН
-        self._add_settlement("Устечко", 48.6833, 25.6667, "Тернопільська", "село", 1800)
-        self._add_settlement("Вигода", 48.7167, 25.7500, "Тернопільська", "село", 1200)
-        self._add_settlement("Добрівляни", 48.6667, 25.8000, "Тернопільська", "село", 950)
-        self._add_settlement("Зелене", 48.7000, 25.6833, "Тернопільська", "село", 850)
-        self._add_settlement("Калинівка", 48.6833, 25.8000, "Тернопільська", "село", 1100)
-        self._add_settlement("Колодрібка", 48.6167, 25.7833, "Тернопільська", "село", 780)
-        self._add_settlement("Лисівці", 48.6500, 25.7667, "Тернопільська", "село", 900)
-        self._add_settlement("Млинки", 48.6833, 25.7333, "Тернопільська", "село", 820)
-        self._add_settlement("Нижбірок", 48.6333, 25.8000, "Тернопільська", "село", 750)
-        self._add_settlement("Новики", 48.6667, 25.7500, "Тернопільська", "село", 880)
-        self._add_settlement("Підлісне", 48.6833, 25.6833, "Тернопільська", "село", 920)
-        self._add_settlement("Синьків", 48.6333, 25.7167, "Тернопільська", "село", 1100)
-        self._add_settlement("Сокіл", 48.7000, 25.7667, "Тернопільська", "село", 950)
-        self._add_settlement("Торське", 48.6667, 25.7167, "Тернопільська", "село", 1050)
-        self._add_settlement("Червоне", 48.6500, 25.6833, "Тернопільська", "село", 890)
-
-        # 2. БОРЩІВСЬКИЙ РАЙОН
-        self._add_settlement("Білобожниця", 48.7333, 26.0833, "Тернопільська", "село", 950)
-        self._add_settlement("Верхняки", 48.7667, 26.1000, "Тернопільська", "село", 850)
-        self._add_settlement("Городок", 48.7500, 26.0500, "Тернопільська", "село", 1200)
-        self._add_settlement("Гусятин", 48.7167, 26.1333, "Тернопільська", "село", 1100)
-        self._add_settlement("Дзвиняч", 48.7333, 26.1667, "Тернопільська", "село", 980)
-        self._add_settlement("Залісся", 48.7833, 26.0667, "Тернопільська", "село", 1050)
-        self._add_settlement("Іване-Пусте", 48.6833, 26.1000, "Тернопільська", "село", 920)
-        self._add_settlement("Коржова", 48.8167, 26.0500, "Тернопільська", "село", 880)
-        self._add_settlement("Лісова", 48.7667, 26.0167, "Тернопільська", "село", 950)
-        self._add_settlement("Мушкатівка", 48.8000, 26.1000, "Тернопільська", "село", 1100)
-        self._add_settlement("Новики", 48.7333, 26.0333, "Тернопільська", "село", 850)
-        self._add_settlement("Підлісне", 48.7833, 26.0833, "Тернопільська", "село", 920)
-        self._add_settlement("Різдвяни", 48.7500, 26.1167, "Тернопільська", "село", 1050)
-        self._add_settlement("Слобідка", 48.8167, 26.0833, "Тернопільська", "село", 950)
-        self._add_settlement("Сопів", 48.7667, 26.1333, "Тернопільська", "село", 880)
-        self._add_settlement("Теклівка", 48.8000, 26.0167, "Тернопільська", "село", 1050)
-
-        # 3. ГУСЯТИНСЬКИЙ РАЙОН
-        self._add_settlement("Біла", 49.0333, 26.2333, "Тернопільська", "село", 1300)
-        self._add_settlement("Вербка", 49.0500, 26.1667, "Тернопільська", "село", 950)
-        self._add_settlement("Глибічок", 49.0167, 26.1833, "Тернопільська", "село", 1100)
-        self._add_settlement("Городниця", 49.0833, 26.2167, "Тернопільська", "село", 1050)
-        self._add_settlement("Дарахів", 49.0500, 26.1000, "Тернопільська", "село", 1200)
-        self._add_settlement("Деревляни", 49.0167, 26.1333, "Тернопільська", "село", 980)
-        self._add_settlement("Залісся", 49.0667, 26.1667, "Тернопільська", "село", 1150)
-        self._add_settlement("Калинівка", 49.0333, 26.0833, "Тернопільська", "село", 920)
-        self._add_settlement("Колодне", 49.1000, 26.0333, "Тернопільська", "село", 1100)
-        self._add_settlement("Коржова", 49.0833, 26.1000, "Тернопільська", "село", 1050)
-        self._add_settlement("Лісова", 49.0500, 26.2167, "Тернопільська", "село", 950)
-        self._add_settlement("Млинівці", 49.0167, 26.1667, "Тернопільська", "село", 880)
-        self._add_settlement("Новики", 49.0667, 26.1000, "Тернопільська", "село", 1050)
-        self._add_settlement("Підлісне", 49.0333, 26.1333, "Тернопільська", "село", 920)
-        self._add_settlement("Садки", 49.0833, 26.1833, "Тернопільська", "село", 1100)
-        self._add_settlement("Семенів", 49.0500, 26.0833, "Тернопільська", "село", 980)
-        self._add_settlement("Слобідка", 49.0167, 26.2167, "Тернопільська", "село", 1050)
-
-        # 4. ЗБАРАЗЬКИЙ РАЙОН
-        self._add_settlement("Великі Вікнини", 49.6167, 25.8333, "Тернопільська", "село", 1200)
-        self._add_settlement("Вербка", 49.6833, 25.8000, "Тернопільська", "село", 950)
-        self._add_settlement("Гніздичне", 49.6333, 25.7667, "Тернопільська", "село", 1100)
-        self._add_settlement("Залужжя", 49.6500, 25.8167, "Тернопільська", "село", 1050)
-        self._add_settlement("Залісся", 49.6833, 25.7667, "Тернопільська", "село", 1150)
-        self._add_settlement("Калинівка", 49.6167, 25.8000, "Тернопільська", "село", 980)
-        self._add_settlement("Колодне", 49.6667, 25.8167, "Тернопільська", "село", 920)
-        self._add_settlement("Кордишів", 49.6333, 25.8500, "Тернопільська", "село", 1050)
-        self._add_settlement("Красна", 49.6833, 25.8333, "Тернопільська", "село", 950)
-        self._add_settlement("Лісова", 49.6500, 25.7833, "Тернопільська", "село", 1100)
-        self._add_settlement("Млинівці", 49.6167, 25.7667, "Тернопільська", "село", 880)
-        self._add_settlement("Новики", 49.6667, 25.8000, "Тернопільська", "село", 1050)
-        self._add_settlement("Острів", 49.6833, 25.8500, "Тернопільська", "село", 920)
-        self._add_settlement("Підлісне", 49.6333, 25.8167, "Тернопільська", "село", 980)
-        self._add_settlement("Різдвяни", 49.6500, 25.7667, "Тернопільська", "село", 1050)
-        self._add_settlement("Садки", 49.6667, 25.8333, "Тернопільська", "село", 1100)
-
-        # 5. ЗБОРІВСЬКИЙ РАЙОН
-        self._add_settlement("Малинівка", 49.7000, 25.1333, "Тернопільська", "село", 950)
-        self._add_settlement("Білоголова", 49.6333, 25.1833, "Тернопільська", "село", 1100)
-        self._add_settlement("Вербка", 49.6833, 25.1667, "Тернопільська", "село", 920)
-        self._add_settlement("Глибоке", 49.6500, 25.1333, "Тернопільська", "село", 1050)
-        self._add_settlement("Городниця", 49.6167, 25.1000, "Тернопільська", "село", 980)
-        self._add_settlement("Дарахів", 49.6667, 25.1167, "Тернопільська", "село", 1150)
-        self._add_settlement("Залісся", 49.6333, 25.1500, "Тернопільська", "село", 1050)
-        self._add_settlement("Калинівка", 49.6833, 25.1000, "Тернопільська", "село", 950)
-        self._add_settlement("Колодне", 49.6167, 25.1667, "Тернопільська", "село", 920)
-        self._add_settlement("Коржова", 49.6500, 25.0833, "Тернопільська", "село", 1050)
-        self._add_settlement("Лісова", 49.6667, 25.1333, "Тернопільська", "село", 1100)
-        self._add_settlement("Млинівці", 49.6333, 25.1167, "Тернопільська", "село", 980)
-        self._add_settlement("Новики", 49.6833, 25.1500, "Тернопільська", "село", 1050)
-        self._add_settlement("Озеряни", 49.7000, 25.1000, "Тернопільська", "село", 1200)
-        self._add_settlement("Підлісне", 49.6167, 25.1333, "Тернопільська", "село", 950)
-        self._add_settlement("Різдвяни", 49.6667, 25.1000, "Тернопільська", "село", 1050)
-        self._add_settlement("Садки", 49.6500, 25.1667, "Тернопільська", "село", 1100)
-        self._add_settlement("Семенів", 49.6333, 25.0833, "Тернопільська", "село", 980)
-
-        # 6. КОЗІВСЬКИЙ РАЙОН
-        self._add_settlement("Біла", 49.4500, 25.2000, "Тернопільська", "село", 1100)
-        self._add_settlement("Вербка", 49.4167, 25.1667, "Тернопільська", "село", 950)
-        self._add_settlement("Глибічок", 49.4000, 25.1333, "Тернопільська", "село", 1050)
-        self._add_settlement("Городниця", 49.4667, 25.1500, "Тернопільська", "село", 1150)
-        self._add_settlement("Дарахів", 49.4333, 25.1167, "Тернопільська", "село", 1200)
-        self._add_settlement("Залісся", 49.4167, 25.1833, "Тернопільська", "село", 1100)
-        self._add_settlement("Калинівка", 49.4500, 25.1333, "Тернопільська", "село", 980)
-        self._add_settlement("Колодне", 49.4333, 25.1833, "Тернопільська", "село", 1050)
-        self._add_settlement("Красна", 49.4000, 25.1500, "Тернопільська", "село", 950)
-        self._add_settlement("Лісова", 49.4667, 25.1167, "Тернопільська", "село", 1100)
-        self._add_settlement("Млинівці", 49.4167, 25.1333, "Тернопільська", "село", 920)
-        self._add_settlement("Новики", 49.4500, 25.1667, "Тернопільська", "село", 1050)
-        self._add_settlement("Озеряни", 49.4333, 25.1000, "Тернопільська", "село", 1150)
-        self._add_settlement("Підлісне", 49.4000, 25.1833, "Тернопільська", "село", 980)
-        self._add_settlement("Різдвяни", 49.4667, 25.1333, "Тернопільська", "село", 1050)
-        self._add_settlement("Садки", 49.4167, 25.1500, "Тернопільська", "село", 1100)
-
-        # 7. КРЕМЕНЕЦЬКИЙ РАЙОН (додаткові)
-        self._add_settlement("Бережанка", 50.0833, 25.9167, "Тернопільська", "село", 850)
-        self._add_settlement("Біла", 50.0500, 25.9667, "Тернопільська", "село", 920)
-        self._add_settlement("Глибічок", 50.0333, 25.8833, "Тернопільська", "село", 880)
-        self._add_settlement("Діброва", 50.1000, 25.9000, "Тернопільська", "село", 950)
-        self._add_settlement("Загір'я", 50.0667, 25.9500, "Тернопільська", "село", 920)
-        self._add_settlement("Залісся", 50.0833, 25.8833, "Тернопільська", "село", 1050)
-        self._add_settlement("Калинівка", 50.0333, 25.9167, "Тернопільська", "село", 980)
-        self._add_settlement("Колодне", 50.1000, 25.9667, "Тернопільська", "село", 920)
-        self._add_settlement("Красна", 50.0667, 25.9167, "Тернопільська", "село", 950)
-        self._add_settlement("Лісова", 50.0500, 25.8833, "Тернопільська", "село", 1050)
-
-        # 8. ЛАНОВЕЦЬКИЙ РАЙОН
-        self._add_settlement("Біла", 49.8333, 26.0500, "Тернопільська", "село", 1100)
-        self._add_settlement("Вербка", 49.8500, 26.1000, "Тернопільська", "село", 950)
-        self._add_settlement("Глибічок", 49.8167, 26.0667, "Тернопільська", "село", 1050)
-        self._add_settlement("Городниця", 49.8833, 26.1167, "Тернопільська", "село", 1150)
-        self._add_settlement("Дарахів", 49.8667, 26.0333, "Тернопільська", "село", 1200)
-        self._add_settlement("Залісся", 49.8333, 26.1000, "Тернопільська", "село", 1100)
-        self._add_settlement("Калинівка", 49.8500, 26.0667, "Тернопільська", "село", 980)
-        self._add_settlement("Колодне", 49.8167, 26.0333, "Тернопільська", "село", 1050)
-        self._add_settlement("Красна", 49.8833, 26.0667, "Тернопільська", "село", 950)
-        self._add_settlement("Лісова", 49.8667, 26.1167, "Тернопільська", "село", 1100)
-        self._add_settlement("Млинівці", 49.8333, 26.0833, "Тернопільська", "село", 920)
-        self._add_settlement("Новики", 49.8500, 26.0333, "Тернопільська", "село", 1050)
-        self._add_settlement("Озеряни", 49.8167, 26.1167, "Тернопільська", "село", 1150)
-        self._add_settlement("Підлісне", 49.8833, 26.0500, "Тернопільська", "село", 980)
-
-        # 9. МОНАСТИРИСЬКИЙ РАЙОН
-        self._add_settlement("Біла", 49.0500, 24.9667, "Тернопільська", "село", 1100)
-        self._add_settlement("Вербка", 49.0333, 24.9167, "Тернопільська", "село", 950)
-        self._add_settlement("Глибічок", 49.0667, 24.9500, "Тернопільська", "село", 1050)
-        self._add_settlement("Городниця", 49.1000, 24.9000, "Тернопільська", "село", 1150)
-        self._add_settlement("Дарахів", 49.0833, 24.9833, "Тернопільська", "село", 1200)
-        self._add_settlement("Залісся", 49.0500, 24.9333, "Тернопільська", "село", 1100)
-        self._add_settlement("Калинівка", 49.0333, 24.9667, "Тернопільська", "село", 980)
-        self._add_settlement("Колодне", 49.0667, 24.9167, "Тернопільська", "село", 1050)
-        self._add_settlement("Красна", 49.1000, 24.9500, "Тернопільська", "село", 950)
-        self._add_settlement("Лісова", 49.0833, 24.9000, "Тернопільська", "село", 1100)
-        self._add_settlement("Млинівці", 49.0500, 24.9833, "Тернопільська", "село", 920)
-        self._add_settlement("Новики", 49.0333, 24.9333, "Тернопільська", "село", 1050)
-
-        # 10. ПІДВОЛОЧИСЬКИЙ РАЙОН
-        self._add_settlement("Біла", 49.5000, 26.1167, "Тернопільська", "село", 1100)
-        self._add_settlement("Вербка", 49.4833, 26.0833, "Тернопільська", "село", 950)
-        self._add_settlement("Глибічок", 49.4667, 26.1333, "Тернопільська", "село", 1050)
-        self._add_settlement("Городниця", 49.5167, 26.1667, "Тернопільська", "село", 1150)
-        self._add_settlement("Дарахів", 49.5333, 26.1000, "Тернопільська", "село", 1200)
-        self._add_settlement("Залісся", 49.5000, 26.1500, "Тернопільська", "село", 1100)
-        self._add_settlement("Калинівка", 49.4833, 26.1167, "Тернопільська", "село", 980)
-        self._add_settlement("Колодне", 49.4667, 26.0833, "Тернопільська", "село", 1050)
-        self._add_settlement("Красна", 49.5167, 26.1000, "Тернопільська", "село", 950)
-        self._add_settlement("Лісова", 49.5333, 26.1667, "Тернопільська", "село", 1100)
-        self._add_settlement("Млинівці", 49.5000, 26.1000, "Тернопільська", "село", 920)
-
-        # 11. ПІДГАЄЦЬКИЙ РАЙОН
-        self._add_settlement("Біла", 49.2333, 25.1667, "Тернопільська", "село", 1100)
-        self._add_settlement("Вербка", 49.2500, 25.1167, "Тернопільська", "село", 950)
-        self._add_settlement("Глибічок", 49.2167, 25.1500, "Тернопільська", "село", 1050)
-        self._add_settlement("Городниця", 49.2833, 25.1833, "Тернопільська", "село", 1150)
-        self._add_settlement("Дарахів", 49.2667, 25.1000, "Тернопільська", "село", 1200)
-        self._add_settlement("Залісся", 49.2333, 25.1333, "Тернопільська", "село", 1100)
-        self._add_settlement("Калинівка", 49.2500, 25.1500, "Тернопільська", "село", 980)
-        self._add_settlement("Колодне", 49.2167, 25.1167, "Тернопільська", "село", 1050)
-        self._add_settlement("Красна", 49.2833, 25.1000, "Тернопільська", "село", 950)
-        self._add_settlement("Лісова", 49.2667, 25.1833, "Тернопільська", "село", 1100)
-        self._add_settlement("Млинівці", 49.2333, 25.1000, "Тернопільська", "село", 920)
-
-        # 12. ТЕРЕБОВЛЯНСЬКИЙ РАЙОН (додаткові)
-        self._add_settlement("Бережанка", 49.2833, 25.5667, "Тернопільська", "село", 850)
-        self._add_settlement("Вербка", 49.3167, 25.6000, "Тернопільська", "село", 920)
-        self._add_settlement("Глибічок", 49.3000, 25.6333, "Тернопільська", "село", 880)
-        self._add_settlement("Діброва", 49.3333, 25.5833, "Тернопільська", "село", 950)
-        self._add_settlement("Загір'я", 49.2667, 25.6167, "Тернопільська", "село", 920)
-        self._add_settlement("Залісся", 49.2833, 25.6000, "Тернопільська", "село", 1050)
-        self._add_settlement("Калинівка", 49.3167, 25.6333, "Тернопільська", "село", 980)
-        self._add_settlement("Колодне", 49.3000, 25.5833, "Тернопільська", "село", 920)
-        self._add_settlement("Красна", 49.2667, 25.5667, "Тернопільська", "село", 950)
-
-        # 13. ЧОРТКІВСЬКИЙ РАЙОН (додаткові)
-        self._add_settlement("Бережанка", 48.9167, 25.7667, "Тернопільська", "село", 850)
-        self._add_settlement("Вербка", 48.9333, 25.8000, "Тернопільська", "село", 920)
-        self._add_settlement("Глибічок", 48.9167, 25.8333, "Тернопільська", "село", 880)
-        self._add_settlement("Діброва", 48.9500, 25.7833, "Тернопільська", "село", 950)
-        self._add_settlement("Загір'я", 48.9333, 25.7500, "Тернопільська", "село", 920)
-        self._add_settlement("Залісся", 48.9167, 25.8000, "Тернопільська", "село", 1050)
-        self._add_settlement("Калинівка", 48.9500, 25.8333, "Тернопільська", "село", 980)
-        self._add_settlement("Колодне", 48.9333, 25.7833, "Тернопільська", "село", 920)
-        self._add_settlement("Красна", 48.9167, 25.7500, "Тернопільська", "село", 950)
-        self._add_settlement("Лісова", 48.9500, 25.8000, "Тернопільська", "село", 1100)
-        self._add_settlement("Млинівці", 48.9333, 25.8333, "Тернопільська", "село", 920)
-        self._add_settlement("Новики", 48.9167, 25.7833, "Тернопільська", "село", 1050)
-        self._add_settlement("Озеряни", 48.9500, 25.7500, "Тернопільська", "село", 1150)
-
-        # Хмельницька область
-        self._add_settlement("Шепетівка", 50.1833, 27.0667, "Хмельницька", "місто", 41000)
-        self._add_settlement("Старокостянтинів", 49.7556, 27.2125, "Хмельницька", "місто", 34000)
-        
-        # Рівненська область
-        self._add_settlement("Дубно", 50.3931, 25.7547, "Рівненська", "місто", 38000)
-        self._add_settlement("Костопіль", 50.8833, 26.4333, "Рівненська", "місто", 31000)
-        
-        # Волинська область
-        self._add_settlement("Ковель", 51.2167, 24.7167, "Волинська", "місто", 69000)
-        self._add_settlement("Нововолинськ", 50.7333, 24.1667, "Волинська", "місто", 53000)
-        
-        # Закарпатська область
-        self._add_settlement("Мукачево", 48.4414, 22.7136, "Закарпатська", "місто", 86000)
-        self._add_settlement("Хуст", 48.1817, 23.2978, "Закарпатська", "місто", 29000)
-        
-        # Кіровоградська область
-        self._add_settlement("Олександрія", 48.6667, 33.1167, "Кіровоградська", "місто", 82000)
-        self._add_settlement("Світловодськ", 49.0833, 33.2500, "Кіровоградська", "місто", 47000)
-        
-        # Полтавська область
-        self._add_settlement("Лубни", 50.0167, 33.0000, "Полтавська", "місто", 46000)
-        self._add_settlement("Горішні Плавні", 49.0106, 33.6444, "Полтавська", "місто", 51000)
-        
-        # Сумська область
-        self._add_settlement("Шостка", 51.8667, 33.4833, "Сумська", "місто", 77000)
-        self._add_settlement("Конотоп", 51.2369, 33.2028, "Сумська", "місто", 88000)
-        
-        # Херсонська область
-        self._add_settlement("Нова Каховка", 46.7500, 33.3667, "Херсонська", "місто", 45000)
-        self._add_settlement("Каховка", 46.8000, 33.4667, "Херсонська", "місто", 36000)
-        
-        # Луганська область
-        self._add_settlement("Алчевськ", 48.4667, 38.8000, "Луганська", "місто", 110000)
-        self._add_settlement("Сєвєродонецьк", 48.9475, 38.4933, "Луганська", "місто", 103000)
-        self._add_settlement("Лисичанськ", 48.9167, 38.4333, "Луганська", "місто", 103000)
-        
-        # АР Крим
-        self._add_settlement("Ялта", 44.4994, 34.1553, "АР Крим", "місто", 79000)
-        self._add_settlement("Феодосія", 45.0489, 35.3792, "АР Крим", "місто", 69000)
-        self._add_settlement("Саки", 45.1336, 33.5772, "АР Крим", "місто", 25000)
-        
-        print(f"✅ Завантажено {sum(len(v) for v in self.settlements.values())} записів про населені пункти")
+        # Ідентифікатори записів - у тому ж порядку, що й у скомпільованому файлі (згруповано за назвою)
+        self._set_table(SettlementTable.from_records(self.table.iter_records()))
+    
+    def _alternates(self) -> List[List[str]]:
+        """Латиниця (КМУ-2010), російські та історичні назви кожного запису таблиці"""
+        table = self.table
+        return [alternate_names(table.name(i), table.region(i)) for i in range(len(table))]
+    
+    def _build_indexes(self):
+        """Побудувати індекси пошуку (після завантаження або зміни бази)"""
+        # Альтернативні назви потрапляють у ті самі індекси, що й основні
+        self._prefix_index = PrefixIndex(self.table, self._alternates())
+        self._lookup_index = LookupIndex(self.table)
+        # Нечіткий індекс потрібен лише коли префіксний пошук нічого не знайшов - будується при першому запиті
+        self._fuzzy_index = None
+        # Просторовий індекс потрібен лише для надісланих геолокацій - теж будується при першому запиті
+        self._spatial_index = None
+    
+    def _invalidate_indexes(self):
+        """Індекси та агрегати будуть перебудовані при наступному зверненні"""
+        self._prefix_index = None
+        self._lookup_index = None
+        self._fuzzy_index = None
+        self._spatial_index = None
+        self._aggregates = {}
+        # Змінюється разом з даними - за ним кешують похідні від бази значення (напр. тексти екранів бота)
+        self.version = next(_data_versions)
+    
+    def _aggregate(self, name: str, compute):
+        """Агрегат бази, обчислений один раз до наступної зміни даних"""
+        value = self._aggregates.get(name)
+        if value is None:
+            value = self._aggregates[name] = compute()
+        return value
+    
+    def warm_indexes(self, fuzzy: bool = True, spatial: bool = True):
+        """Побудувати індекси заздалегідь (напр. для нового знімка перед заміною)"""
+        if self._lookup_index is None or self._prefix_index is None:
+            self._build_indexes()
+        if fuzzy and self._fuzzy_index is None:
+            self._fuzzy_index = FuzzyIndex(self.table, self._alternates())
+        if spatial and self._spatial_index is None:
+            self._spatial_index = SpatialIndex(self.table)
+    
+    def _indexes(self) -> LookupIndex:
+        if self._lookup_index is None:
+            self._build_indexes()
+        return self._lookup_index
     
     def _add_settlement(self, name: str, lat: float, lon: float, region: str, 
                        settlement_type: str, population: int = 0):
         """Додати населений пункт до бази"""
-        if name not in self.settlements:
-            self.settlements[name] = []
-        
-        self.settlements[name].append({
-            'lat': lat,
-            'lon': lon,
-            'region': region,
-            'type': settlement_type,
-            'population': population
-        })
+        self._invalidate_indexes()
+        self.table.append(name, lat, lon, region, settlement_type, population)
     
-    def find_settlements_by_prefix(self, prefix: str, limit: int = 30) -> List[dict]:
+    def find_settlements_by_prefix(self, prefix: str, limit: int = 30) -> List[SettlementView]:
         """Знайти населені пункти за першими символами"""
-        prefix_lower = prefix.lower()
-        results = []
-        
-        for settlement_name, settlements_list in self.settlements.items():
-            if settlement_name.lower().startswith(prefix_lower):
-                for settlement in settlements_list:
-                    results.append({
-                        'name': settlement_name,
-                        'full_name': f"{settlement_name} ({settlement['region']})",
-                        'region': settlement['region'],
-                        'lat': settlement['lat'],
-                        'lon': settlement['lon'],
-                        'type': settlement['type'],
-                        'population': settlement.get('population', 0)
-                    })
+        if self._prefix_index is None:
+            self._build_indexes()
         
-        # Сортуємо за населенням (більші першими), потім за назвою
-        results.sort(key=lambda x: (x['population'], x['name']), reverse=True)
+        # Індекс повертає вже відсортовані (населення, назва - за спаданням) найкращі limit записів
+        return [SettlementView(self.table, record_id) for record_id in self._prefix_index.search(prefix, limit)]
+    
+    def find_settlements_fuzzy(self, query: str, limit: int = 10) -> List[SettlementView]:
+        """Знайти населені пункти з назвою, схожою на query (помилки, інший апостроф)"""
+        if self._fuzzy_index is None:
+            self._fuzzy_index = FuzzyIndex(self.table, self._alternates())
         
-        return results[:limit]
+        return [self.table.view(record_id, similarity=round(similarity, 3))
+                for similarity, record_id in self._fuzzy_index.search(query, limit)]
+    
+    def _spatial(self) -> SpatialIndex:
+        if self._spatial_index is None:
+            self._spatial_index = SpatialIndex(self.table)
+        return self._spatial_index
+    
+    def find_nearest_settlements(self, lat: float, lon: float, k: int = 1,
+                                 max_distance_km: Optional[float] = None) -> List[SettlementView]:
+        """k населених пунктів, найближчих до точки (lat, lon), з відстанню 'distance_km'"""
+        table = self.table
+        return [SettlementView(table, record_id, {'distance_km': round(distance, 2)})
+                for distance, record_id in self._spatial().nearest(lat, lon, k, max_distance_km)]
+    
+    def find_settlements_within_radius(self, lat: float, lon: float, radius_km: float,
+                                       limit: Optional[int] = None) -> List[SettlementView]:
+        """Населені пункти в радіусі radius_km від точки, найближчі першими"""
+        table = self.table
+        return [SettlementView(table, record_id, {'distance_km': round(distance, 2)})
+                for distance, record_id in self._spatial().within_radius(lat, lon, radius_km, limit)]
     
-    def find_settlements_by_name(self, name: str, region: str = None) -> List[dict]:
+    def find_settlements_by_name(self, name: str, region: str = None) -> List[SettlementView]:
         """Знайти населені пункти за точним іменем"""
-        name_lower = name.lower()
-        results = []
-        
-        for settlement_name, settlements_list in self.settlements.items():
-            if settlement_name.lower() == name_lower:
-                for settlement in settlements_list:
-                    if region is None or settlement['region'].lower() == region.lower():
-                        results.append({
-                            'name': settlement_name,
-                            'full_name': f"{settlement_name} ({settlement['region']})",
-                            'region': settlement['region'],
-                            'lat': settlement['lat'],
-                            'lon': settlement['lon'],
-                            'type': settlement['type'],
-                            'population': settlement.get('population', 0)
-                        })
-        
-        return results
+        return [SettlementView(self.table, record_id) for record_id in self._indexes().find(name, region)]
+    
+    def find_settlements_by_region(self, region: str) -> List[SettlementView]:
+        """Усі населені пункти області"""
+        return [SettlementView(self.table, record_id) for record_id in self._indexes().in_region(region)]
     
     def get_all_regions(self) -> List[str]:
         """Отримати список усіх областей"""
-        regions = set()
-        for settlements_list in self.settlements.values():
-            for settlement in settlements_list:
-                regions.add(settlement['region'])
-        return sorted(list(regions))
+        return sorted(self._indexes().region_names.values())
     
     def get_regional_centers(self) -> List[dict]:
-        """Отримати список обласних центрів"""
+        """Отримати список обласних центрів (спільний кешований список - не змінювати)"""
+        return self._aggregate('regional_centers', self._compute_regional_centers)
+    
+    def _compute_regional_centers(self) -> List[dict]:
+        table = self.table
+        center_types = {type_id for type_id, settlement_type in enumerate(table.types)
+                        if settlement_type in ['обласний центр', 'столиця']}
+        
         centers = []
-        for name, settlements_list in self.settlements.items():
-            for settlement in settlements_list:
-                if settlement['type'] in ['обласний центр', 'столиця']:
+        # Як і раніше - не більше одного центру на назву (перший запис з потрібним типом)
+        for name_id, name in enumerate(table.names):
+            for record_id in table.ids_for_name_id(name_id):
+                if table.type_ids[record_id] in center_types:
                     centers.append({
                         'name': name,
-                        'region': settlement['region'],
-                        'population': settlement.get('population', 0),
-                        'lat': settlement['lat'],
-                        'lon': settlement['lon']
+                        'region': table.region(record_id),
+                        'population': table.population[record_id],
+                        'lat': table.lat[record_id],
+                        'lon': table.lon[record_id]
                     })
                     break
         
@@ -1728,38 +328,33 @@ class UkraineSettlementsDB:
         return centers
     
     def get_statistics(self) -> dict:
-        """Отримати статистику бази даних"""
-        total_entries = sum(len(v) for v in self.settlements.values())
-        
-        regions = {}
-        types = {}
-        
-        for settlements_list in self.settlements.values():
-            for settlement in settlements_list:
-                region = settlement['region']
-                settlement_type = settlement['type']
-                
-                regions[region] = regions.get(region, 0) + 1
-                types[settlement_type] = types.get(settlement_type, 0) + 1
-        
-        all_settlements = []
-        for name, settlements_list in self.settlements.items():
-            for settlement in settlements_list:
-                if settlement.get('population', 0) > 0:
-                    all_settlements.append({
-                        'name': name,
-                        'region': settlement['region'],
-                        'population': settlement['population'],
-                        'type': settlement['type']
-                    })
-        
-        all_settlements.sort(key=lambda x: x['population'], reverse=True)
-        largest_cities = all_settlements[:10]
-        
-        duplicates = [name for name, lst in self.settlements.items() if len(lst) > 1]
+        """Отримати статистику бази даних (спільний кешований словник - не змінювати)"""
+        return self._aggregate('statistics', self._compute_statistics)
+    
+    def _compute_statistics(self) -> dict:
+        table = self.table
+        total_entries = len(table)
+        
+        region_counts = Counter(table.region_ids)
+        type_counts = Counter(table.type_ids)
+        regions = {table.regions[region_id]: count for region_id, count in region_counts.items()}
+        types = {table.types[type_id]: count for type_id, count in type_counts.items()}
+        
+        # Порядок записів з однаковим населенням - як у попередній реалізації (згруповано за назвою)
+        populated = [record_id for name_id in range(len(table.names))
+                     for record_id in table.ids_for_name_id(name_id) if table.population[record_id] > 0]
+        population = table.population
+        largest_cities = [{
+            'name': table.name(record_id),
+            'region': table.region(record_id),
+            'population': population[record_id],
+            'type': table.type(record_id)
+        } for record_id in heapq.nlargest(10, populated, key=lambda record_id: population[record_id])]
+        
+        duplicates = [name for name_id, name in enumerate(table.names) if table.has_duplicates(name_id)]
         
         return {
-            'unique_names': len(self.settlements),
+            'unique_names': len(table.names),
             'total_entries': total_entries,
             'regions_count': len(regions),
             'regions_distribution': regions,
@@ -1771,20 +366,151 @@ class UkraineSettlementsDB:
     
     def get_coordinates(self, settlement_name: str, region: str = None) -> Tuple[Optional[float], Optional[float]]:
         """Отримати координати населеного пункту"""
-        if settlement_name not in self.settlements:
-            return None, None
-        
-        settlements = self.settlements[settlement_name]
-        
-        if len(settlements) == 1:
-            return settlements[0]['lat'], settlements[0]['lon']
+        index = self._indexes()
+        table = self.table
         
         if region:
-            for settlement in settlements:
-                if settlement['region'].lower() == region.lower():
-                    return settlement['lat'], settlement['lon']
+            matches = index.find(settlement_name, region)
+            if matches:
+                return table.lat[matches[0]], table.lon[matches[0]]
         
-        return settlements[0]['lat'], settlements[0]['lon']
+        # Область не вказана або не збігається - перший запис з цією назвою
+        matches = index.find(settlement_name)
+        if not matches:
+            return None, None
+        return table.lat[matches[0]], table.lon[matches[0]]
+
+class LazySettlementsDB:
+    """База, що завантажується при першому зверненні або у фоновому потоці
+
+    Імпорт модуля не читає файл і не будує індексів, тож health-сервер
+    стартує одразу. Атрибути та методи UkraineSettlementsDB доступні напряму;
+    звернення до ще не завантаженої бази чекає на завершення завантаження.
+    """
+
+    def __init__(self, factory=UkraineSettlementsDB):
+        self._factory = factory
+        self._db: Optional[UkraineSettlementsDB] = None
+        self._lock = threading.Lock()
+        self._reload_lock = threading.Lock()
+        self._ready = threading.Event()
+        self.load_error: Optional[BaseException] = None
+        self.load_seconds: Optional[float] = None
+
+    def load(self) -> UkraineSettlementsDB:
+        """Завантажена база (завантажує при потребі)"""
+        db = self._db
+        if db is not None:
+            return db
+        with self._lock:
+            if self._db is None:
+                start = time.perf_counter()
+                try:
+                    self._db = self._factory()
+                except BaseException as e:
+                    self.load_error = e
+                    raise
+                self.load_error = None
+                self.load_seconds = time.perf_counter() - start
+                self._ready.set()
+                logger.info(f"✅ Settlements database ready in {self.load_seconds * 1000:.0f} ms")
+            return self._db
+
+    def reload(self, path: Optional[str] = None) -> dict:
+        """Перечитати файл бази і атомарно замінити знімок, повернути звіт про зміни
+
+        Новий знімок (таблиця та індекси) будується поруч зі старим, який тим
+        часом обслуговує пошук; заміна - одне присвоєння посилання. Запити, що
+        вже виконуються, дочитують старий знімок. Якщо вміст файлу не змінився
+        або записи ті самі, знімок не перебудовується.
+        """
+        with self._reload_lock:
+            current = self.load()
+            path = path or current.dataset_path or os.getenv('SETTLEMENTS_DATASET', DEFAULT_DATASET_PATH)
+            start = time.perf_counter()
+            version, records = load_dataset(path)
+            report = {'path': path, 'old_version': current.dataset_version, 'version': version,
+                      'swapped': False, 'added': 0, 'removed': 0, 'changed': 0}
+            if version == current.dataset_version:
+                report['total_ms'] = round((time.perf_counter() - start) * 1000, 1)
+                return report
+            
+            diff = diff_records(current.iter_records(), records)
+            report.update({key: len(value) for key, value in diff.items()})
+            report['diff_ms'] = round((time.perf_counter() - start) * 1000, 1)
+            
+            if not any(diff.values()):
+                # Інший файл з тими самими записами - достатньо оновити версію
+                current.dataset_version, current.dataset_path = version, path
+            else:
+                build_start = time.perf_counter()
+                snapshot = UkraineSettlementsDB.from_records(records, dataset_version=version, dataset_path=path)
+                if current.snapshot_path:
+                    mapped_path = snapshot_path(version, os.path.dirname(current.snapshot_path))
+                    snapshot = self._map_reloaded(snapshot, mapped_path)
+                # Лінива частина індексів, уже потрібна старому знімку, будується до заміни
+                snapshot.warm_indexes(fuzzy=current._fuzzy_index is not None,
+                                      spatial=current._spatial_index is not None)
+                report['build_ms'] = round((time.perf_counter() - build_start) * 1000, 1)
+                
+                swap_start = time.perf_counter()
+                with self._lock:
+                    self._db = snapshot
+                report['swap_ms'] = round((time.perf_counter() - swap_start) * 1000, 3)
+                report['swapped'] = True
+                if current.snapshot_path and current.snapshot_path != snapshot.snapshot_path:
+                    # Файл замінених даних: нові процеси відобразять знімок нової версії
+                    remove_replaced_snapshot(current.snapshot_path)
+            
+            report['total_ms'] = round((time.perf_counter() - start) * 1000, 1)
+            logger.info(f"🔄 Settlements dataset {report['old_version']} -> {version}: "
+                        f"+{report['added']} -{report['removed']} ~{report['changed']} in {report['total_ms']} ms")
+            return report
+    
+    @staticmethod
+    def _map_reloaded(snapshot: 'UkraineSettlementsDB', mapped_path: str) -> 'UkraineSettlementsDB':
+        """Воркери з mmap: знімок нової версії записує перший процес, що її перезавантажив
+
+        Якщо знімок не записався або не відобразився - як і при запуску, працюємо
+        з уже побудованою базою в пам'яті процесу.
+        """
+        for _ in range(2):
+            try:
+                if not os.path.exists(mapped_path):
+                    snapshot.save_snapshot(mapped_path)
+                return UkraineSettlementsDB.from_snapshot(mapped_path, dataset_path=snapshot.dataset_path)
+            except FileNotFoundError as e:
+                # Інший процес видалив знімок між перевіркою і відображенням - записуємо його ще раз
+                error = e
+            except (OSError, DatasetError) as e:
+                error = e
+                break
+        logger.warning(f"⚠️ Settlements snapshot not used after reload, using process memory: {error}")
+        return snapshot
+    
+    def start_background_load(self) -> threading.Thread:
+        """Почати завантаження у фоновому потоці (не блокує запуск бота)"""
+        def run():
+            try:
+                self.load()
+            except Exception as e:
+                logger.error(f"❌ Settlements database failed to load: {e}", exc_info=True)
+
+        thread = threading.Thread(target=run, name='settlements-db-load', daemon=True)
+        thread.start()
+        return thread
+
+    def is_ready(self) -> bool:
+        """База завантажена, індекси побудовані (readiness)"""
+        return self._ready.is_set()
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        return self._ready.wait(timeout)
+
+    def __getattr__(self, name):
+        # Викликається лише для атрибутів, яких немає у самого LazySettlementsDB
+        return getattr(self.load(), name)
+
 
-# Глобальний екземпляр бази даних
-settlements_db = UkraineSettlementsDB()
\ No newline at end of file
+# Глобальний екземпляр бази даних (завантажується при першому зверненні або через start_background_load)
+settlements_db = LazySettlementsDB()
\ No newline at end of file
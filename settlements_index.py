@@ -0,0 +1,550 @@
+# settlements_index.py - Індекси для пошуку населених пунктів
+import re
+import math
+import heapq
+from array import array
+from bisect import bisect_left
+from itertools import accumulate
+from operator import itemgetter
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from settlements_table import EncodedStrings, SettlementTable, SortedKeys
+
+def fold(text: str) -> str:
+    """Нормалізована форма назви для порівняння без урахування регістру"""
+    return text.casefold()
+
+
+# Апостроф у назвах пишуть по-різному (', ’, ʼ, `) або пропускають зовсім
+_APOSTROPHES = re.compile(r"[\'’ʼ‘`´]")
+_SEPARATORS = re.compile(r"[\s\-]+")
+
+
+def fuzzy_key(text: str) -> str:
+    """Форма назви для нечіткого пошуку: без регістру, апострофів та зайвих розділювачів"""
+    return _SEPARATORS.sub(' ', _APOSTROPHES.sub('', fold(text))).strip()
+
+
+def trigrams(key: str) -> List[str]:
+    """Триграми назви з доповненням пробілами (початок слова важить більше)"""
+    padded = f"  {key} "
+    return list({padded[i:i + 3] for i in range(len(padded) - 2)})
+
+
+class PrefixIndex:
+    """Пошук за префіксом назви: відсортований масив casefold-назв + бінарний пошук
+
+    Кожен запис має ранг за (населення, назва) у спадному порядку - так само
+    сортувала стара реалізація. Для коротких префіксів з великою кількістю
+    збігів найкращі top_k рангів обчислюються заздалегідь, для решти -
+    heapq.nsmallest лише по діапазону збігів, без повного сортування.
+
+    alternates (паралельно до записів таблиці) - додаткові назви запису
+    (транслітерація, російські та історичні назви); вони потрапляють у той
+    самий масив ключів.
+    """
+
+    def __init__(self, table: SettlementTable, alternates: Optional[List[List[str]]] = None, top_k: int = 30,
+                 precompute_depth: int = 3, precompute_min_matches: int = 120):
+        self.top_k = top_k
+
+        # Ранг 0 - найбільший населений пункт
+        population, names, name_ids = table.population, table.names, table.name_ids
+        order = sorted(range(len(table)), key=lambda i: (population[i], names[name_ids[i]]), reverse=True)
+        self._by_rank = array('I', order)
+
+        entries = []
+        for rank, i in enumerate(order):
+            entries.append((fold(names[name_ids[i]]), rank))
+            if alternates:
+                entries.extend((fold(alternate), rank) for alternate in alternates[i])
+        entries.sort()
+        self._keys = [key for key, _ in entries]
+        self._ranks = array('I', (rank for _, rank in entries))
+
+        # Найкращі top_k для "важких" префіксів (1-3 літери, що збігаються з сотнями назв)
+        self._top: Dict[str, List[int]] = {}
+        for depth in range(1, precompute_depth + 1):
+            start = 0
+            while start < len(self._keys):
+                prefix = self._keys[start][:depth]
+                end = self._range_end(prefix, start)
+                if len(prefix) == depth and end - start >= precompute_min_matches:
+                    self._top[prefix] = heapq.nsmallest(top_k, set(self._ranks[start:end]))
+                start = end
+
+    @classmethod
+    def from_snapshot(cls, meta: dict, arrays: dict) -> 'PrefixIndex':
+        """Індекс поверх масивів знімка (ключі не декодуються наперед)"""
+        index = cls.__new__(cls)
+        index.top_k = meta['top_k']
+        index._by_rank = arrays['by_rank']
+        index._ranks = arrays['ranks']
+        index._keys = EncodedStrings(arrays['keys'], arrays['key_offsets'])
+        top_ranks, top_starts = arrays['top_ranks'], arrays['top_starts']
+        index._top = {prefix: top_ranks[top_starts[i]:top_starts[i + 1]] for i, prefix in enumerate(meta['top'])}
+        return index
+
+    def to_snapshot(self) -> Tuple[dict, Dict[str, array]]:
+        """Метадані та масиви для settlements_store.write_snapshot"""
+        keys = EncodedStrings.encode(self._keys)
+        top_ranks, top_starts = array('I'), array('I', [0])
+        for ranks in self._top.values():
+            top_ranks.extend(ranks)
+            top_starts.append(len(top_ranks))
+        return {'top_k': self.top_k, 'top': list(self._top)}, {
+            'by_rank': self._by_rank, 'ranks': self._ranks, 'keys': keys.blob, 'key_offsets': keys.offsets,
+            'top_ranks': top_ranks, 'top_starts': top_starts
+        }
+
+    def _range_end(self, prefix: str, start: int) -> int:
+        # Усі рядки, що починаються з prefix, менші за prefix + максимальний символ Unicode
+        return bisect_left(self._keys, prefix + '\U0010ffff', start)
+
+    def search(self, prefix: str, limit: int) -> List[int]:
+        """Ідентифікатори найбільших за населенням записів, назва яких починається з prefix"""
+        key = fold(prefix)
+
+        cached = self._top.get(key)
+        if cached is not None and limit <= self.top_k:
+            ranks = cached[:limit]
+        else:
+            start = bisect_left(self._keys, key)
+            end = self._range_end(key, start)
+            # Запис може збігтися і за назвою, і за альтернативною назвою - рахуємо один раз
+            matches = set(self._ranks[start:end])
+            if len(matches) <= limit:
+                ranks = sorted(matches)
+            else:
+                ranks = heapq.nsmallest(limit, matches)
+
+        return [self._by_rank[rank] for rank in ranks]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+class LookupIndex:
+    """Хеш-індекси точного пошуку: casefold-назва, (назва, область) та область
+
+    casefold-назва відображається в ідентифікатор(и) назви таблиці, а записи
+    з цією назвою беруться зі списку однойменних записів таблиці - окремий
+    список на кожну назву не зберігається. Записи повертаються в порядку
+    додавання до бази.
+    """
+
+    def __init__(self, table: SettlementTable):
+        self._table = table
+        # casefold-назва -> ідентифікатор назви або кортеж ідентифікаторів ("Київ" і "КИЇВ")
+        self.by_name: Dict[str, object] = {}
+        self.by_region: Dict[str, array] = {}
+        # casefold-назва області -> назва як у базі
+        self.region_names: Dict[str, str] = {}
+        self._region_keys = [fold(region) for region in table.regions]
+
+        for name_id, name in enumerate(table.names):
+            key = fold(name)
+            existing = self.by_name.get(key)
+            if existing is None:
+                self.by_name[key] = name_id
+            else:
+                self.by_name[key] = (existing if isinstance(existing, tuple) else (existing,)) + (name_id,)
+
+        for region_id, region in enumerate(table.regions):
+            self.region_names.setdefault(self._region_keys[region_id], region)
+        for record_id, region_id in enumerate(table.region_ids):
+            region_key = self._region_keys[region_id]
+            ids = self.by_region.get(region_key)
+            if ids is None:
+                ids = self.by_region[region_key] = array('I')
+            ids.append(record_id)
+
+    @classmethod
+    def from_snapshot(cls, table: SettlementTable, arrays: dict) -> 'LookupIndex':
+        """Індекс поверх масивів знімка: by_name - бінарний пошук замість словника"""
+        index = cls.__new__(cls)
+        index._table = table
+        index._region_keys = [fold(region) for region in table.regions]
+        index.region_names = {}
+        for region_id, region in enumerate(table.regions):
+            index.region_names.setdefault(index._region_keys[region_id], region)
+
+        index.by_name = SortedKeys(EncodedStrings(arrays['keys'], arrays['key_offsets']), arrays['key_name_ids'])
+        records, starts = arrays['region_records'], arrays['region_starts']
+        index.by_region = {key: records[starts[i]:starts[i + 1]]
+                           for i, key in enumerate(sorted(index.region_names))}
+        return index
+
+    def to_snapshot(self) -> Tuple[dict, Dict[str, array]]:
+        """Метадані та масиви для settlements_store.write_snapshot"""
+        by_name = SortedKeys.build(
+            (key, name_id) for key, name_ids in self.by_name.items()
+            for name_id in (name_ids if isinstance(name_ids, tuple) else (name_ids,))
+        )
+        region_records, region_starts = array('I'), array('I', [0])
+        for key in sorted(self.region_names):
+            region_records.extend(self.by_region.get(key, ()))
+            region_starts.append(len(region_records))
+        return {}, {
+            'keys': by_name.keys.blob, 'key_offsets': by_name.keys.offsets, 'key_name_ids': by_name.values,
+            'region_records': region_records, 'region_starts': region_starts
+        }
+
+    def find(self, name: str, region: Optional[str] = None) -> List[int]:
+        """Записи з назвою name (та областю region, якщо вказана)"""
+        name_ids = self.by_name.get(fold(name))
+        if name_ids is None:
+            return []
+
+        table = self._table
+        if isinstance(name_ids, tuple):
+            record_ids = sorted(i for name_id in name_ids for i in table.ids_for_name_id(name_id))
+        else:
+            record_ids = list(table.ids_for_name_id(name_ids))
+
+        if region is None:
+            return record_ids
+        region_key = fold(region)
+        return [i for i in record_ids if self._region_keys[table.region_ids[i]] == region_key]
+
+    def in_region(self, region: str) -> array:
+        """Усі записи області"""
+        return self.by_region.get(fold(region), array('I'))
+
+
+class FuzzyIndex:
+    """Нечіткий пошук за назвою: інвертований індекс триграм
+
+    Кандидати - назви з найбільшою кількістю спільних рідкісних триграм. Дуже
+    часті триграми (закінчення "-івка", "-не" тощо) не використовуються для
+    відбору кандидатів, щоб запит не проходив по тисячах назв, а лише
+    дораховуються для кандидатів бінарним пошуком у відсортованих списках.
+    Для відбору досить n - t + 1 найрідкісніших триграм запиту (t - найменша
+    кількість спільних триграм за min_similarity), і разом вони не довші за
+    max_scanned ідентифікаторів - час запиту обмежений незалежно від його довжини.
+    Ранжування - схожість Жаккара за триграмами, потім населення.
+    """
+
+    def __init__(self, table: SettlementTable, alternates: Optional[List[List[str]]] = None,
+                 min_similarity: float = 0.35, max_posting_share: float = 0.01, candidates: int = 30,
+                 max_scanned: int = 1500):
+        self.min_similarity = min_similarity
+        self.candidates = candidates
+        self.max_scanned = max_scanned
+        self._population = table.population
+
+        # Одна нормалізована назва може відповідати кільком записам (різні області, варіанти апострофа)
+        keys: List[str] = []
+        key_records: List[List[int]] = []
+        key_ids: Dict[str, int] = {}
+        for i in range(len(table)):
+            names = [table.name(i)] + (alternates[i] if alternates else [])
+            for key in {fuzzy_key(name) for name in names}:
+                if key not in key_ids:
+                    key_ids[key] = len(keys)
+                    keys.append(key)
+                    key_records.append([])
+                key_records[key_ids[key]].append(i)
+
+        # Записи кожної назви - суцільним масивом: записи назви k - _records[_starts[k]:_starts[k + 1]]
+        self._starts = array('I', [0])
+        self._records = array('I')
+        for records in key_records:
+            self._records.extend(records)
+            self._starts.append(len(self._records))
+
+        # Списки ідентифікаторів назв для кожної триграми (зростаючі - додаються по порядку)
+        postings: Dict[str, array] = {}
+        self._gram_counts = array('H')
+        for key_id, key in enumerate(keys):
+            grams = trigrams(key)
+            self._gram_counts.append(len(grams))
+            for gram in grams:
+                posting = postings.get(gram)
+                if posting is None:
+                    posting = postings[gram] = array('I')
+                posting.append(key_id)
+        self._postings = postings
+        self._max_posting = max(50, int(len(keys) * max_posting_share))
+        self._max_grams = max(self._gram_counts, default=0)
+
+    def search(self, query: str, limit: int) -> List[Tuple[float, int]]:
+        """Найбільш схожі записи: [(схожість 0..1, ідентифікатор запису)], найкращі першими"""
+        key = fuzzy_key(query)
+        if len(key) < 3:
+            return []
+        query_grams = trigrams(key)
+        # Схожість з назвою не більша за її кількість триграм / len(query): задовгий запит нічого не знайде
+        shared_needed = math.ceil(self.min_similarity * len(query_grams))
+        if shared_needed > self._max_grams:
+            return []
+
+        known = sorted((self._postings[gram] for gram in query_grams if gram in self._postings), key=len)
+        if not known:
+            return []
+
+        # Відбір кандидатів - лише за рідкісними триграмами (або двома найрідкіснішими): назва, що
+        # має t спільних триграм, неодмінно містить одну з n - t + 1 найрідкісніших
+        split = scanned = 0
+        for posting in known[:len(query_grams) - shared_needed + 1]:
+            if len(posting) > self._max_posting or scanned + len(posting) > self.max_scanned:
+                break
+            scanned += len(posting)
+            split += 1
+        split = split or min(2, len(known))
+        selective, frequent = known[:split], known[split:]
+
+        counts = Counter()
+        for posting in selective:
+            counts.update(posting)
+
+        # Схожість не може перевищити shared / len(query), тож слабкі кандидати відкидаємо одразу
+        required = self.min_similarity * len(query_grams) - len(frequent)
+        candidates = heapq.nlargest(
+            self.candidates,
+            (item for item in counts.items() if item[1] >= required),
+            key=itemgetter(1)
+        )
+
+        scored = []
+        for key_id, shared in candidates:
+            for posting in frequent:
+                position = bisect_left(posting, key_id)
+                if position < len(posting) and posting[position] == key_id:
+                    shared += 1
+            similarity = shared / (len(query_grams) + self._gram_counts[key_id] - shared)
+            if similarity >= self.min_similarity:
+                scored.append((similarity, key_id))
+
+        # Запис, знайдений за кількома написаннями, залишаємо з найкращою схожістю
+        best: Dict[int, float] = {}
+        for similarity, key_id in scored:
+            for record_id in self._records[self._starts[key_id]:self._starts[key_id + 1]]:
+                if best.get(record_id, -1.0) < similarity:
+                    best[record_id] = similarity
+
+        population = self._population
+        results = sorted(((similarity, record_id) for record_id, similarity in best.items()),
+                         key=lambda item: (item[0], population[item[1]]), reverse=True)
+        return results[:limit]
+
+EARTH_RADIUS_KM = 6371.0
+# Довжина одного градуса меридіана, км
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Відстань по поверхні Землі між двома точками, км"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    a = (math.sin((phi2 - phi1) / 2) ** 2 +
+         math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+class SpatialIndex:
+    """Пошук найближчих населених пунктів: рівномірна сітка по широті й довготі
+
+    Розмір клітинки підбирається так, щоб у клітинці типового запису (з
+    урахуванням скупченості записів навколо міст) було кілька записів.
+    nearest переглядає клітинки кільцями навколо клітинки запиту і
+    зупиняється, щойно k-та знайдена відстань не перевищує відстані від точки
+    запиту до межі вже переглянутого квадрата клітинок. within_radius переглядає лише клітинки, що
+    перетинаються з колом. Кандидати порівнюються за проміжною величиною
+    формули гаверсинуса, arcsin обчислюється лише для результатів.
+    """
+
+    def __init__(self, table: SettlementTable, cell_deg: Optional[float] = None, per_cell: int = 4):
+        self._size = len(table)
+        lats, lons = table.lat, table.lon
+        self._phi = array('d', map(math.radians, lats))
+        self._lam = array('d', map(math.radians, lons))
+        self._cos_phi = array('d', map(math.cos, self._phi))
+        # Клітинки сітки - суцільним масивом (CSR), рядок за рядком: записи клітинки k -
+        # _cell_ids[_cell_starts[k]:_cell_starts[k + 1]], сусідні клітинки рядка - один зріз
+        self._cell_starts = array('I', [0])
+        self._cell_ids = array('I')
+        if not self._size:
+            self.cell_deg = cell_deg or 1.0
+            return
+
+        if cell_deg is None:
+            cell_deg = self._fit_cell_deg(lats, lons, per_cell)
+        self.cell_deg = cell_deg
+
+        cells = [self._cell(lats[i], lons[i]) for i in range(self._size)]
+        self._min_row = min(row for row, _ in cells)
+        self._max_row = max(row for row, _ in cells)
+        self._min_col = min(col for _, col in cells)
+        self._max_col = max(col for _, col in cells)
+        self._cols = self._max_col - self._min_col + 1
+
+        keys = [(row - self._min_row) * self._cols + col - self._min_col for row, col in cells]
+        counts = [0] * ((self._max_row - self._min_row + 1) * self._cols + 1)
+        for key in keys:
+            counts[key + 1] += 1
+        self._cell_starts = array('I', accumulate(counts))
+        # Усередині клітинки - у порядку ідентифікаторів
+        self._cell_ids = array('I', [0]) * self._size
+        position = list(self._cell_starts)
+        for i, key in enumerate(keys):
+            self._cell_ids[position[key]] = i
+            position[key] += 1
+
+        # Найвужча клітинка (на найпівнічнішому краї сітки) - нижня межа відстані до кільця
+        max_abs_lat = max(abs(self._min_row), abs(self._max_row + 1)) * cell_deg
+        self._min_cell_km = cell_deg * KM_PER_DEGREE * math.cos(math.radians(min(89.0, max_abs_lat)))
+
+    def _fit_cell_deg(self, lats, lons, per_cell: int) -> float:
+        """Розмір клітинки, за якого в клітинці типового запису близько per_cell записів"""
+        area = max(1.0, (max(lats) - min(lats)) * (max(lons) - min(lons)))
+        cell_deg = min(1.0, max(0.05, math.sqrt(area * per_cell / self._size)))
+        # Оцінка для рівномірного розподілу; населені пункти скупчені, тож записи (і запити)
+        # потрапляють у щільніші клітинки - зменшуємо клітинку пропорційно до їхньої заповненості
+        counts = Counter(zip((math.floor(lat / cell_deg) for lat in lats),
+                             (math.floor(lon / cell_deg) for lon in lons)))
+        occupancy = sum(count * count for count in counts.values()) / self._size
+        if occupancy > per_cell:
+            cell_deg = max(0.01, cell_deg * math.sqrt(per_cell / occupancy))
+        return cell_deg
+
+    _SNAPSHOT_FIELDS = ('_size', 'cell_deg', '_min_row', '_max_row', '_min_col', '_max_col', '_cols', '_min_cell_km')
+    _SNAPSHOT_ARRAYS = ('_phi', '_lam', '_cos_phi', '_cell_starts', '_cell_ids')
+
+    @classmethod
+    def from_snapshot(cls, meta: dict, arrays: dict) -> 'SpatialIndex':
+        """Індекс поверх масивів знімка"""
+        index = cls.__new__(cls)
+        for field in cls._SNAPSHOT_FIELDS:
+            if field in meta:
+                setattr(index, field, meta[field])
+        for name in cls._SNAPSHOT_ARRAYS:
+            setattr(index, name, arrays[name.lstrip('_')])
+        return index
+
+    def to_snapshot(self) -> Tuple[dict, Dict[str, array]]:
+        """Метадані та масиви для settlements_store.write_snapshot"""
+        meta = {field: getattr(self, field) for field in self._SNAPSHOT_FIELDS if hasattr(self, field)}
+        return meta, {name.lstrip('_'): getattr(self, name) for name in self._SNAPSHOT_ARRAYS}
+
+    def _cell(self, lat: float, lon: float) -> Tuple[int, int]:
+        return math.floor(lat / self.cell_deg), math.floor(lon / self.cell_deg)
+
+    def _ring(self, row: int, col: int, radius: int):
+        """Ідентифікатори записів у клітинках на відстані radius клітинок (по Чебишову)"""
+        starts, ids, cols = self._cell_starts, self._cell_ids, self._cols
+        top, bottom = row - radius, row + radius
+        left, right = max(col - radius, self._min_col), min(col + radius, self._max_col)
+        for edge in (top, bottom) if radius else (top,):
+            if self._min_row <= edge <= self._max_row and left <= right:
+                base = (edge - self._min_row) * cols - self._min_col
+                yield from ids[starts[base + left]:starts[base + right + 1]]
+        if radius:
+            for edge in (col - radius, col + radius):
+                if self._min_col <= edge <= self._max_col:
+                    for r in range(max(top + 1, self._min_row), min(bottom - 1, self._max_row) + 1):
+                        cell = (r - self._min_row) * cols + edge - self._min_col
+                        yield from ids[starts[cell]:starts[cell + 1]]
+
+    @staticmethod
+    def _block_margin_km(phi: float, lam: float, row: int, col: int, radius: int, step: float) -> float:
+        """Нижня межа відстані від точки до будь-якого запису за межами квадрата клітинок
+
+        За паралель - різниця широт, за меридіан - відстань до його великого кола:
+        asin(cos φ · sin Δλ).
+        """
+        dphi = min(phi - (row - radius) * step, (row + radius + 1) * step - phi)
+        dlam = min(math.pi / 2, lam - (col - radius) * step, (col + radius + 1) * step - lam)
+        return EARTH_RADIUS_KM * min(dphi, math.asin(math.cos(phi) * math.sin(dlam)))
+
+    @staticmethod
+    def _to_km(half_chord: float) -> float:
+        return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(half_chord)))
+
+    def nearest(self, lat: float, lon: float, k: int = 1,
+                max_distance_km: Optional[float] = None) -> List[Tuple[float, int]]:
+        """k найближчих записів: [(відстань км, ідентифікатор запису)], найближчі першими
+
+        max_distance_km обмежує пошук (і його час) для точок далеко від бази.
+        """
+        if not self._size or k <= 0:
+            return []
+
+        row, col = self._cell(lat, lon)
+        # Кільця, що не перетинають сітку, порожні
+        first = max(self._min_row - row, row - self._max_row, self._min_col - col, col - self._max_col, 0)
+        last = max(row - self._min_row, self._max_row - row, col - self._min_col, self._max_col - col)
+        if max_distance_km is not None:
+            last = min(last, int(max_distance_km / self._min_cell_km) + 1)
+
+        phi, lam = math.radians(lat), math.radians(lon)
+        cos_phi = math.cos(phi)
+        sin, phis, lams, coss = math.sin, self._phi, self._lam, self._cos_phi
+        step = math.radians(self.cell_deg)
+        # Купа (-half_chord, id) з k найближчих: за рівної відстані перемагає більший id,
+        # тож результат не залежить від порядку обходу клітинок
+        best: List[Tuple[float, int]] = []
+        worst, worst_id = math.inf, -1
+        for radius in range(first, last + 1):
+            for i in self._ring(row, col, radius):
+                # sin²(Δφ/2) + cos φ1 cos φ2 sin²(Δλ/2) - монотонна за відстанню
+                h = sin((phis[i] - phi) / 2) ** 2 + cos_phi * coss[i] * sin((lams[i] - lam) / 2) ** 2
+                if len(best) < k:
+                    heapq.heappush(best, (-h, i))
+                    if len(best) == k:
+                        worst, worst_id = -best[0][0], best[0][1]
+                elif h < worst or (h == worst and i > worst_id):
+                    heapq.heapreplace(best, (-h, i))
+                    worst, worst_id = -best[0][0], best[0][1]
+            # Точки за межами переглянутих кілець лежать за межею квадрата клітинок
+            # [row - radius, row + radius] x [col - radius, col + radius]
+            if len(best) == k and self._to_km(worst) <= self._block_margin_km(phi, lam, row, col, radius, step):
+                break
+
+        results = [(self._to_km(-h), i) for h, i in sorted(best, reverse=True)]
+        if max_distance_km is not None:
+            results = [item for item in results if item[0] <= max_distance_km]
+        return results
+
+    def within_radius(self, lat: float, lon: float, radius_km: float,
+                      limit: Optional[int] = None) -> List[Tuple[float, int]]:
+        """Усі записи в межах radius_km: [(відстань км, ідентифікатор запису)], найближчі першими"""
+        if not self._size or radius_km < 0:
+            return []
+
+        lat_span = radius_km / KM_PER_DEGREE
+        # Коло найширше по довготі на тій його широті, що ближча до полюса
+        widest_lat = min(89.0, abs(lat) + lat_span)
+        lon_span = min(180.0, lat_span / math.cos(math.radians(widest_lat)))
+
+        min_row, min_col = self._cell(lat - lat_span, lon - lon_span)
+        max_row, max_col = self._cell(lat + lat_span, lon + lon_span)
+
+        # Поріг у тих самих одиницях, що й sin²(Δφ/2) + cos φ1 cos φ2 sin²(Δλ/2)
+        threshold = math.sin(min(math.pi / 2, radius_km / (2 * EARTH_RADIUS_KM))) ** 2
+        phi, lam = math.radians(lat), math.radians(lon)
+        cos_phi = math.cos(phi)
+
+        sin, phis, lams, coss = math.sin, self._phi, self._lam, self._cos_phi
+        found = []
+        starts, ids, cols = self._cell_starts, self._cell_ids, self._cols
+        left, right = max(min_col, self._min_col), min(max_col, self._max_col)
+        if left > right:
+            return []
+        for r in range(max(min_row, self._min_row), min(max_row, self._max_row) + 1):
+            base = (r - self._min_row) * cols - self._min_col
+            for i in ids[starts[base + left]:starts[base + right + 1]]:
+                h = sin((phis[i] - phi) / 2) ** 2 + cos_phi * coss[i] * sin((lams[i] - lam) / 2) ** 2
+                if h <= threshold:
+                    found.append((h, i))
+
+        if limit is not None and len(found) > limit:
+            found = heapq.nsmallest(limit, found)
+        else:
+            found.sort()
+        # h <= threshold <= 1 - це _to_km без перевірки меж
+        asin, sqrt, diameter = math.asin, math.sqrt, 2 * EARTH_RADIUS_KM
+        return [(diameter * asin(sqrt(h)), i) for h, i in found]
+
+    def __len__(self) -> int:
+        return self._size
@@ -0,0 +1,266 @@
+# settlements_store.py - Скомпільований (бінарний) формат бази населених пунктів
+#
+# Джерелом даних залишаються виклики _add_settlement у settlements_source.py,
+# а цей файл лише зберігає їх у колонковому вигляді, який завантажується
+# без виконання ~1400 викликів при імпорті. Збірка: python Utils/build_settlements.py
+import os
+import sys
+import json
+import mmap
+import struct
+import hashlib
+from array import array
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DATASET_PATH = os.path.join(_ROOT, 'data', 'settlements.bin')
+SOURCE_PATH = os.path.join(_ROOT, 'settlements_source.py')
+
+MAGIC = b'UASD'
+VERSION = 1
+
+# magic, версія, кількість записів, кількість рядків, довжина блоку рядків, хеш джерела
+_HEADER = struct.Struct('<4sHxxIII32s')
+_HEADER_SIZE = 64
+
+# Знімок - таблиця разом з індексами у вигляді, придатному для mmap
+SNAPSHOT_MAGIC = b'UASS'
+SNAPSHOT_VERSION = 1
+# magic, версія, довжина метаданих (JSON)
+_SNAPSHOT_HEADER = struct.Struct('<4sHxxI')
+_SNAPSHOT_ALIGN = 8
+
+# (назва, lat, lon, область, тип, населення)
+Record = Tuple[str, float, float, str, str, int]
+
+
+class DatasetError(Exception):
+    """Файл бази пошкоджений, має іншу версію або не відповідає джерелу"""
+
+
+def source_hash(source_path: str = SOURCE_PATH) -> bytes:
+    """Хеш Python-джерела бази: файл застаріває після будь-якої зміни даних"""
+    with open(source_path, 'rb') as f:
+        return hashlib.sha256(f.read()).digest()
+
+
+def _to_little_endian(values: array) -> bytes:
+    if sys.byteorder != 'little':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_little_endian(typecode: str, data: bytes) -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder != 'little':
+        values.byteswap()
+    return values
+
+
+def write_dataset(records: Iterable[Record], path: str, digest: bytes) -> int:
+    """Записати записи у колонковий бінарний файл, повернути кількість записів
+
+    Файл замінюється атомарно (через тимчасовий файл), тож процес, що саме
+    перезавантажує базу, ніколи не прочитає його наполовину записаним.
+
+    Розміщення (little-endian, кожна секція вирівняна за розміром свого елемента):
+    заголовок 64 байти | lat f64[] | lon f64[] | population i32[] |
+    name u32[] | region u16[] | type u16[] | рядки UTF-8, розділені '\\0'
+    """
+    strings: List[str] = []
+    string_ids = {}
+
+    def intern(value: str) -> int:
+        if value not in string_ids:
+            string_ids[value] = len(strings)
+            strings.append(value)
+        return string_ids[value]
+
+    lat, lon, population = array('d'), array('d'), array('i')
+    names, regions, types = array('I'), array('H'), array('H')
+
+    for name, record_lat, record_lon, region, settlement_type, record_population in records:
+        lat.append(record_lat)
+        lon.append(record_lon)
+        population.append(record_population)
+        names.append(intern(name))
+        regions.append(intern(region))
+        types.append(intern(settlement_type))
+
+    blob = '\0'.join(strings).encode('utf-8')
+    header = _HEADER.pack(MAGIC, VERSION, len(lat), len(strings), len(blob), digest)
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(header.ljust(_HEADER_SIZE, b'\0'))
+        for column in (lat, lon, population, names, regions, types):
+            f.write(_to_little_endian(column))
+        f.write(blob)
+    os.replace(tmp_path, path)
+
+    return len(lat)
+
+
+def dataset_version(data: bytes) -> str:
+    """Версія файлу бази - хеш його вмісту (перші 12 символів SHA-256)"""
+    return hashlib.sha256(data).hexdigest()[:12]
+
+
+def load_dataset(path: str, expected_hash: Optional[bytes] = None) -> Tuple[str, List[Record]]:
+    """Прочитати файл бази: (версія за вмістом, записи у порядку, в якому їх було додано)"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return dataset_version(data), _parse_dataset(data, path, expected_hash)
+
+
+def check_dataset(path: str, expected_hash: Optional[bytes] = None) -> str:
+    """Перевірити заголовок файлу бази і повернути його версію, не розбираючи записів"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    _check_header(data, path, expected_hash)
+    return dataset_version(data)
+
+
+def read_dataset(path: str, expected_hash: Optional[bytes] = None) -> List[Record]:
+    """Прочитати записи з бінарного файлу у порядку, в якому їх було додано"""
+    return load_dataset(path, expected_hash)[1]
+
+
+def _check_header(data: bytes, path: str, expected_hash: Optional[bytes]) -> Tuple[int, int, int]:
+    """(кількість записів, кількість рядків, довжина блоку рядків)"""
+    if len(data) < _HEADER_SIZE:
+        raise DatasetError(f"{path}: file is truncated")
+
+    magic, version, count, string_count, blob_size, digest = _HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise DatasetError(f"{path}: unsupported format {magic!r} v{version}")
+    if expected_hash is not None and digest != expected_hash:
+        raise DatasetError(f"{path}: built from a different settlements source")
+    return count, string_count, blob_size
+
+
+def _parse_dataset(data: bytes, path: str, expected_hash: Optional[bytes]) -> List[Record]:
+    count, string_count, blob_size = _check_header(data, path, expected_hash)
+
+    columns = []
+    offset = _HEADER_SIZE
+    for typecode in ('d', 'd', 'i', 'I', 'H', 'H'):
+        size = array(typecode).itemsize * count
+        columns.append(_from_little_endian(typecode, data[offset:offset + size]))
+        offset += size
+
+    strings = data[offset:offset + blob_size].decode('utf-8').split('\0')
+    if len(strings) != string_count or any(len(column) != count for column in columns):
+        raise DatasetError(f"{path}: file is truncated")
+
+    lat, lon, population, names, regions, types = columns
+    return [
+        (strings[names[i]], lat[i], lon[i], strings[regions[i]], strings[types[i]], population[i])
+        for i in range(count)
+    ]
+
+
+def diff_records(old: Iterable[Record], new: Iterable[Record]) -> dict:
+    """Різниця між двома версіями бази за один прохід по кожній
+
+    changed - записи з тією ж назвою та областю, у яких змінились координати,
+    тип або населення; added/removed - решта нових і зниклих записів.
+    """
+    old_counts = Counter(old)
+    new_counts = Counter(new)
+    removed = list((old_counts - new_counts).elements())
+    added = list((new_counts - old_counts).elements())
+
+    # Пари "зник - з'явився" з тією ж назвою та областю - це зміна запису
+    added_by_key = {}
+    for record in added:
+        added_by_key.setdefault((record[0], record[3]), []).append(record)
+    changed, still_removed = [], []
+    for record in removed:
+        candidates = added_by_key.get((record[0], record[3]))
+        if candidates:
+            changed.append((record, candidates.pop(0)))
+        else:
+            still_removed.append(record)
+    still_added = [record for records in added_by_key.values() for record in records]
+
+    return {'added': still_added, 'removed': still_removed, 'changed': changed}
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _SNAPSHOT_ALIGN) * _SNAPSHOT_ALIGN
+
+
+def write_snapshot(path: str, meta: dict, arrays: Dict[str, array]) -> int:
+    """Записати знімок (метадані + іменовані масиви), повернути розмір файлу
+
+    Розміщення (little-endian): заголовок | метадані JSON | масиви, кожен з
+    відступу, кратного 8 байтам, щоб після mmap їх можна було читати напряму
+    через memoryview.cast без копіювання. Файл замінюється атомарно; кілька
+    процесів можуть одночасно записувати той самий знімок.
+    """
+    layout = {}
+    offset = 0
+    for name, values in arrays.items():
+        layout[name] = [values.typecode, offset, len(values)]
+        offset = _aligned(offset + values.itemsize * len(values))
+
+    meta_bytes = json.dumps(dict(meta, arrays=layout), ensure_ascii=False).encode('utf-8')
+    data_start = _aligned(_SNAPSHOT_HEADER.size + len(meta_bytes))
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(meta_bytes)))
+        f.write(meta_bytes.ljust(data_start - _SNAPSHOT_HEADER.size, b'\0'))
+        for name, values in arrays.items():
+            data = _to_little_endian(values)
+            f.write(data.ljust(_aligned(len(data)), b'\0'))
+        size = f.tell()
+    os.replace(tmp_path, path)
+    return size
+
+
+def map_snapshot(path: str) -> Tuple[dict, Dict[str, memoryview]]:
+    """Відобразити знімок у пам'ять: (метадані, {назва: масив лише для читання})
+
+    Масиви - memoryview поверх спільних для всіх процесів сторінок файлу
+    (на big-endian платформах - копії). Відображення живе, доки на нього
+    посилається хоча б один масив.
+    """
+    with open(path, 'rb') as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise DatasetError(f"{path}: file is empty")
+
+    if len(mapped) < _SNAPSHOT_HEADER.size:
+        raise DatasetError(f"{path}: file is truncated")
+    magic, version, meta_size = _SNAPSHOT_HEADER.unpack_from(mapped)
+    if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+        raise DatasetError(f"{path}: unsupported snapshot format {magic!r} v{version}")
+    try:
+        meta = json.loads(mapped[_SNAPSHOT_HEADER.size:_SNAPSHOT_HEADER.size + meta_size].decode('utf-8'))
+    except ValueError:
+        raise DatasetError(f"{path}: file is truncated")
+
+    data_start = _aligned(_SNAPSHOT_HEADER.size + meta_size)
+    view = memoryview(mapped)
+    arrays = {}
+    for name, (typecode, offset, count) in meta.pop('arrays').items():
+        start = data_start + offset
+        end = start + array(typecode).itemsize * count
+        if end > len(mapped):
+            raise DatasetError(f"{path}: file is truncated")
+        if sys.byteorder == 'little':
+            arrays[name] = view[start:end].cast(typecode)
+        else:
+            arrays[name] = _from_little_endian(typecode, mapped[start:end])
+    return meta, arrays
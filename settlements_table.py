@@ -0,0 +1,311 @@
+# settlements_table.py - Компактне зберігання записів бази населених пунктів
+#
+# Записи зберігаються колонками (struct-of-arrays) з цілим ідентифікатором
+# запису замість окремого словника на кожен населений пункт: координати й
+# населення - масиви array, назви, області та типи - таблиці унікальних рядків,
+# на які посилаються масиви індексів. Індекси пошуку зберігають лише
+# ідентифікатори, а словник-результат (SettlementView) створюється тільки для
+# записів, які справді повертаються користувачу. Колонки можуть бути і
+# memoryview поверх відображеного у пам'ять знімка (див. from_snapshot).
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Mapping, Sequence
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from settlements_store import Record
+
+# Ключі результату пошуку (у порядку, як у старих словниках-результатах)
+RESULT_FIELDS = ('name', 'full_name', 'region', 'lat', 'lon', 'type', 'population')
+
+
+class EncodedStrings(Sequence):
+    """Список рядків у вигляді одного блоку UTF-8 з масивом зсувів (для знімка)
+
+    Рядок декодується лише при зверненні, тож таблиця чи індекс поверх
+    відображеного у пам'ять блоку не створюють об'єкта на кожен рядок.
+    """
+
+    def __init__(self, blob, offsets):
+        self.blob = blob
+        self.offsets = offsets
+
+    @classmethod
+    def encode(cls, strings: Iterable[str]) -> 'EncodedStrings':
+        blob = array('B')
+        offsets = array('I', [0])
+        for value in strings:
+            blob.frombytes(value.encode('utf-8'))
+            offsets.append(len(blob))
+        return cls(blob, offsets)
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += len(self)
+        return str(self.blob[self.offsets[index]:self.offsets[index + 1]], 'utf-8')
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+
+class SortedKeys(Sequence):
+    """Відсортовані ключі (можливо, з повторами) з паралельним масивом значень
+
+    Замінює словник у знімку: пошук - бінарний, get повертає значення, кортеж
+    значень для повторюваного ключа або default (як by_name у LookupIndex).
+    """
+
+    def __init__(self, keys: Sequence, values):
+        self.keys = keys
+        self.values = values
+
+    @classmethod
+    def build(cls, items: Iterable[Tuple[str, int]]) -> 'SortedKeys':
+        items = sorted(items)
+        return cls(EncodedStrings.encode(key for key, _ in items), array('I', (value for _, value in items)))
+
+    def __getitem__(self, index: int) -> str:
+        return self.keys[index]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def get(self, key: str, default=None):
+        start = bisect_left(self, key)
+        if start == len(self) or self.keys[start] != key:
+            return default
+        end = bisect_right(self, key, start)
+        return self.values[start] if end - start == 1 else tuple(self.values[start:end])
+
+
+class SettlementTable:
+    """Колонкове сховище записів: ідентифікатор запису - позиція в масивах"""
+
+    def __init__(self):
+        self.lat = array('d')
+        self.lon = array('d')
+        self.population = array('i')
+        self.name_ids = array('I')
+        self.region_ids = array('H')
+        self.type_ids = array('H')
+
+        # Таблиці унікальних рядків
+        self.names: List[str] = []
+        self.regions: List[str] = []
+        self.types: List[str] = []
+        self._name_lookup: Dict[str, int] = {}
+        self._region_lookup: Dict[str, int] = {}
+        self._type_lookup: Dict[str, int] = {}
+
+        # Записи з однаковою назвою - однозв'язний список у масивах (-1 - кінець)
+        self._name_head = array('i')
+        self._name_tail = array('i')
+        self._name_next = array('i')
+
+    @classmethod
+    def from_records(cls, records: Iterable[Record]) -> 'SettlementTable':
+        table = cls()
+        for record in records:
+            table.append(*record)
+        return table
+
+    @classmethod
+    def from_snapshot(cls, meta: dict, arrays: dict) -> 'SettlementTable':
+        """Таблиця поверх масивів знімка (settlements_store.map_snapshot) - лише для читання
+
+        Колонки та назви не копіюються: назви декодуються при зверненні, пошук
+        назви - бінарний по відсортованому масиву. У пам'яті процесу - лише
+        невеликі таблиці областей і типів.
+        """
+        table = cls.__new__(cls)
+        for column in ('lat', 'lon', 'population', 'name_ids', 'region_ids', 'type_ids'):
+            setattr(table, column, arrays[column])
+        table._name_head = arrays['name_head']
+        table._name_tail = arrays['name_tail']
+        table._name_next = arrays['name_next']
+
+        table.names = EncodedStrings(arrays['names'], arrays['name_offsets'])
+        table._name_lookup = SortedKeys(_Permuted(table.names, arrays['name_order']), arrays['name_order'])
+        table.regions, table.types = meta['regions'], meta['types']
+        table._region_lookup = {region: i for i, region in enumerate(table.regions)}
+        table._type_lookup = {settlement_type: i for i, settlement_type in enumerate(table.types)}
+        return table
+
+    def to_snapshot(self) -> Tuple[dict, Dict[str, array]]:
+        """Метадані та масиви для settlements_store.write_snapshot"""
+        names = EncodedStrings.encode(self.names)
+        name_order = array('I', sorted(range(len(self.names)), key=self.names.__getitem__))
+        return {'regions': list(self.regions), 'types': list(self.types)}, {
+            'lat': self.lat, 'lon': self.lon, 'population': self.population,
+            'name_ids': self.name_ids, 'region_ids': self.region_ids, 'type_ids': self.type_ids,
+            'name_head': self._name_head, 'name_tail': self._name_tail, 'name_next': self._name_next,
+            'names': names.blob, 'name_offsets': names.offsets, 'name_order': name_order
+        }
+
+    @staticmethod
+    def _intern(value: str, table: List[str], lookup: Dict[str, int]) -> int:
+        value_id = lookup.get(value)
+        if value_id is None:
+            value_id = lookup[value] = len(table)
+            table.append(value)
+        return value_id
+
+    def append(self, name: str, lat: float, lon: float, region: str,
+               settlement_type: str, population: int = 0) -> int:
+        """Додати запис, повернути його ідентифікатор"""
+        record_id = len(self.lat)
+        name_id = self._intern(name, self.names, self._name_lookup)
+
+        self.lat.append(lat)
+        self.lon.append(lon)
+        self.population.append(population or 0)
+        self.name_ids.append(name_id)
+        self.region_ids.append(self._intern(region, self.regions, self._region_lookup))
+        self.type_ids.append(self._intern(settlement_type, self.types, self._type_lookup))
+
+        self._name_next.append(-1)
+        if name_id == len(self._name_head):
+            self._name_head.append(record_id)
+            self._name_tail.append(record_id)
+        else:
+            self._name_next[self._name_tail[name_id]] = record_id
+            self._name_tail[name_id] = record_id
+        return record_id
+
+    def __len__(self) -> int:
+        return len(self.lat)
+
+    def name(self, record_id: int) -> str:
+        return self.names[self.name_ids[record_id]]
+
+    def region(self, record_id: int) -> str:
+        return self.regions[self.region_ids[record_id]]
+
+    def type(self, record_id: int) -> str:
+        return self.types[self.type_ids[record_id]]
+
+    def name_id(self, name: str) -> Optional[int]:
+        """Ідентифікатор назви (точний збіг) або None"""
+        return self._name_lookup.get(name)
+
+    def ids_for_name_id(self, name_id: int) -> Iterator[int]:
+        """Записи з назвою name_id у порядку додавання"""
+        record_id = self._name_head[name_id]
+        while record_id != -1:
+            yield record_id
+            record_id = self._name_next[record_id]
+
+    def has_duplicates(self, name_id: int) -> bool:
+        """Чи є кілька записів з цією назвою"""
+        return self._name_head[name_id] != self._name_tail[name_id]
+
+    def record(self, record_id: int) -> Record:
+        """(назва, lat, lon, область, тип, населення)"""
+        return (self.names[self.name_ids[record_id]], self.lat[record_id], self.lon[record_id],
+                self.regions[self.region_ids[record_id]], self.types[self.type_ids[record_id]],
+                self.population[record_id])
+
+    def iter_records(self) -> Iterator[Record]:
+        """Усі записи, згруповані за назвою (в порядку першої появи назви)"""
+        for name_id in range(len(self.names)):
+            for record_id in self.ids_for_name_id(name_id):
+                yield self.record(record_id)
+
+    def view(self, record_id: int, **extra) -> 'SettlementView':
+        return SettlementView(self, record_id, extra or None)
+
+
+class _Permuted(Sequence):
+    """strings у порядку order (відсортовані назви без копіювання)"""
+
+    def __init__(self, strings: Sequence, order):
+        self._strings = strings
+        self._order = order
+
+    def __getitem__(self, index: int) -> str:
+        return self._strings[self._order[index]]
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+
+class SettlementView(Mapping):
+    """Результат пошуку: словник-подібне представлення одного запису таблиці
+
+    Поля читаються з колонок при зверненні; full_name формується лише на вимогу.
+    Додаткові поля (distance_km, similarity) передаються через extra.
+    """
+
+    __slots__ = ('table', 'id', 'extra')
+
+    def __init__(self, table: SettlementTable, record_id: int, extra: Optional[dict] = None):
+        self.table = table
+        self.id = record_id
+        self.extra = extra
+
+    def __getitem__(self, key: str):
+        table, record_id = self.table, self.id
+        if key == 'name':
+            return table.name(record_id)
+        if key == 'region':
+            return table.region(record_id)
+        if key == 'lat':
+            return table.lat[record_id]
+        if key == 'lon':
+            return table.lon[record_id]
+        if key == 'population':
+            return table.population[record_id]
+        if key == 'type':
+            return table.type(record_id)
+        if key == 'full_name':
+            return f"{table.name(record_id)} ({table.region(record_id)})"
+        if self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from RESULT_FIELDS
+        if self.extra:
+            yield from self.extra
+
+    def __len__(self) -> int:
+        return len(RESULT_FIELDS) + (len(self.extra) if self.extra else 0)
+
+    def __repr__(self) -> str:
+        return f"SettlementView({dict(self)!r})"
+
+
+class SettlementsByName(Mapping):
+    """Сумісне з попереднім форматом представлення бази: назва -> [словники записів]
+
+    Словники створюються при зверненні - для нових викликів краще
+    використовувати методи пошуку UkraineSettlementsDB.
+    """
+
+    def __init__(self, table: SettlementTable):
+        self._table = table
+
+    def __getitem__(self, name: str) -> List[dict]:
+        name_id = self._table.name_id(name)
+        if name_id is None:
+            raise KeyError(name)
+        table = self._table
+        return [{
+            'lat': table.lat[record_id],
+            'lon': table.lon[record_id],
+            'region': table.region(record_id),
+            'type': table.type(record_id),
+            'population': table.population[record_id]
+        } for record_id in table.ids_for_name_id(name_id)]
+
+    def __contains__(self, name) -> bool:
+        return self._table.name_id(name) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._table.names)
+
+    def __len__(self) -> int:
+        return len(self._table.names)
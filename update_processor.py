@@ -0,0 +1,95 @@
+# update_processor.py - Паралельна обробка оновлень Telegram зі збереженням порядку в межах чату
+import os
+from collections import deque
+from typing import Any, Awaitable, Deque, Dict, Hashable, Optional
+import logging
+
+from telegram import Update
+from telegram.ext import BaseUpdateProcessor
+
+logger = logging.getLogger(__name__)
+
+
+class ChatOrderedUpdateProcessor(BaseUpdateProcessor):
+    """Оновлення різних чатів обробляються паралельно, одного чату - строго по черзі
+
+    Діалоги бота тримають стан у user_data між оновленнями (awaiting_city_for,
+    last_search_results): натискання кнопки меню, введена назва і вибір
+    результату мають оброблятися в порядку надходження. Поки оновлення чату
+    обробляється, наступні оновлення цього чату стають у його чергу і не
+    займають слотів max_concurrent_updates - один активний чат з довгою
+    чергою не витісняє інші чати. Чергу чату дообробляє той самий слот.
+    """
+
+    def __init__(self, max_concurrent_updates: int):
+        super().__init__(max_concurrent_updates)
+        # Чат -> оновлення, що чекають на завершення поточного оновлення цього чату
+        self._pending: Dict[Hashable, Deque[Awaitable[Any]]] = {}
+        self.processed = 0
+        self.deferred = 0
+        self.max_chat_backlog = 0
+
+    @staticmethod
+    def chat_key(update: object) -> Optional[Hashable]:
+        """Ключ впорядкування: чат, а для оновлень без чату (inline-запити) - користувач"""
+        if not isinstance(update, Update):
+            return None
+        if update.effective_chat is not None:
+            return update.effective_chat.id
+        if update.effective_user is not None:
+            return ('user', update.effective_user.id)
+        return None
+
+    async def do_process_update(self, update: object, coroutine: Awaitable[Any]) -> None:
+        key = self.chat_key(update)
+        if key is None:
+            await self._run(coroutine)
+            return
+
+        pending = self._pending.get(key)
+        if pending is not None:
+            # Чат уже обробляється - оновлення виконає той самий обробник після поточного
+            pending.append(coroutine)
+            self.deferred += 1
+            self.max_chat_backlog = max(self.max_chat_backlog, len(pending))
+            return
+
+        pending = self._pending[key] = deque()
+        try:
+            await self._run(coroutine)
+            while pending:
+                await self._run(pending.popleft())
+        finally:
+            # Після скасування (зупинка бота) решта оновлень чату вже не виконається
+            for leftover in self._pending.pop(key):
+                leftover.close()
+
+    async def _run(self, coroutine: Awaitable[Any]):
+        # Application.process_update сам передає помилки обробників в error_handler;
+        # тут ловимо лише те, що вислизнуло, щоб не загубити решту черги чату
+        try:
+            await coroutine
+        except Exception as e:
+            logger.error(f"Update processing failed: {e}", exc_info=True)
+        self.processed += 1
+
+    async def initialize(self) -> None:
+        """Нічого не потрібно"""
+
+    async def shutdown(self) -> None:
+        """Нічого не потрібно: черги чатів закриваються при скасуванні їхніх обробників"""
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Статистика для /metrics"""
+        return {
+            'max_concurrent_updates': self.max_concurrent_updates,
+            'active_chats': len(self._pending),
+            'queued': sum(len(pending) for pending in list(self._pending.values())),
+            'max_chat_backlog': self.max_chat_backlog,
+            'processed': self.processed,
+            'deferred': self.deferred
+        }
+
+
+# Спільний процесор застосунку: UPDATE_CONCURRENCY оновлень одночасно (1 - послідовна обробка)
+update_processor = ChatOrderedUpdateProcessor(int(os.getenv('UPDATE_CONCURRENCY', 32)))
@@ -1,10 +1,20 @@
 import os
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait as wait_futures
 import requests
+import aiohttp
 import math
+import sqlite3
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 import logging
 
+from weather_cache import DiskCache, ForecastCache, SingleFlight, snap_to_grid, FRESH, STALE
+from resilience import CircuitBreaker, RequestQuota, CLOSED, PRIORITY_USER, PRIORITY_BACKGROUND
+from work_pool import ExecutorBusy, work_pool
+
 logger = logging.getLogger(__name__)
 
 class WeatherAPI:
@@ -17,29 +27,406 @@ class WeatherAPI:
         # Цільові висоти для відображення
         self.target_altitudes = [400, 600, 800, 1000]  # метри
         
+        # Спільна aiohttp-сесія для асинхронних запитів (keep-alive + DNS кеш)
+        self.http_pool_size = int(os.getenv('WEATHER_HTTP_POOL_SIZE', 100))
+        self.dns_cache_ttl = int(os.getenv('WEATHER_DNS_CACHE_TTL', 300))
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop = None
+        
+        # Кеш відповідей API: ключ - комірка сітки моделі (~0.1°) + кількість днів.
+        # Після soft TTL дані віддаються одразу і оновлюються у фоні, після hard TTL - запит до API
+        self.cache_grid_step = float(os.getenv('WEATHER_CACHE_GRID', 0.1))
+        self.forecast_cache = ForecastCache(
+            soft_ttl=float(os.getenv('WEATHER_CACHE_SOFT_TTL', os.getenv('WEATHER_CACHE_TTL', 600))),
+            hard_ttl=float(os.getenv('WEATHER_CACHE_HARD_TTL', 3600)),
+            max_entries=int(os.getenv('WEATHER_CACHE_MAX_ENTRIES', 512)),
+            disk=self._open_disk_cache()
+        )
+        self._refreshing = set()
+        self._refreshing_lock = threading.Lock()
+        
+        # Завжди запитуємо найширший горизонт прогнозу, вужчі запити нарізаються з нього
+        self.fetch_forecast_days = int(os.getenv('WEATHER_FETCH_DAYS', 3))
+        
+        # Кількість точок в одному пакетному запиті до Open-Meteo
+        self.batch_size = int(os.getenv('WEATHER_BATCH_SIZE', 50))
+        
+        # Бюджет часу (секунди) на отримання даних для кожного типу екрана.
+        # Open-Meteo та OpenWeatherMap запитуються паралельно; якщо OpenWeatherMap
+        # не встигає - висотний вітер апроксимується з приземного
+        self.latency_budgets = {
+            'current': float(os.getenv('WEATHER_BUDGET_CURRENT', 6)),
+            'forecast': float(os.getenv('WEATHER_BUDGET_FORECAST', 10)),
+            'favorites': float(os.getenv('WEATHER_BUDGET_FAVORITES', 4)),
+            'warmup': float(os.getenv('WEATHER_BUDGET_WARMUP', 30))
+        }
+        self._fanout_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='weather-fanout')
+        
+        # Одночасні запити для тієї ж комірки/днів/джерела чекають на один запит до API
+        self.inflight = SingleFlight()
+        
+        # Запобіжники для кожного API: після серії помилок запити не надсилаються,
+        # а одразу використовується кеш або апроксимація
+        self.breakers = {
+            name: CircuitBreaker(
+                name,
+                failure_rate=float(os.getenv('WEATHER_BREAKER_FAILURE_RATE', 0.5)),
+                min_calls=int(os.getenv('WEATHER_BREAKER_MIN_CALLS', 5)),
+                consecutive_failures=int(os.getenv('WEATHER_BREAKER_FAILURES', 3)),
+                window=float(os.getenv('WEATHER_BREAKER_WINDOW', 60)),
+                base_backoff=float(os.getenv('WEATHER_BREAKER_BACKOFF', 15)),
+                max_backoff=float(os.getenv('WEATHER_BREAKER_MAX_BACKOFF', 600))
+            )
+            for name in ('open_meteo', 'openweathermap')
+        }
+        
+        # Клієнтські квоти (безкоштовні тарифи: Open-Meteo ~600/хв і 10000/добу, OpenWeatherMap 60/хв і 1000/добу).
+        # Коли квота закінчується, фонові запити відкидаються першими, а кеш віддається довше
+        quota_reserve = float(os.getenv('WEATHER_QUOTA_RESERVE', 0.2))
+        self.quotas = {
+            'open_meteo': RequestQuota(
+                'open_meteo',
+                per_minute=int(os.getenv('WEATHER_QUOTA_OPEN_METEO_PER_MINUTE', 600)),
+                daily=int(os.getenv('WEATHER_QUOTA_OPEN_METEO_DAILY', 10000)),
+                reserve=quota_reserve
+            ),
+            'openweathermap': RequestQuota(
+                'openweathermap',
+                per_minute=int(os.getenv('WEATHER_QUOTA_OWM_PER_MINUTE', 60)),
+                daily=int(os.getenv('WEATHER_QUOTA_OWM_DAILY', 1000)),
+                reserve=quota_reserve
+            )
+        }
+        self.low_quota_max_stale = float(os.getenv('WEATHER_LOW_QUOTA_MAX_STALE', 6 * 3600))
+        
         if not self.openweathermap_key:
             logger.warning("⚠️ OPENWEATHERMAP_API_KEY not found in environment variables")
             logger.warning("⚠️ Altitude wind data will be estimated only")
         else:
             logger.info("✅ OpenWeatherMap API key found")
     
-    def get_weather(self, lat: float, lon: float, forecast_days: int = 3) -> Optional[dict]:
+    def _open_disk_cache(self) -> Optional[DiskCache]:
+        """Дисковий кеш (WEATHER_DISK_CACHE=шлях до файлу SQLite), щоб кеш переживав перезапуск"""
+        path = os.getenv('WEATHER_DISK_CACHE')
+        if not path:
+            return None
+        
+        try:
+            return DiskCache(
+                path,
+                max_entries=int(os.getenv('WEATHER_DISK_CACHE_MAX_ENTRIES', 5000)),
+                # Зберігаємо довше за hard TTL: при низькій квоті застарілі дані теж корисні
+                max_age=float(os.getenv('WEATHER_LOW_QUOTA_MAX_STALE', 6 * 3600))
+            )
+        except sqlite3.Error as e:
+            logger.error(f"❌ Disk cache unavailable ({path}): {e}")
+            return None
+    
+    def get_weather(self, lat: float, lon: float, forecast_days: int = 3, view: str = 'current') -> Optional[dict]:
         """Отримати погоду з Open-Meteo API та висотний вітер з OpenWeatherMap"""
         logger.info(f"🌤 Getting weather for lat={lat}, lon={lon}, days={forecast_days}")
+        budget = self.get_latency_budget(view)
+        
+        # Запити до Open-Meteo та OpenWeatherMap незалежні - виконуємо їх паралельно
+        open_meteo_future = self._fanout_executor.submit(self._fetch_open_meteo, lat, lon, forecast_days)
+        owm_future = None
+        if self.openweathermap_key:
+            owm_future = self._fanout_executor.submit(self._fetch_openweathermap, lat, lon)
         
-        # Отримуємо основні дані погоди з Open-Meteo
-        open_meteo_data = self.get_open_meteo_weather(lat, lon, forecast_days)
+        wait_futures([f for f in (open_meteo_future, owm_future) if f], timeout=budget)
+        
+        if not open_meteo_future.done():
+            logger.error(f"❌ Open-Meteo missed the {budget:.0f}s deadline")
+            return None
+        
+        # Отримуємо основні дані погоди з Open-Meteo (з кешу, якщо є)
+        open_meteo_data = self._slice_forecast(open_meteo_future.result(), forecast_days)
+        
+        if not open_meteo_data:
+            logger.error("❌ Failed to get Open-Meteo data")
+            return None
+        
+        # Висотний вітер з OpenWeatherMap, якщо він встиг у межах бюджету
+        altitude_wind_data = []
+        if owm_future is not None:
+            if owm_future.done():
+                altitude_wind_data = owm_future.result()
+            else:
+                logger.warning(f"⏱ OpenWeatherMap missed the {budget:.0f}s deadline")
+        
+        return self._assemble_weather(open_meteo_data, altitude_wind_data)
+    
+    async def get_weather_async(self, lat: float, lon: float, forecast_days: int = 3,
+                                view: str = 'current') -> Optional[dict]:
+        """Асинхронна версія get_weather, яка не блокує event loop бота"""
+        logger.info(f"🌤 Getting weather (async) for lat={lat}, lon={lon}, days={forecast_days}")
+        budget = self.get_latency_budget(view)
+        
+        # Запити до Open-Meteo та OpenWeatherMap незалежні - виконуємо їх паралельно.
+        # Скасування після дедлайну не зупиняє сам запит (він у single-flight) - він доповнить кеш
+        open_meteo_task = asyncio.ensure_future(self._fetch_open_meteo_async(lat, lon, forecast_days))
+        owm_task = None
+        if self.openweathermap_key:
+            owm_task = asyncio.ensure_future(self._fetch_openweathermap_async(lat, lon))
+        
+        await asyncio.wait([t for t in (open_meteo_task, owm_task) if t], timeout=budget)
+        
+        altitude_wind_data = []
+        if owm_task is not None:
+            if owm_task.done():
+                altitude_wind_data = owm_task.result()
+            else:
+                logger.warning(f"⏱ OpenWeatherMap missed the {budget:.0f}s deadline")
+                owm_task.cancel()
+        
+        if not open_meteo_task.done():
+            logger.error(f"❌ Open-Meteo missed the {budget:.0f}s deadline")
+            open_meteo_task.cancel()
+            return None
+        
+        open_meteo_data = self._slice_forecast(open_meteo_task.result(), forecast_days)
         
         if not open_meteo_data:
             logger.error("❌ Failed to get Open-Meteo data")
             return None
         
-        # Отримуємо висотний вітер з OpenWeatherMap
+        return await self._offload(self._assemble_weather, open_meteo_data, altitude_wind_data)
+    
+    def get_latency_budget(self, view: str) -> float:
+        """Бюджет часу на отримання даних для типу екрана"""
+        return self.latency_budgets.get(view, self.latency_budgets['current'])
+    
+    def _priority_for_view(self, view: str) -> str:
+        """Прогрів кешу - фонова робота, решта екранів - запити користувачів"""
+        return PRIORITY_BACKGROUND if view == 'warmup' else PRIORITY_USER
+    
+    def get_weather_many(self, points: List[Tuple[float, float]], forecast_days: int = 3,
+                         view: str = 'warmup') -> List[Optional[dict]]:
+        """Отримати погоду для багатьох точок пакетними запитами до Open-Meteo
+        
+        Висотний вітер береться з кешу OpenWeatherMap, якщо він там є, інакше - апроксимація.
+        """
+        fetch_days = max(forecast_days, self.fetch_forecast_days)
+        keys = [self._cache_key('open_meteo', lat, lon, fetch_days) for lat, lon in points]
+        
+        # Запитуємо тільки відсутні або застарілі комірки, кожну - один раз
+        missing = {}
+        for key, (lat, lon) in zip(keys, points):
+            if key not in missing and self.forecast_cache.peek(key) != FRESH:
+                missing[key] = self._grid_point(lat, lon)
+        
+        missing_keys = list(missing)
+        for start in range(0, len(missing_keys), self.batch_size):
+            chunk = missing_keys[start:start + self.batch_size]
+            payloads = self.get_open_meteo_weather_many(
+                [missing[key] for key in chunk], fetch_days, self._priority_for_view(view)
+            )
+            for key, data in zip(chunk, payloads):
+                self._store(key, data)
+        
+        return [self._assemble_cached(key, lat, lon, forecast_days) for key, (lat, lon) in zip(keys, points)]
+    
+    async def get_weather_many_async(self, points: List[Tuple[float, float]], forecast_days: int = 3,
+                                     view: str = 'warmup') -> List[Optional[dict]]:
+        """Асинхронна версія get_weather_many (точки, що не встигли в бюджет часу, повертаються як None)"""
+        fetch_days = max(forecast_days, self.fetch_forecast_days)
+        keys = [self._cache_key('open_meteo', lat, lon, fetch_days) for lat, lon in points]
+        
+        # Комірки, які вже запитуються поодинці, не дублюємо в пакеті - чекаємо на них
+        waiting = {}
+        missing = {}
+        for key, (lat, lon) in zip(keys, points):
+            if key in waiting or key in missing:
+                continue
+            future = self.inflight.join(key)
+            if future is not None:
+                waiting[key] = future
+            elif await self._cache_io(self.forecast_cache.peek, key) != FRESH:
+                missing[key] = self._grid_point(lat, lon)
+        
+        missing_keys = list(missing)
+        for start in range(0, len(missing_keys), self.batch_size):
+            chunk = missing_keys[start:start + self.batch_size]
+            batch = asyncio.ensure_future(
+                self.get_open_meteo_weather_many_async(
+                    [missing[key] for key in chunk], fetch_days, self._priority_for_view(view)
+                )
+            )
+            
+            # Кожна комірка пакета реєструється в single-flight, щоб поодинокі запити чекали на пакет
+            for index, key in enumerate(chunk):
+                async def take(batch=batch, index=index, key=key):
+                    return await self._cache_io(self._store, key, (await batch)[index])
+                waiting[key] = self.inflight.start(key, take)
+        
+        if waiting:
+            await asyncio.wait(list(waiting.values()), timeout=self.get_latency_budget(view))
+        
+        return await self._offload(
+            lambda: [self._assemble_cached(key, lat, lon, forecast_days) for key, (lat, lon) in zip(keys, points)]
+        )
+    
+    def _assemble_cached(self, key: tuple, lat: float, lon: float, forecast_days: int) -> Optional[dict]:
+        """Зібрати результат для точки з кешованих відповідей (без запитів до API)"""
+        open_meteo_data = self._slice_forecast(self._cache_lookup(key)[0], forecast_days)
+        if not open_meteo_data:
+            return None
+        
         altitude_wind_data = []
         if self.openweathermap_key:
-            altitude_wind_data = self._get_openweathermap_altitude_wind(lat, lon)
+            altitude_wind_data = self._cache_lookup(self._cache_key('openweathermap', lat, lon))[0] or []
+        
+        return self._assemble_weather(open_meteo_data, altitude_wind_data)
+    
+    def _fetch_open_meteo(self, lat: float, lon: float, forecast_days: int) -> Optional[dict]:
+        """Дані Open-Meteo з кешу або з API (на найширший горизонт прогнозу)"""
+        fetch_days = max(forecast_days, self.fetch_forecast_days)
+        key = self._cache_key('open_meteo', lat, lon, fetch_days)
+        return self._cached_fetch(
+            key, lambda priority: self.get_open_meteo_weather(*self._grid_point(lat, lon), fetch_days, priority)
+        )
+    
+    def _fetch_openweathermap(self, lat: float, lon: float) -> List[Dict]:
+        """Висотний вітер OpenWeatherMap з кешу або з API"""
+        key = self._cache_key('openweathermap', lat, lon)
+        return self._cached_fetch(
+            key, lambda priority: self._get_openweathermap_altitude_wind(*self._grid_point(lat, lon), priority)
+        )
+    
+    async def _fetch_open_meteo_async(self, lat: float, lon: float, forecast_days: int) -> Optional[dict]:
+        """Дані Open-Meteo з кешу або з API (однакові одночасні запити об'єднуються)"""
+        fetch_days = max(forecast_days, self.fetch_forecast_days)
+        key = self._cache_key('open_meteo', lat, lon, fetch_days)
+        return await self._cached_fetch_async(
+            key, lambda priority: self.get_open_meteo_weather_async(*self._grid_point(lat, lon), fetch_days, priority)
+        )
+    
+    async def _fetch_openweathermap_async(self, lat: float, lon: float) -> List[Dict]:
+        """Висотний вітер OpenWeatherMap з кешу або з API (однакові одночасні запити об'єднуються)"""
+        key = self._cache_key('openweathermap', lat, lon)
+        return await self._cached_fetch_async(
+            key, lambda priority: self._get_openweathermap_altitude_wind_async(*self._grid_point(lat, lon), priority)
+        )
+    
+    def _cached_fetch(self, key: tuple, fetch):
+        """Stale-while-revalidate: застарілі дані віддаються одразу, оновлення - у фоновому потоці"""
+        data, state = self._cache_lookup(key)
+        
+        if state == STALE:
+            with self._refreshing_lock:
+                if key in self._refreshing:
+                    return data
+                self._refreshing.add(key)
+            
+            def refresh():
+                try:
+                    self._store(key, fetch(PRIORITY_BACKGROUND))
+                finally:
+                    with self._refreshing_lock:
+                        self._refreshing.discard(key)
+            
+            threading.Thread(target=refresh, daemon=True).start()
+            return data
+        
+        if data is not None:
+            return data
+        
+        return self._store(key, fetch(PRIORITY_USER))
+    
+    async def _cached_fetch_async(self, key: tuple, fetch):
+        """Stale-while-revalidate: застарілі дані віддаються одразу, одне оновлення - у фоні"""
+        data, state = await self._cache_io(self._cache_lookup, key)
+        
+        def fetch_and_store(priority):
+            async def run():
+                return await self._cache_io(self._store, key, await fetch(priority))
+            return run
         
-        # Якщо OpenWeatherMap не дав даних, використовуємо апроксимацію
+        if state == STALE:
+            logger.info(f"♻️ Serving stale {key[0]} data, refreshing in background")
+            self.inflight.start(key, fetch_and_store(PRIORITY_BACKGROUND))
+            return data
+        
+        if data is not None:
+            return data
+        
+        return await self.inflight.run(key, fetch_and_store(PRIORITY_USER))
+    
+    async def _offload(self, fn, *args):
+        """Виконати fn у пулі обробників, а не в event loop
+
+        Запит користувача вже прийнято обробником, тож при переповненій черзі
+        (ExecutorBusy) fn виконується одразу тут - відповідь і запис у кеш не губляться.
+        """
+        try:
+            return await work_pool.run(fn, *args)
+        except ExecutorBusy:
+            return fn(*args)
+    
+    async def _cache_io(self, fn, *args):
+        """Операція з кешем: з дисковим кешем (SQLite) - у пулі, кеш лише в пам'яті - одразу"""
+        if self.forecast_cache.disk is None:
+            return fn(*args)
+        return await self._offload(fn, *args)
+    
+    def _cache_lookup(self, key: tuple):
+        """Пошук у кеші; коли квота API майже вичерпана або запобіжник API не закритий,
+        застарілі дані віддаються довше - останній відомий прогноз кращий за апроксимацію"""
+        source = key[0]
+        if self.quotas[source].is_low() or self.breakers[source].state != CLOSED:
+            return self.forecast_cache.lookup(key, max_stale=self.low_quota_max_stale)
+        return self.forecast_cache.lookup(key)
+    
+    def _store(self, key: tuple, data):
+        """Зберегти успішну відповідь API у кеш"""
+        if data:
+            self.forecast_cache.put(key, data)
+        return data
+    
+    def _slice_forecast(self, data: Optional[dict], forecast_days: int) -> Optional[dict]:
+        """Обрізати почасові та денні масиви до потрібної кількості днів"""
+        if not data:
+            return data
+        
+        # Завжди повертаємо копію, щоб не змінювати відповідь, що зберігається в кеші
+        sliced = dict(data)
+        for section, length in (('hourly', forecast_days * 24), ('daily', forecast_days)):
+            values = data.get(section)
+            if isinstance(values, dict):
+                sliced[section] = {
+                    name: series[:length] if isinstance(series, list) else series
+                    for name, series in values.items()
+                }
+        return sliced
+    
+    def _cache_key(self, source: str, lat: float, lon: float, forecast_days: int = 0) -> tuple:
+        """Ключ кешу: джерело, комірка сітки та кількість днів прогнозу"""
+        lat_cell, lon_cell = snap_to_grid(lat, lon, self.cache_grid_step)
+        return (source, lat_cell, lon_cell, forecast_days)
+    
+    def _grid_point(self, lat: float, lon: float) -> Tuple[float, float]:
+        """Координати центру комірки сітки, для якої робиться запит до API"""
+        lat_cell, lon_cell = snap_to_grid(lat, lon, self.cache_grid_step)
+        return round(lat_cell * self.cache_grid_step, 4), round(lon_cell * self.cache_grid_step, 4)
+    
+    def get_stats(self) -> dict:
+        """Метрики шару погоди"""
+        return {
+            'cache': self.forecast_cache.get_stats(),
+            'single_flight': self.inflight.get_stats(),
+            'breakers': self.get_upstream_health(),
+            'quotas': {name: quota.get_state() for name, quota in self.quotas.items()}
+        }
+    
+    def get_upstream_health(self) -> dict:
+        """Стан запобіжників зовнішніх API для /health"""
+        return {name: breaker.get_state() for name, breaker in self.breakers.items()}
+    
+    def _assemble_weather(self, open_meteo_data: dict, altitude_wind_data: List[Dict]) -> dict:
+        """Доповнити дані Open-Meteo висотним вітром та кромкою хмар"""
+        openweathermap_used = bool(altitude_wind_data)
+        
+        # Якщо OpenWeatherMap не дав даних (або не встиг), використовуємо апроксимацію
         if not altitude_wind_data:
             logger.info("🔄 OpenWeatherMap failed or no key, estimating altitude wind")
             altitude_wind_data = self._estimate_altitude_wind_from_surface(open_meteo_data)
@@ -50,55 +437,214 @@ class WeatherAPI:
         # Додаємо дані про висотний вітер та кромку хмар
         open_meteo_data['altitude_wind'] = altitude_wind_data
         open_meteo_data['cloud_base'] = cloud_base_data
-        open_meteo_data['openweathermap_used'] = bool(altitude_wind_data and self.openweathermap_key)
+        open_meteo_data['openweathermap_used'] = openweathermap_used
         
         logger.info(f"✅ Weather data ready with {len(altitude_wind_data)} altitude levels and cloud base")
         return open_meteo_data
     
-    def get_open_meteo_weather(self, lat: float, lon: float, forecast_days: int) -> Optional[dict]:
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Отримати спільну aiohttp-сесію з пулом з'єднань"""
+        loop = asyncio.get_running_loop()
+        
+        # Сесія прив'язана до event loop, тому для нового loop створюємо нову
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit=self.http_pool_size,
+                ttl_dns_cache=self.dns_cache_ttl,
+                keepalive_timeout=60
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._session_loop = loop
+            logger.info(f"🌐 aiohttp session created (pool={self.http_pool_size}, dns_ttl={self.dns_cache_ttl}s)")
+        
+        return self._session
+    
+    async def close(self):
+        """Закрити aiohttp-сесію (викликається при зупинці бота)"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            logger.info("🌐 aiohttp session closed")
+        self._session = None
+        self._session_loop = None
+    
+    def _build_open_meteo_params(self, lat: float, lon: float, forecast_days: int) -> dict:
+        """Параметри запиту до Open-Meteo"""
+        return {
+            'latitude': lat,
+            'longitude': lon,
+            'current': ','.join([
+                'temperature_2m', 'relative_humidity_2m', 'apparent_temperature',
+                'precipitation', 'weather_code', 'pressure_msl', 
+                'wind_speed_10m', 'wind_direction_10m', 'wind_gusts_10m',
+                'cloud_cover'
+            ]),
+            'hourly': ','.join([
+                'temperature_2m', 'precipitation_probability',
+                'precipitation', 'weather_code',
+                'wind_speed_10m', 'wind_direction_10m',
+                'cloud_cover', 'relative_humidity_2m'
+            ]),
+            'daily': ','.join([
+                'temperature_2m_max', 'temperature_2m_min',
+                'precipitation_sum', 'precipitation_hours',
+                'weather_code', 'sunrise', 'sunset',
+                'wind_speed_10m_max', 'wind_gusts_10m_max',
+                'wind_direction_10m_dominant',
+                'cloud_cover_mean'
+            ]),
+            'timezone': 'auto',
+            'forecast_days': forecast_days
+        }
+    
+    def get_open_meteo_weather(self, lat: float, lon: float, forecast_days: int,
+                               priority: str = PRIORITY_USER) -> Optional[dict]:
         """Отримати основні дані погоди з Open-Meteo"""
+        data = self._request_open_meteo(self._build_open_meteo_params(lat, lon, forecast_days), 1, priority)
+        
+        if data:
+            data['fetched_at'] = time.time()
+            logger.info("✅ Open-Meteo data received")
+        return data
+    
+    async def get_open_meteo_weather_async(self, lat: float, lon: float, forecast_days: int,
+                                           priority: str = PRIORITY_USER) -> Optional[dict]:
+        """Асинхронно отримати основні дані погоди з Open-Meteo"""
+        data = await self._request_open_meteo_async(
+            self._build_open_meteo_params(lat, lon, forecast_days), 1, priority
+        )
+        
+        if data:
+            data['fetched_at'] = time.time()
+            logger.info("✅ Open-Meteo data received")
+        return data
+    
+    def get_open_meteo_weather_many(self, coords: List[Tuple[float, float]], forecast_days: int,
+                                    priority: str = PRIORITY_USER) -> List[Optional[dict]]:
+        """Отримати дані Open-Meteo для кількох точок одним запитом"""
+        # Open-Meteo рахує кожну точку пакета як окремий виклик
+        data = self._request_open_meteo(self._build_many_params(coords, forecast_days), len(coords), priority)
+        
+        if data:
+            return self._split_many_response(data, len(coords))
+        return [None] * len(coords)
+    
+    async def get_open_meteo_weather_many_async(self, coords: List[Tuple[float, float]], forecast_days: int,
+                                                priority: str = PRIORITY_USER) -> List[Optional[dict]]:
+        """Асинхронно отримати дані Open-Meteo для кількох точок одним запитом"""
+        data = await self._request_open_meteo_async(
+            self._build_many_params(coords, forecast_days), len(coords), priority
+        )
+        
+        if data:
+            return self._split_many_response(data, len(coords))
+        return [None] * len(coords)
+    
+    def _request_open_meteo(self, params: dict, cost: int = 1, priority: str = PRIORITY_USER):
+        """GET-запит до Open-Meteo через запобіжник та квоту"""
+        if self._admit('open_meteo', cost, priority) is None:
+            return None
+        breaker = self.breakers['open_meteo']
+        
         try:
-            params = {
-                'latitude': lat,
-                'longitude': lon,
-                'current': [
-                    'temperature_2m', 'relative_humidity_2m', 'apparent_temperature',
-                    'precipitation', 'weather_code', 'pressure_msl', 
-                    'wind_speed_10m', 'wind_direction_10m', 'wind_gusts_10m',
-                    'cloud_cover'
-                ],
-                'hourly': [
-                    'temperature_2m', 'precipitation_probability',
-                    'precipitation', 'weather_code',
-                    'wind_speed_10m', 'wind_direction_10m',
-                    'cloud_cover', 'relative_humidity_2m'
-                ],
-                'daily': [
-                    'temperature_2m_max', 'temperature_2m_min',
-                    'precipitation_sum', 'precipitation_hours',
-                    'weather_code', 'sunrise', 'sunset',
-                    'wind_speed_10m_max', 'wind_gusts_10m_max',
-                    'wind_direction_10m_dominant',
-                    'cloud_cover_mean'
-                ],
-                'timezone': 'auto',
-                'forecast_days': forecast_days
-            }
-            
             response = requests.get(self.open_meteo_url, params=params, timeout=15)
             
             if response.status_code == 200:
                 data = response.json()
-                logger.info("✅ Open-Meteo data received")
+                breaker.record_success()
                 return data
-            else:
-                logger.error(f"❌ Open-Meteo error: {response.status_code}")
+            
+            logger.error(f"❌ Open-Meteo error: {response.status_code}")
+            self._record_http_status(breaker, response.status_code)
+            
+        except Exception as e:
+            logger.error(f"❌ Open-Meteo request error: {e}")
+            breaker.record_failure(type(e).__name__)
+        
+        return None
+    
+    async def _request_open_meteo_async(self, params: dict, cost: int = 1, priority: str = PRIORITY_USER):
+        """Асинхронний GET-запит до Open-Meteo через запобіжник та квоту"""
+        permit = self._admit('open_meteo', cost, priority)
+        if permit is None:
+            return None
+        breaker = self.breakers['open_meteo']
+        
+        try:
+            session = await self._get_session()
+            
+            async with session.get(self.open_meteo_url, params=params,
+                                   timeout=aiohttp.ClientTimeout(total=15)) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    breaker.record_success()
+                    return data
+                
+                logger.error(f"❌ Open-Meteo error: {response.status}")
+                self._record_http_status(breaker, response.status)
                 
+        except asyncio.CancelledError:
+            # Скасування - лише при зупинці бота (бюджет латентності не скасовує запит, він у single-flight):
+            # це не збій API, тож лише звільняємо слот пробного запиту, якщо його зайняв цей запит
+            breaker.release(permit)
+            raise
+        except asyncio.TimeoutError:
+            logger.error("❌ Open-Meteo request timeout")
+            breaker.record_failure("timeout")
         except Exception as e:
             logger.error(f"❌ Open-Meteo request error: {e}")
+            breaker.record_failure(type(e).__name__)
         
         return None
     
+    def _admit(self, source: str, cost: int = 1, priority: str = PRIORITY_USER) -> Optional[int]:
+        """Чи можна надіслати запит: запобіжник пропускає і квота дозволяє
+
+        None - запит пропускається; інакше дозвіл запобіжника (див. CircuitBreaker.allow_request)
+        """
+        breaker = self.breakers[source]
+        permit = breaker.allow_request()
+        if permit is None:
+            logger.warning(f"🔌 {source} circuit is open, request skipped")
+            return None
+        
+        if not self.quotas[source].try_acquire(cost, priority):
+            breaker.release(permit)
+            logger.warning(f"🚦 {source} quota is low, {priority} request skipped")
+            return None
+        
+        return permit
+    
+    def _record_http_status(self, breaker: CircuitBreaker, status: int):
+        """Неуспішна HTTP-відповідь: збій сервісу чи помилка запиту"""
+        # 401/403 (ключ), 429 (ліміт) та 5xx - проблеми на боці API, решта - помилка самого запиту
+        if status >= 500 or status in (401, 403, 429):
+            breaker.record_failure(f"HTTP {status}")
+        else:
+            breaker.record_success()
+    
+    def _build_many_params(self, coords: List[Tuple[float, float]], forecast_days: int) -> dict:
+        """Параметри пакетного запиту: координати через кому"""
+        return self._build_open_meteo_params(
+            ','.join(str(lat) for lat, _ in coords),
+            ','.join(str(lon) for _, lon in coords),
+            forecast_days
+        )
+    
+    def _split_many_response(self, data, count: int) -> List[Optional[dict]]:
+        """Розбити відповідь пакетного запиту на окремі точки"""
+        # Для однієї точки Open-Meteo повертає об'єкт, для кількох - список
+        items = data if isinstance(data, list) else [data]
+        if len(items) != count:
+            logger.error(f"❌ Open-Meteo batch returned {len(items)} results for {count} points")
+            return [None] * count
+        
+        fetched_at = time.time()
+        for item in items:
+            item['fetched_at'] = fetched_at
+        
+        logger.info(f"✅ Open-Meteo batch data received for {count} points")
+        return items
+    
     def _calculate_cloud_base(self, weather_data: dict) -> Dict:
         """Розрахувати висоту кромки хмар на основі температури та вологості"""
         try:
@@ -162,23 +708,22 @@ class WeatherAPI:
         else:
             return "Високі (Cirrus/Cirrostratus)"
     
-    def _get_openweathermap_altitude_wind(self, lat: float, lon: float) -> List[Dict]:
+    def _get_openweathermap_altitude_wind(self, lat: float, lon: float,
+                                          priority: str = PRIORITY_USER) -> List[Dict]:
         """Отримати висотний вітер з OpenWeatherMap API"""
         if not self.openweathermap_key:
             logger.warning("⚠️ OpenWeatherMap key not available")
             return []
         
+        if self._admit('openweathermap', 1, priority) is None:
+            return []
+        breaker = self.breakers['openweathermap']
+        
         try:
             logger.info(f"🌪 Getting altitude wind from OpenWeatherMap for {lat}, {lon}")
             
             # Використовуємо One Call API 3.0 для отримання даних з різних висот
-            params = {
-                'lat': lat,
-                'lon': lon,
-                'appid': self.openweathermap_key,
-                'units': 'metric',
-                'exclude': 'minutely,hourly,daily,alerts'  # Беремо тільки поточні дані
-            }
+            params = self._build_openweathermap_params(lat, lon)
             
             # Використовуємо один з двох варіантів API
             try:
@@ -204,25 +749,101 @@ class WeatherAPI:
             
             if response.status_code == 200:
                 data = response.json()
-                
-                # Обробляємо дані в залежності від версії API
-                if api_version == "3.0":
-                    return self._process_openweathermap_v3(data, lat, lon)
-                else:
-                    return self._process_openweathermap_v25(data)
+                breaker.record_success()
+                return self._process_openweathermap(data, api_version, lat, lon)
             else:
                 logger.error(f"❌ OpenWeatherMap error {response.status_code}: {response.text[:100]}")
+                self._record_http_status(breaker, response.status_code)
                 return []
                 
         except requests.exceptions.Timeout:
             logger.error("❌ OpenWeatherMap request timeout")
+            breaker.record_failure("timeout")
         except requests.exceptions.ConnectionError:
             logger.error("❌ OpenWeatherMap connection error")
+            breaker.record_failure("connection error")
         except Exception as e:
             logger.error(f"❌ OpenWeatherMap error: {e}")
+            breaker.record_failure(type(e).__name__)
         
         return []
     
+    async def _get_openweathermap_altitude_wind_async(self, lat: float, lon: float,
+                                                      priority: str = PRIORITY_USER) -> List[Dict]:
+        """Асинхронно отримати висотний вітер з OpenWeatherMap API"""
+        if not self.openweathermap_key:
+            logger.warning("⚠️ OpenWeatherMap key not available")
+            return []
+        
+        permit = self._admit('openweathermap', 1, priority)
+        if permit is None:
+            return []
+        breaker = self.breakers['openweathermap']
+        
+        try:
+            logger.info(f"🌪 Getting altitude wind (async) from OpenWeatherMap for {lat}, {lon}")
+            
+            params = self._build_openweathermap_params(lat, lon)
+            session = await self._get_session()
+            timeout = aiohttp.ClientTimeout(total=10)
+            
+            try:
+                # Спробуємо новий One Call API 3.0
+                response = await session.get(self.openweathermap_onecall_url, params=params, timeout=timeout)
+                api_version = "3.0"
+            except Exception as e:
+                logger.warning(f"⚠️ One Call 3.0 failed: {e}, trying old API")
+                # Спробуємо старий API
+                params['cnt'] = 1  # Тільки поточний прогноз
+                response = await session.get(self.openweathermap_url, params=params, timeout=timeout)
+                api_version = "2.5"
+            
+            async with response:
+                logger.info(f"📡 OpenWeatherMap {api_version} response: {response.status}")
+                
+                if response.status == 200:
+                    data = await response.json()
+                    breaker.record_success()
+                    return self._process_openweathermap(data, api_version, lat, lon)
+                else:
+                    text = await response.text()
+                    logger.error(f"❌ OpenWeatherMap error {response.status}: {text[:100]}")
+                    self._record_http_status(breaker, response.status)
+                    return []
+                
+        except asyncio.CancelledError:
+            # Скасування - лише при зупинці бота (бюджет латентності не скасовує запит, він у single-flight):
+            # це не збій API, тож лише звільняємо слот пробного запиту, якщо його зайняв цей запит
+            breaker.release(permit)
+            raise
+        except asyncio.TimeoutError:
+            logger.error("❌ OpenWeatherMap request timeout")
+            breaker.record_failure("timeout")
+        except aiohttp.ClientConnectionError:
+            logger.error("❌ OpenWeatherMap connection error")
+            breaker.record_failure("connection error")
+        except Exception as e:
+            logger.error(f"❌ OpenWeatherMap error: {e}")
+            breaker.record_failure(type(e).__name__)
+        
+        return []
+    
+    def _build_openweathermap_params(self, lat: float, lon: float) -> dict:
+        """Параметри запиту до OpenWeatherMap"""
+        return {
+            'lat': lat,
+            'lon': lon,
+            'appid': self.openweathermap_key,
+            'units': 'metric',
+            'exclude': 'minutely,hourly,daily,alerts'  # Беремо тільки поточні дані
+        }
+    
+    def _process_openweathermap(self, data: dict, api_version: str, lat: float, lon: float) -> List[Dict]:
+        """Обробити відповідь OpenWeatherMap в залежності від версії API"""
+        if api_version == "3.0":
+            return self._process_openweathermap_v3(data, lat, lon)
+        return self._process_openweathermap_v25(data)
+    
     def _process_openweathermap_v3(self, data: dict, lat: float, lon: float) -> List[Dict]:
         """Обробити дані з OpenWeatherMap One Call API 3.0"""
         try:
@@ -487,7 +1108,14 @@ class WeatherAPI:
             else:
                 message += " (висотний вітер - апроксимація)"
             
-            message += f"\n🔄 *Оновлено:* {datetime.now().strftime('%H:%M %d.%m.%Y')}"
+            # Час отримання даних з API (з кешу дані можуть бути старшими за поточний момент)
+            fetched_at = weather_data.get('fetched_at')
+            updated = datetime.fromtimestamp(fetched_at) if fetched_at else datetime.now()
+            message += f"\n🔄 *Оновлено:* {updated.strftime('%H:%M %d.%m.%Y')}"
+            
+            age_minutes = int((datetime.now() - updated).total_seconds() // 60)
+            if age_minutes >= 1:
+                message += f" ({age_minutes} хв тому)"
             
             return message
             
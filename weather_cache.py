@@ -0,0 +1,316 @@
+# weather_cache.py - Кеш прогнозів погоди
+import json
+import time
+import asyncio
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def snap_to_grid(lat: float, lon: float, grid_step: float) -> Tuple[int, int]:
+    """Прив'язати координати до комірки сітки моделі (ціле число кроків)"""
+    return round(lat / grid_step), round(lon / grid_step)
+
+
+# Стан запису кешу
+FRESH = 'fresh'
+STALE = 'stale'
+MISS = 'miss'
+
+
+class DiskCache:
+    """Дисковий рівень кешу: SQLite у режимі WAL
+
+    Зберігає сирі відповіді API разом з часом отримання, тож кеш переживає
+    перезапуск, а кілька процесів бота на одному хості бачать прогріті прогнози
+    один одного. Читання ліниве - запис підтягується в пам'ять при першому зверненні.
+    """
+
+    def __init__(self, path: str, max_entries: int = 5000, max_age: float = 3600, compact_every: int = 100):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.compact_every = compact_every
+        self._writes_since_compact = 0
+        self._lock = threading.Lock()
+
+        self._db = sqlite3.connect(path, timeout=5, check_same_thread=False, isolation_level=None)
+        # auto_vacuum діє лише для нової бази, тому встановлюється до створення таблиці
+        self._db.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS forecasts ("
+            "key TEXT PRIMARY KEY, fetched_at REAL NOT NULL, payload TEXT NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS forecasts_fetched_at ON forecasts (fetched_at)")
+
+        # Лічильники для метрик
+        self.reads = 0
+        self.hits = 0
+        self.writes = 0
+        self.errors = 0
+        self.compactions = 0
+
+        logger.info(f"💾 Disk cache opened: {path}")
+
+    @staticmethod
+    def _encode_key(key: Hashable) -> str:
+        return json.dumps(list(key) if isinstance(key, tuple) else key)
+
+    def get(self, key: Hashable) -> Optional[Tuple[float, Any]]:
+        """Повернути (fetched_at, значення) або None"""
+        try:
+            with self._lock:
+                self.reads += 1
+                row = self._db.execute(
+                    "SELECT fetched_at, payload FROM forecasts WHERE key = ?", (self._encode_key(key),)
+                ).fetchone()
+            if row is None:
+                return None
+            self.hits += 1
+            return row[0], json.loads(row[1])
+        except (sqlite3.Error, ValueError) as e:
+            self.errors += 1
+            logger.warning(f"⚠️ Disk cache read failed: {e}")
+            return None
+
+    def put(self, key: Hashable, value: Any, fetched_at: float):
+        """Зберегти відповідь (новіший запис іншого процесу не перезаписується)"""
+        try:
+            payload = json.dumps(value)
+            with self._lock:
+                self._db.execute(
+                    "INSERT INTO forecasts (key, fetched_at, payload) VALUES (?, ?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET fetched_at = excluded.fetched_at, payload = excluded.payload "
+                    "WHERE excluded.fetched_at > forecasts.fetched_at",
+                    (self._encode_key(key), fetched_at, payload)
+                )
+                self.writes += 1
+                self._writes_since_compact += 1
+                if self._writes_since_compact >= self.compact_every:
+                    self._compact()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            self.errors += 1
+            logger.warning(f"⚠️ Disk cache write failed: {e}")
+
+    def compact(self):
+        """Видалити прострочені записи та обрізати базу до max_entries"""
+        try:
+            with self._lock:
+                self._compact()
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.warning(f"⚠️ Disk cache compaction failed: {e}")
+
+    def _compact(self):
+        self._writes_since_compact = 0
+        self._db.execute("DELETE FROM forecasts WHERE fetched_at < ?", (time.time() - self.max_age,))
+        self._db.execute(
+            "DELETE FROM forecasts WHERE key NOT IN "
+            "(SELECT key FROM forecasts ORDER BY fetched_at DESC LIMIT ?)", (self.max_entries,)
+        )
+        # Повертаємо звільнені сторінки та обрізаємо WAL, щоб файли не росли безмежно
+        self._db.execute("PRAGMA incremental_vacuum")
+        self._db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        self.compactions += 1
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Статистика дискового кешу для /metrics"""
+        try:
+            with self._lock:
+                entries = self._db.execute("SELECT COUNT(*) FROM forecasts").fetchone()[0]
+        except sqlite3.Error:
+            entries = None
+        return {
+            'path': self.path,
+            'entries': entries,
+            'max_entries': self.max_entries,
+            'reads': self.reads,
+            'hits': self.hits,
+            'writes': self.writes,
+            'errors': self.errors,
+            'compactions': self.compactions
+        }
+
+
+class ForecastCache:
+    """LRU-кеш відповідей погодних API з політикою stale-while-revalidate
+
+    Записи молодші за soft_ttl - свіжі. Записи між soft_ttl та hard_ttl
+    віддаються одразу, але мають бути оновлені у фоні. Старші за hard_ttl
+    вважаються відсутніми. Якщо задано disk, промахи та застарілі записи
+    перевіряються також у дисковому кеші.
+    """
+
+    def __init__(self, soft_ttl: float = 600, hard_ttl: float = 3600, max_entries: int = 512,
+                 disk: Optional[DiskCache] = None):
+        self.soft_ttl = soft_ttl
+        self.hard_ttl = max(hard_ttl, soft_ttl)
+        self.max_entries = max_entries
+        self.disk = disk
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Лічильники для метрик
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def lookup(self, key: Hashable, max_stale: Optional[float] = None) -> Tuple[Optional[Any], str]:
+        """Повернути (значення, стан): FRESH, STALE або (None, MISS)
+
+        max_stale дозволяє тимчасово віддавати записи, старші за hard_ttl
+        (наприклад, коли квота запитів до API майже вичерпана).
+        """
+        hard_ttl = max(self.hard_ttl, max_stale or 0)
+        self._load_from_disk(key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None, MISS
+
+            fetched_at, value = entry
+            age = time.time() - fetched_at
+            if age > hard_ttl:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None, MISS
+
+            self._entries.move_to_end(key)
+            if age > self.soft_ttl:
+                self.stale_hits += 1
+                return value, STALE
+
+            self.hits += 1
+            return value, FRESH
+
+    def peek(self, key: Hashable) -> str:
+        """Стан запису без оновлення лічильників та порядку LRU"""
+        self._load_from_disk(key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISS
+            age = time.time() - entry[0]
+            if age > self.hard_ttl:
+                return MISS
+            return STALE if age > self.soft_ttl else FRESH
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Повернути значення з кешу (свіже або застаріле) або None"""
+        return self.lookup(key)[0]
+
+    def put(self, key: Hashable, value: Any, fetched_at: Optional[float] = None):
+        """Зберегти значення, витіснивши найдавніше використані записи"""
+        fetched_at = fetched_at or time.time()
+        self._put_memory(key, value, fetched_at)
+        if self.disk is not None:
+            self.disk.put(key, value, fetched_at)
+
+    def _put_memory(self, key: Hashable, value: Any, fetched_at: float):
+        with self._lock:
+            self._entries[key] = (fetched_at, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _load_from_disk(self, key: Hashable):
+        """Підтягнути запис з диска, якщо в пам'яті його немає або він застарів"""
+        if self.disk is None:
+            return
+
+        with self._lock:
+            entry = self._entries.get(key)
+        # Свіжий запис у пам'яті - диск не читаємо
+        if entry is not None and time.time() - entry[0] <= self.soft_ttl:
+            return
+
+        # Інший процес міг вже оновити цей прогноз
+        stored = self.disk.get(key)
+        if stored is not None and (entry is None or stored[0] > entry[0]):
+            self._put_memory(key, stored[1], stored[0])
+
+    def clear(self):
+        """Очистити кеш"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Статистика кешу для /metrics"""
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            'size': len(self._entries),
+            'max_entries': self.max_entries,
+            'soft_ttl': self.soft_ttl,
+            'hard_ttl': self.hard_ttl,
+            'hits': self.hits,
+            'stale_hits': self.stale_hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'hit_ratio': round((self.hits + self.stale_hits) / lookups, 3) if lookups else 0.0,
+            'disk': self.disk.get_stats() if self.disk is not None else None
+        }
+
+
+class SingleFlight:
+    """Об'єднання одночасних однакових асинхронних запитів в один запит до API"""
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+        # Лічильники для метрик
+        self.calls = 0
+        self.coalesced = 0
+
+    def start(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> asyncio.Future:
+        """Запустити factory() у фоні або повернути вже запущений запит з тим самим ключем"""
+        future = self._inflight.get(key)
+
+        if future is None:
+            self.calls += 1
+            future = asyncio.ensure_future(factory())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.coalesced += 1
+
+        return future
+
+    def join(self, key: Hashable) -> Optional[asyncio.Future]:
+        """Повернути вже запущений запит з цим ключем (або None)"""
+        future = self._inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+        return future
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Виконати factory() або дочекатися вже запущеного запиту з тим самим ключем"""
+        # shield: скасування одного з очікувачів не скасовує спільний запит
+        return await asyncio.shield(self.start(key, factory))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Статистика для /metrics"""
+        return {
+            'in_flight': len(self._inflight),
+            'calls': self.calls,
+            'coalesced': self.coalesced
+        }
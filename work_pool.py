@@ -0,0 +1,135 @@
+# work_pool.py - Обмежений пул потоків для блокуючої та CPU-роботи обробників бота
+import os
+import time
+import asyncio
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutorBusy(Exception):
+    """Черга пулу заповнена - запит відхилено одразу, а не поставлено в чергу без кінця"""
+
+
+class BoundedExecutor:
+    """Пул потоків з обмеженою чергою для синхронних частин асинхронних обробників
+
+    Пошук у базі населених пунктів (включно з очікуванням фонового
+    завантаження), форматування повідомлень і дисковий кеш виконуються тут,
+    а не в event loop, тож повільна операція одного користувача не зупиняє
+    обробку інших оновлень. Якщо в черзі вже max_queue завдань, run одразу
+    кидає ExecutorBusy (зворотний тиск): краще швидко відповісти "спробуйте
+    пізніше", ніж накопичувати запити, на які відповідь уже не потрібна.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue: int, window: int = 1000):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._lock = threading.Lock()
+
+        # Завдання, що чекають на вільний потік, і ті, що виконуються
+        self._queued = 0
+        self._active = 0
+
+        # Лічильники та час очікування/виконання останніх window завдань (мс) для /metrics
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.max_queue_depth = 0
+        self._wait_ms = deque(maxlen=window)
+        self._run_ms = deque(maxlen=window)
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Виконати fn(*args, **kwargs) у пулі й дочекатися результату (ExecutorBusy - черга повна)"""
+        with self._lock:
+            if self._queued >= self.max_queue:
+                self.rejected += 1
+                raise ExecutorBusy(f"{self.name}: {self._queued} tasks queued")
+            self._queued += 1
+            self.submitted += 1
+            self.max_queue_depth = max(self.max_queue_depth, self._queued)
+        enqueued = time.perf_counter()
+
+        def call():
+            started = time.perf_counter()
+            with self._lock:
+                self._queued -= 1
+                self._active += 1
+                self._wait_ms.append((started - enqueued) * 1000)
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException:
+                self._finish(started, ok=False)
+                raise
+            self._finish(started, ok=True)
+            return result
+
+        future = self._executor.submit(call)
+        # Обробник скасовано до початку виконання - завдання так і не вийде з черги саме
+        future.add_done_callback(lambda f: f.cancelled() and self._forget_cancelled())
+        return await asyncio.wrap_future(future)
+
+    def _finish(self, started: float, ok: bool):
+        with self._lock:
+            self._active -= 1
+            self._run_ms.append((time.perf_counter() - started) * 1000)
+            if ok:
+                self.completed += 1
+            else:
+                self.failed += 1
+
+    def _forget_cancelled(self):
+        with self._lock:
+            self._queued -= 1
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queued
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait)
+
+    @staticmethod
+    def _summary(samples) -> Dict[str, float]:
+        if not samples:
+            return {'p50': 0.0, 'p95': 0.0, 'max': 0.0}
+        ordered = sorted(samples)
+        return {
+            'p50': round(ordered[len(ordered) // 2], 2),
+            'p95': round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 2),
+            'max': round(ordered[-1], 2)
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Статистика для /metrics: глибина черги, час очікування та виконання (мс)"""
+        with self._lock:
+            stats = {
+                'workers': self.max_workers,
+                'max_queue': self.max_queue,
+                'queue_depth': self._queued,
+                'max_queue_depth': self.max_queue_depth,
+                'active': self._active,
+                'submitted': self.submitted,
+                'completed': self.completed,
+                'failed': self.failed,
+                'rejected': self.rejected
+            }
+            wait_ms, run_ms = list(self._wait_ms), list(self._run_ms)
+        stats['wait_ms'] = self._summary(wait_ms)
+        stats['run_ms'] = self._summary(run_ms)
+        return stats
+
+
+# Спільний пул обробників бота: WORK_POOL_WORKERS потоків, у черзі не більше WORK_POOL_QUEUE завдань
+work_pool = BoundedExecutor(
+    'bot-work',
+    max_workers=int(os.getenv('WORK_POOL_WORKERS', min(8, (os.cpu_count() or 1) + 4))),
+    max_queue=int(os.getenv('WORK_POOL_QUEUE', 64))
+)